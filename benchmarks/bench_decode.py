@@ -0,0 +1,49 @@
+"""
+Compares decoding 200-item pages with dacite and with the compiled
+decoders, with and without type checks and lazy timestamps
+
+    python -m benchmarks.bench_decode
+"""
+
+import timeit
+from functools import partial
+from typing import Any, Callable, Dict
+
+from dacite import from_dict
+
+from benchmarks import payloads
+from soundcloud.resource.base import BaseData
+from soundcloud.resource.decoder import DecoderConfig, get_decoder
+from soundcloud.resource.playlist import BasicAlbumPlaylist
+from soundcloud.resource.track import Track
+from soundcloud.resource.user import User
+
+PAGES = {
+    "Track": (Track, payloads.page(payloads.track)),
+    "User": (User, payloads.page(payloads.user)),
+    "BasicAlbumPlaylist": (BasicAlbumPlaylist, payloads.page(payloads.playlist)),
+}
+
+
+def main(number: int = 5) -> None:
+    for name, (cls, page) in PAGES.items():
+        items = page["collection"]
+        decoders: Dict[str, Callable[[dict], Any]] = {
+            "dacite": partial(from_dict, cls, config=BaseData.dacite_config),
+            "compiled": get_decoder(cls),
+            "trusted": get_decoder(cls, DecoderConfig(trusted=True)),
+            "lazy": get_decoder(cls, DecoderConfig(lazy_datetimes=True)),
+        }
+        baseline = None
+        for label, decode in decoders.items():
+            seconds = timeit.timeit(lambda: [decode(d) for d in items], number=number)
+            per_page = seconds / number * 1000
+            baseline = baseline or per_page
+            print(
+                f"{name:<20} {label:<10} {per_page:8.2f} ms/page"
+                f"  {baseline / per_page:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
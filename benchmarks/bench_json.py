@@ -0,0 +1,67 @@
+"""
+Compares parsing `/search/tracks` and `/stream` pages with
+`Response.json()` and with the installed JSON backends
+
+    python -m benchmarks.bench_json
+
+The pages recorded in benchmarks/data by `benchmarks.record_pages` are
+parsed if there are any, synthetic pages otherwise.
+"""
+
+import json
+import os
+import timeit
+from functools import partial
+from typing import Any, Callable, Dict, Tuple
+
+from requests.models import Response
+
+from benchmarks import payloads
+from benchmarks.record_pages import DATA
+from soundcloud.json_backend import _BACKENDS
+
+PAGES = {
+    "/search/tracks": ("search_tracks", payloads.track),
+    "/stream": ("stream", payloads.stream_item),
+}
+
+
+def _body(name: str, make: Callable[[int], payloads.Payload]) -> Tuple[bytes, str]:
+    """
+    Returns the recorded page of the given name, or a synthetic one
+    """
+    path = os.path.join(DATA, f"{name}.json")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read(), "recorded"
+    return json.dumps(payloads.page(make)).encode(), "synthetic"
+
+
+def _response(body: bytes) -> Response:
+    r = Response()
+    r._content = body
+    r.encoding = "utf-8"
+    r.status_code = 200
+    return r
+
+
+def main(number: int = 20) -> None:
+    for endpoint, (name, make) in PAGES.items():
+        body, source = _body(name, make)
+        page = json.loads(body)
+        response = _response(body)
+        parsers: Dict[str, Callable[[], Any]] = {"Response.json": response.json}
+        for backend in _BACKENDS.values():
+            parsers[backend.name] = partial(backend.loads, body)
+        print(f"{endpoint} ({len(body) // 1024} KiB, {source})")
+        baseline = None
+        for label, parse in parsers.items():
+            assert parse() == page
+            seconds = timeit.timeit(parse, number=number)
+            per_page = seconds / number * 1000
+            baseline = baseline or per_page
+            print(f"  {label:<14} {per_page:8.2f} ms/page  {baseline / per_page:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
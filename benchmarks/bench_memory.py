@@ -0,0 +1,50 @@
+"""
+Compares the memory taken by decoded resources with the regular and
+the slotted resource classes, with and without string interning
+
+    python -m benchmarks.bench_memory
+"""
+
+import gc
+import json
+import tracemalloc
+from typing import Dict
+
+from benchmarks import payloads
+from soundcloud.resource.decoder import DecoderConfig, get_decoder
+from soundcloud.resource.track import BasicTrack
+from soundcloud.resource.user import BasicUser
+
+COUNT = 10000
+
+CONFIGS: Dict[str, DecoderConfig] = {
+    "dict": DecoderConfig(),
+    "slots": DecoderConfig(slots=True),
+    "slots+intern": DecoderConfig(slots=True, intern_strings=True),
+}
+
+
+def main() -> None:
+    for cls, make in ((BasicTrack, payloads.basic_track), (BasicUser, payloads.user)):
+        text = json.dumps([make(i) for i in range(COUNT)])
+        baseline = None
+        for label, config in CONFIGS.items():
+            decode = get_decoder(cls, config)
+            gc.collect()
+            tracemalloc.start()
+            # measure what is retained once the parsed JSON is freed
+            resources = [decode(d) for d in json.loads(text)]
+            gc.collect()
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del resources
+            per_object = size / COUNT
+            baseline = baseline or per_object
+            print(
+                f"{cls.__name__:<12} {label:<14} {per_object:8.0f} B/object"
+                f"  {baseline / per_object:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
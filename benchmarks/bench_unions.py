@@ -0,0 +1,47 @@
+"""
+Compares decoding mixed 200-item /stream and /search pages by trying
+every union member in order and by picking the member from the payload
+
+    python -m benchmarks.bench_unions
+"""
+
+import timeit
+from typing import Any
+
+from benchmarks import payloads
+from soundcloud.resource.aliases import Like, SearchItem, StreamItem
+from soundcloud.resource.decoder import get_args, get_decoder, get_union_decoder
+
+PAGES = {
+    "get_my_stream": (StreamItem, payloads.page(payloads.stream_item)),
+    "search": (SearchItem, payloads.page(payloads.search_item)),
+    "get_user_likes": (Like, payloads.page(payloads.like)),
+}
+
+
+def decode_in_order(union: Any, d: dict) -> Any:
+    for member in get_args(union):
+        try:
+            return get_decoder(member)(d)
+        except Exception:
+            pass
+    raise ValueError
+
+
+def main(number: int = 5) -> None:
+    for name, (union, page) in PAGES.items():
+        items = page["collection"]
+        decode = get_union_decoder(union)
+        in_order = timeit.timeit(
+            lambda: [decode_in_order(union, d) for d in items], number=number
+        )
+        discriminated = timeit.timeit(lambda: [decode(d) for d in items], number=number)
+        print(
+            f"{name:<16} in order {in_order / number * 1000:8.2f} ms/page"
+            f"  discriminated {discriminated / number * 1000:8.2f} ms/page"
+            f"  {in_order / discriminated:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
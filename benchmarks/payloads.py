@@ -0,0 +1,237 @@
+"""
+Synthetic API payloads shaped like real v2 API responses
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+Payload = Dict[str, Any]
+
+TIMESTAMP = "2021-03-04T05:06:07Z"
+
+
+def basic_user(i: int) -> Payload:
+    return {
+        "avatar_url": f"https://i1.sndcdn.com/avatars-{i}-large.jpg",
+        "first_name": "First",
+        "followers_count": i * 3,
+        "full_name": "First Last",
+        "id": i,
+        "kind": "user",
+        "last_modified": TIMESTAMP,
+        "last_name": "Last",
+        "permalink": f"user-{i}",
+        "permalink_url": f"https://soundcloud.com/user-{i}",
+        "uri": f"https://api.soundcloud.com/users/{i}",
+        "urn": f"soundcloud:users:{i}",
+        "username": f"User {i}",
+        "verified": False,
+        "city": None,
+        "country_code": "US",
+        "badges": {"pro": False, "pro_unlimited": True, "verified": False},
+        "station_urn": f"soundcloud:system-playlists:artist-stations:{i}",
+        "station_permalink": f"artist-stations:{i}",
+    }
+
+
+def visuals(urn: str) -> Payload:
+    return {
+        "urn": urn,
+        "enabled": True,
+        "visuals": [
+            {
+                "urn": "soundcloud:visuals:1",
+                "entry_time": 0,
+                "visual_url": "https://i1.sndcdn.com/visuals-1-original.jpg",
+            }
+        ],
+    }
+
+
+def user(i: int) -> Payload:
+    u = basic_user(i)
+    u.update(
+        {
+            "comments_count": 1,
+            "created_at": TIMESTAMP,
+            "creator_subscriptions": [{"product": {"id": "free"}}],
+            "creator_subscription": {"product": {"id": "free"}},
+            "description": "description",
+            "followings_count": 5,
+            "groups_count": 0,
+            "likes_count": 10,
+            "playlist_likes_count": 1,
+            "playlist_count": 2,
+            "reposts_count": None,
+            "track_count": 7,
+            "visuals": visuals(u["urn"]),
+        }
+    )
+    return u
+
+
+def transcoding(i: int, protocol: str, mime_type: str) -> Payload:
+    return {
+        "url": (
+            f"https://api-v2.soundcloud.com/media/soundcloud:tracks:{i}"
+            f"/00000000-0000-0000-0000-000000000000/stream/{protocol}"
+        ),
+        "preset": "mp3_1_0" if mime_type == "audio/mpeg" else "opus_0_0",
+        "duration": 180000,
+        "snipped": False,
+        "format": {"protocol": protocol, "mime_type": mime_type},
+        "quality": "sq",
+    }
+
+
+def base_item(i: int, kind: str) -> Payload:
+    return {
+        "artwork_url": f"https://i1.sndcdn.com/artworks-{i}-large.jpg",
+        "created_at": TIMESTAMP,
+        "description": None,
+        "duration": 180000,
+        "embeddable_by": "all",
+        "genre": "Electronic",
+        "id": i,
+        "kind": kind,
+        "label_name": None,
+        "last_modified": TIMESTAMP,
+        "licence": "all-rights-reserved",
+        "likes_count": 3,
+        "permalink": f"{kind}-{i}",
+        "permalink_url": f"https://soundcloud.com/user-1/{kind}-{i}",
+        "public": True,
+        "purchase_title": None,
+        "purchase_url": None,
+        "release_date": None,
+        "reposts_count": 0,
+        "secret_token": None,
+        "sharing": "public",
+        "tag_list": '"Wan Bushi" electronic',
+        "title": f"{kind} {i}",
+        "uri": f"https://api.soundcloud.com/{kind}s/{i}",
+        "user_id": 1,
+        "display_date": TIMESTAMP,
+    }
+
+
+def basic_track(i: int, track_user: Optional[Payload] = None) -> Payload:
+    t = base_item(i, "track")
+    t.update(
+        {
+            "caption": None,
+            "commentable": True,
+            "comment_count": 0,
+            "downloadable": False,
+            "download_count": 0,
+            "full_duration": 180000,
+            "has_downloads_left": True,
+            "playback_count": 100,
+            "state": "finished",
+            "streamable": True,
+            "urn": f"soundcloud:tracks:{i}",
+            "visuals": None,
+            "waveform_url": f"https://wave.sndcdn.com/{i}_m.json",
+            "media": {
+                "transcodings": [
+                    transcoding(i, "hls", "audio/mpeg"),
+                    transcoding(i, "progressive", "audio/mpeg"),
+                    transcoding(i, "hls", 'audio/ogg; codecs="opus"'),
+                ]
+            },
+            "station_urn": f"soundcloud:system-playlists:track-stations:{i}",
+            "station_permalink": f"track-stations:{i}",
+            "track_authorization": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9",
+            "monetization_model": "NOT_APPLICABLE",
+            "policy": "ALLOW",
+            "user": track_user or basic_user(1),
+        }
+    )
+    return t
+
+
+def track(i: int) -> Payload:
+    return basic_track(i, user(1))
+
+
+def mini_track(i: int) -> Payload:
+    return {
+        "id": i,
+        "kind": "track",
+        "monetization_model": "NOT_APPLICABLE",
+        "policy": "ALLOW",
+    }
+
+
+def playlist(i: int, playlist_user: Optional[Payload] = None) -> Payload:
+    p = base_item(i, "playlist")
+    p.update(
+        {
+            "managed_by_feeds": False,
+            "set_type": "",
+            "is_album": False,
+            "published_at": TIMESTAMP,
+            "track_count": 3,
+            "tracks": [basic_track(i * 10), mini_track(i * 10 + 1)],
+            "user": playlist_user or basic_user(1),
+        }
+    )
+    return p
+
+
+def playlist_no_tracks(i: int) -> Payload:
+    p = playlist(i)
+    for key in (
+        "tracks",
+        "description",
+        "embeddable_by",
+        "genre",
+        "label_name",
+        "licence",
+        "purchase_title",
+        "purchase_url",
+        "tag_list",
+    ):
+        del p[key]
+    return p
+
+
+def stream_item(i: int) -> Payload:
+    kind = ("track", "track-repost", "playlist", "playlist-repost")[i % 4]
+    item: Payload = {
+        "created_at": TIMESTAMP,
+        "type": kind,
+        "user": basic_user(2),
+        "uuid": f"00000000-0000-0000-0000-{i:012}",
+        "caption": None,
+    }
+    if kind.endswith("repost"):
+        item["reposted"] = None
+    if kind.startswith("track"):
+        item["track"] = basic_track(i)
+    else:
+        item["playlist"] = playlist(i)
+    return item
+
+
+def search_item(i: int) -> Payload:
+    if i % 3 == 0:
+        return user(i)
+    if i % 3 == 1:
+        return track(i)
+    return playlist(i, user(1))
+
+
+def like(i: int) -> Payload:
+    item: Payload = {"created_at": TIMESTAMP, "kind": "like"}
+    if i % 2:
+        item["playlist"] = playlist_no_tracks(i)
+    else:
+        item["track"] = basic_track(i)
+    return item
+
+
+def page(
+    make: Callable[[int], Payload], size: int = 200, next_href: Optional[str] = None
+) -> Payload:
+    items: List[Payload] = [make(i) for i in range(size)]
+    return {"collection": items, "next_href": next_href}
@@ -0,0 +1,69 @@
+"""
+Records `/search/tracks` and `/stream` pages for `bench_json`, with the
+names, descriptions and URLs in them masked
+
+    auth_token=... python -m benchmarks.record_pages
+"""
+
+import json
+import os
+import re
+from typing import Any, Dict, Tuple
+
+from soundcloud import SoundCloud
+from soundcloud.requests import Request
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+PAGES: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "search_tracks": ("/search/tracks", {"q": "house", "limit": 200}),
+    "stream": ("/stream", {"limit": 200}),
+}
+
+# values identifying users, masked but kept at their length, so that
+# the pages take as long to parse as the recorded ones
+PERSONAL_KEYS = frozenset(
+    {
+        "avatar_url",
+        "city",
+        "description",
+        "first_name",
+        "full_name",
+        "last_name",
+        "permalink",
+        "permalink_url",
+        "station_permalink",
+        "username",
+    }
+)
+
+
+def anonymise(value: Any, key: str = "") -> Any:
+    if isinstance(value, dict):
+        return {k: anonymise(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [anonymise(item) for item in value]
+    if key in PERSONAL_KEYS and isinstance(value, str):
+        return re.sub(r"\w", "x", value)
+    return value
+
+
+def main() -> None:
+    client = SoundCloud(auth_token=os.environ.get("auth_token"))
+    os.makedirs(DATA, exist_ok=True)
+    for name, (path, params) in PAGES.items():
+        r = client.session.get(
+            f"{Request.base}{path}",
+            params={**params, "client_id": client.client_id},
+            headers=client._get_headers(True),
+        )
+        r.raise_for_status()
+        page = anonymise(r.json())
+        page["next_href"] = None
+        with open(os.path.join(DATA, f"{name}.json"), "w") as f:
+            json.dump(page, f)
+        print(f"{path}: {len(page['collection'])} items")
+
+
+if __name__ == "__main__":
+    main()
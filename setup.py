@@ -28,7 +28,10 @@ setup(
         "typing_extensions; python_version<'3.8'",
     ],
     extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"],
         "dev": [
+            "aiohttp",
             "coveralls",
             "pytest",
             "pytest-dotenv",
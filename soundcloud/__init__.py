@@ -41,6 +41,213 @@ me = sc.get_user_by_username("7x11x13")
 assert me.permalink == "7x11x13"
 ```
 
+## Async example
+
+`AsyncSoundCloud` has the same methods as `SoundCloud`, but returns
+awaitables and async generators. It requires `aiohttp`
+(`pip install soundcloud-v2[async]`).
+
+```python
+import asyncio
+from soundcloud import AsyncSoundCloud
+
+
+async def main():
+    async with AsyncSoundCloud() as sc:
+        me = await sc.get_user_by_username("7x11x13")
+        async for follower in sc.get_user_followers(me.id):
+            print(follower.username)
+
+
+asyncio.run(main())
+```
+
+## Caching
+
+Pass a cache to the client to reuse responses to repeated GET requests.
+404 responses are cached too, so lookups of deleted resources don't
+hit the network again until `not_found_ttl` expires.
+
+```python
+from soundcloud import SoundCloud, SQLiteCache
+
+cache = SQLiteCache("soundcloud.db", ttl=3600, ttls={"/resolve": 86400}, compress=True)
+sc = SoundCloud(cache=cache)
+```
+
+## Projections
+
+Pass `fields` to the `get_*` and `search_*` methods to only decode
+some fields of the resources, given as dotted paths:
+
+```python
+track = sc.get_track(1032303631, fields=("id", "title", "playback_count", "user.id"))
+print(track.user.id)
+```
+
+## JSON backends
+
+Responses are parsed with `orjson` or `msgspec` if one of them is installed
+(`pip install soundcloud-v2[fast]`), which is a few times faster than the
+standard library on large pages. Choose one with `SoundCloud(json_backend="json")`.
+
+## Retries
+
+Requests failing with 429, 502, 503 or 504 responses, or which fail to
+connect, are retried up to 3 times with exponential backoff and jitter,
+honoring any `Retry-After` header. Pages of collections are retried on 500
+too, so that a transient error doesn't end a collection early. Other
+requests answered with 500 return None, as the API also answers it for some
+missing resources. Configure this with `RetryPolicy`, and check
+`sc.retry_stats` to see how many retries were made.
+
+```python
+from soundcloud import RetryPolicy, SoundCloud
+
+sc = SoundCloud(retry_policy=RetryPolicy(max_retries=5, backoff=1))
+```
+
+## Rate limits
+
+Pass a rate limiter to keep requests under a budget per endpoint family:
+`API_V2` for api-v2.soundcloud.com and `GRAPHQL` for graph.soundcloud.com.
+`SQLiteRateLimiter` shares its budget with every process using the same file.
+
+```python
+from soundcloud import API_V2, Rate, SoundCloud, SQLiteRateLimiter
+
+limiter = SQLiteRateLimiter("limits.db", {API_V2: Rate(10, burst=20)})
+sc = SoundCloud(rate_limiter=limiter)
+```
+
+## Adaptive concurrency
+
+`AdaptiveConcurrency` limits the requests in flight, raising the limit while
+requests succeed quickly and cutting it on 429, 502-504 or rising latency.
+`get_tracks` and collections fetched with `concurrency` then run as many
+requests at once as the server handles well. Downloads from the CDN are not
+limited by it, as their `workers` and `read_ahead` bound them instead.
+
+```python
+from soundcloud import AdaptiveConcurrency, SoundCloud
+
+limiter = AdaptiveConcurrency(max_limit=16)
+sc = SoundCloud(concurrency_limiter=limiter)
+tracks = sc.get_tracks(track_ids)
+print(limiter.limit)
+```
+
+## Client IDs
+
+Clients created without a client ID generate one from soundcloud.com, and
+generate a new one if SoundCloud revokes it. A `ClientIDCache` stores the
+generated ID in a file for a TTL, so that short-lived processes reuse it
+instead of generating their own.
+
+```python
+from soundcloud import ClientIDCache, SoundCloud
+
+sc = SoundCloud(client_id_cache=ClientIDCache("client_id.json"))
+```
+
+## Shared contexts
+
+A `ClientContext` holds the connection pools, response cache, client ID
+and limits, and can be shared by many clients, e.g. one client per user of
+a web service. Such clients are cheap to create and reuse warm connections.
+Responses to unauthenticated requests are cached for all of them, while
+responses to authenticated requests are cached per auth token.
+
+```python
+from soundcloud import ClientContext, MemoryCache, SoundCloud
+
+context = ClientContext(cache=MemoryCache(), pool_maxsize=100)
+sc = SoundCloud(auth_token=user_token, context=context)
+```
+
+## Resumable pagination
+
+Collections are returned as paginators, whose `cursor` tells where the
+collection continues from. A cursor can be stored with `to_dict` and passed
+back as `cursor` to continue the collection later. Given a `CursorJournal`,
+the cursor is checkpointed to a file after each page, and an interrupted
+crawl continues from its last checkpoint. Call `checkpoint()` after handling
+each resource to not handle the resources of the current page again.
+
+```python
+from soundcloud import CursorJournal, SoundCloud
+
+sc = SoundCloud()
+journal = CursorJournal("followers.json")
+for follower in sc.get_user_followers(992430331, journal=journal):
+    ...
+```
+
+## Crawls
+
+A `Crawler` expands users and tracks into their followers, followings,
+related artists, likers or related tracks with a pool of threads, up to a
+depth and number of nodes. Edges are written to a sink, e.g. a `CSVSink`.
+The frontier of a `MemoryFrontier` remembers visited nodes in an `IntSet`,
+or a `BloomFilter` for very large crawls, and is checkpointed to a file to
+resume from. An `SQLiteFrontier` can be shared by several processes.
+
+```python
+from soundcloud import Crawler, CSVSink, SoundCloud, SQLiteFrontier
+
+crawler = Crawler(
+    SoundCloud(),
+    relations=("followers", "following"),
+    frontier=SQLiteFrontier("crawl.db"),
+    sink=CSVSink("edges.csv"),
+    max_depth=2,
+)
+stats = crawler.run([("user", 992430331)])
+```
+
+## Batch resolve
+
+`resolve_many` returns the kind and ID of the resources at many URLs, in
+order. URLs are normalized and deduplicated, and resolved concurrently.
+Given a `PermalinkIndex`, the client stores the permalink URL of every
+user, track and playlist it decodes, and URLs found there aren't resolved.
+
+```python
+from soundcloud import PermalinkIndex, SoundCloud
+
+sc = SoundCloud(permalink_index=PermalinkIndex("permalinks.db"))
+kind, id = sc.resolve_many(["https://soundcloud.com/forss/flickermood"])[0]
+```
+
+## Downloads
+
+`download_track` downloads the audio of a track in the transcoding
+`select_transcoding` prefers, or in the given one. Segments of HLS
+transcodings, and byte ranges of progressive ones, are downloaded in
+parallel into a `.part` file. An interrupted download resumes with the
+parts it misses, and the file is checked before it is moved in place.
+Requests to the CDN use the `"media"` rate limit family.
+
+```python
+from soundcloud import SoundCloud, select_transcoding
+
+sc = SoundCloud()
+track = sc.get_track(1032303631)
+transcoding = select_transcoding(track, protocols=("hls",), qualities=("hq", "sq"))
+result = sc.download_track(track, "track.mp3", transcoding=transcoding, workers=8)
+```
+
+`stream_track_audio` yields the audio in order instead, e.g. to pipe it
+into another process, segment after segment or byte range after byte
+range. It downloads up to `read_ahead` parts ahead of the one consumed,
+so no more than `read_ahead + 1` parts are held in memory however long the
+track is.
+
+```python
+for chunk in sc.stream_track_audio(track, read_ahead=4):
+    ffmpeg.stdin.write(chunk)
+```
+
 ## Notes on `auth_token`
 Some methods require authentication in the form of an OAuth2 access token.
 You can find your token in your browser cookies for SoundCloud under the name "oauth_token".
@@ -57,13 +264,53 @@ argument.
 
 """
 
+from soundcloud.async_soundcloud import *
+from soundcloud.async_soundcloud import __all__ as async_all
+from soundcloud.cache import *
+from soundcloud.cache import __all__ as cache_all
+from soundcloud.client_id import *
+from soundcloud.client_id import __all__ as client_id_all
+from soundcloud.concurrency import *
+from soundcloud.concurrency import __all__ as concurrency_all
+from soundcloud.context import *
+from soundcloud.context import __all__ as context_all
+from soundcloud.crawl import *
+from soundcloud.crawl import __all__ as crawl_all
+from soundcloud.download import *
+from soundcloud.download import __all__ as download_all
 from soundcloud.exceptions import *
 from soundcloud.exceptions import __all__ as ex_all
+from soundcloud.json_backend import *
+from soundcloud.json_backend import __all__ as json_all
+from soundcloud.pagination import *
+from soundcloud.pagination import __all__ as pagination_all
+from soundcloud.permalink import *
+from soundcloud.permalink import __all__ as permalink_all
+from soundcloud.rate_limit import *
+from soundcloud.rate_limit import __all__ as rate_limit_all
 from soundcloud.resource import *
 from soundcloud.resource import __all__ as res_all
+from soundcloud.retry import *
+from soundcloud.retry import __all__ as retry_all
 from soundcloud.soundcloud import *
 from soundcloud.soundcloud import __all__ as sc_all
 
 __version__ = "1.6.1"
 
-__all__ = sc_all + ex_all + res_all
+__all__ = (
+    sc_all
+    + async_all
+    + cache_all
+    + client_id_all
+    + concurrency_all
+    + context_all
+    + crawl_all
+    + download_all
+    + ex_all
+    + json_all
+    + pagination_all
+    + permalink_all
+    + rate_limit_all
+    + res_all
+    + retry_all
+)
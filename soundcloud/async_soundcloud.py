@@ -0,0 +1,857 @@
+import asyncio
+import sys
+from typing import (
+    AsyncGenerator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
+
+if sys.version_info < (3, 8):
+    from typing_extensions import Literal
+else:
+    from typing import Literal
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore[assignment]
+
+from soundcloud.cache import Cache
+from soundcloud.client_id import ClientIDCache, _ClientIDScanner
+from soundcloud.concurrency import AdaptiveConcurrency
+from soundcloud.context import ClientContext
+from soundcloud.download import (
+    DownloadResult,
+    _download_async,
+    _resolve_transcoding,
+    _stream_async,
+    _stream_url_async,
+)
+from soundcloud.exceptions import ClientIDGenerationError, DownloadError
+from soundcloud.json_backend import JSONBackend
+from soundcloud.permalink import Permalink, PermalinkIndex
+from soundcloud.rate_limit import RateLimiter
+from soundcloud.requests import (
+    DeletePlaylistRequest,
+    MeHistoryRequest,
+    MeRequest,
+    MeStreamRequest,
+    PlaylistLikersRequest,
+    PlaylistRepostersRequest,
+    PlaylistRequest,
+    PostPlaylistRequest,
+    ResolveRequest,
+    SearchAlbumsRequest,
+    SearchPlaylistsRequest,
+    SearchRequest,
+    SearchTracksRequest,
+    SearchUsersRequest,
+    TagRecentTracksRequest,
+    TrackAlbumsRequest,
+    TrackCommentsRequest,
+    TrackLikersRequest,
+    TrackOriginalDownloadRequest,
+    TrackPlaylistsRequest,
+    TrackRelatedRequest,
+    TrackRepostersRequest,
+    TrackRequest,
+    TracksRequest,
+    UserAlbumsRequest,
+    UserCommentsRequest,
+    UserConversationMessagesRequest,
+    UserConversationsRequest,
+    UserConversationsUnreadRequest,
+    UserEmailsRequest,
+    UserFeaturedProfilesRequest,
+    UserFollowersRequest,
+    UserFollowingsRequest,
+    UserInteractionsRequest,
+    UserLikesRequest,
+    UserPlaylistsRequest,
+    UserRelatedArtistsRequest,
+    UserRepostsRequest,
+    UserRequest,
+    UserStreamRequest,
+    UserToptracksRequest,
+    UserTracksRequest,
+    UserWebProfilesRequest,
+    _check_client_id_async,
+)
+from soundcloud.retry import RetryPolicy
+from soundcloud.soundcloud import TrackList, _SoundCloudBase
+
+from .resource.aliases import Like, RepostItem, SearchItem, StreamItem
+from .resource.comment import BasicComment, Comment
+from .resource.conversation import Conversation
+from .resource.decoder import DecoderConfig, IdentityMap
+from .resource.graphql import CommentWithInteractions
+from .resource.history import HistoryItem
+from .resource.message import Message
+from .resource.playlist import AlbumPlaylist, BasicAlbumPlaylist
+from .resource.response import NoContentResponse
+from .resource.track import BaseTrack, BasicTrack, Track, Transcoding
+from .resource.user import User, UserEmail
+from .resource.web_profile import WebProfile
+
+
+T = TypeVar("T")
+
+
+async def _chunks(
+    iterable: AsyncGenerator[T, None], size: int
+) -> AsyncGenerator[List[T], None]:
+    chunk: List[T] = []
+    async for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class AsyncSoundCloud(_SoundCloudBase):
+    """
+    asyncio SoundCloud v2 API client. Requires `aiohttp`.
+
+    Has the same methods as `soundcloud.SoundCloud`, except
+    single resources are returned as awaitables and
+    paginated resources as async generators.
+    """
+
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        auth_token: Optional[str] = None,
+        user_agent: str = _SoundCloudBase._DEFAULT_USER_AGENT,
+        session: Optional["aiohttp.ClientSession"] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        decoder_config: Optional[DecoderConfig] = None,
+        cache: Optional[Cache] = None,
+        identity_map: Optional[IdentityMap] = None,
+        json_backend: Union[str, JSONBackend, None] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrency] = None,
+        client_id_cache: Optional[ClientIDCache] = None,
+        permalink_index: Optional[PermalinkIndex] = None,
+        context: Optional[ClientContext] = None,
+    ) -> None:
+        """
+        Args:
+            client_id: SoundCloud client ID. Generated on the first
+                request if not given, and generated again if
+                SoundCloud revokes it.
+            auth_token: SoundCloud auth token. Only needed for some requests.
+            user_agent: User-Agent header sent with every request.
+            session: Session to send requests with. If given, the pool
+                options below are ignored and the session is not closed
+                by `close`.
+            pool_connections: Number of hosts connections are kept to.
+            pool_maxsize: Maximum number of connections kept per host.
+                At most pool_connections * pool_maxsize connections are
+                opened in all.
+            keep_alive: Whether to reuse connections between requests.
+            decoder_config: Options used to decode responses into resources.
+            cache: Cache for responses to GET requests, e.g. `MemoryCache()`.
+            identity_map: Identity map sharing decoded resources with the
+                same urn between responses.
+            json_backend: JSON backend parsing responses: "orjson",
+                "msgspec" or "json". The fastest one installed if not given.
+            retry_policy: How requests failing with transient errors are
+                retried. Use `RetryPolicy(max_retries=0)` to never retry.
+            rate_limiter: Rate limiter every request waits for, e.g.
+                `SQLiteRateLimiter` to share a budget between processes.
+            concurrency_limiter: Limit on the requests in flight, adjusted
+                to how well the server copes, e.g. `AdaptiveConcurrency()`.
+            client_id_cache: File to store generated client IDs in, so
+                that clients in other processes reuse them.
+            permalink_index: Index filled with the permalink URLs of
+                decoded resources, which `resolve_many` looks URLs up in.
+            context: Connection pools, cache, client ID and limits to
+                share with other clients, e.g. one client per auth token.
+                If given, the arguments above other than auth_token,
+                user_agent, decoder_config and identity_map are ignored.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncSoundCloud requires aiohttp to be installed")
+        super().__init__(
+            context,
+            auth_token,
+            user_agent,
+            decoder_config,
+            identity_map,
+            client_id=client_id,
+            async_session=session,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            cache=cache,
+            json_backend=json_backend,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            client_id_cache=client_id_cache,
+            permalink_index=permalink_index,
+        )
+
+    @property
+    def session(self) -> Optional["aiohttp.ClientSession"]:
+        """HTTP session used for all requests made by this client.
+        Created on the first request if not given."""
+        return self.context._async_session
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        Returns the client's session, creating it and
+        generating a client ID if needed
+        """
+        session = self.context.async_session
+        if not self.client_id:
+            async with self.context._get_async_client_id_lock():
+                if not self.client_id:
+                    self.client_id = await self._new_client_id(None)
+        return session
+
+    async def close(self) -> None:
+        """
+        Closes the client's session, unless it was passed in by the
+        caller or belongs to a context shared with other clients
+        """
+        if self._owns_context:
+            await self.context.close_async()
+
+    async def __aenter__(self) -> "AsyncSoundCloud":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @classmethod
+    async def generate_client_id(
+        cls, session: Optional["aiohttp.ClientSession"] = None
+    ) -> str:
+        """Generates a SoundCloud client ID
+
+        Asset scripts of soundcloud.com are searched concurrently,
+        and the search stops once one of them has the client ID.
+
+        Args:
+            session: Session to send requests with. Defaults to a new session.
+
+        Raises:
+            ClientIDGenerationError: Client ID could not be generated.
+
+        Returns:
+            str: Valid client ID
+        """
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                return await cls.generate_client_id(session)
+        async with session.get("https://soundcloud.com") as r:
+            r.raise_for_status()
+            urls = cls._ASSETS_SCRIPTS_REGEX.findall(await r.text())
+        if not urls:
+            raise ClientIDGenerationError("No asset scripts found")
+        return await cls._search_scripts(session, urls)
+
+    @classmethod
+    async def _search_scripts(
+        cls, session: "aiohttp.ClientSession", urls: List[str]
+    ) -> str:
+        async def search(url: str) -> Optional[str]:
+            async with session.get(url) as r:
+                r.raise_for_status()
+                scanner = _ClientIDScanner()
+                async for chunk in r.content.iter_chunked(cls._SCRIPT_CHUNK_SIZE):
+                    client_id = scanner.feed(chunk)
+                    if client_id:
+                        return client_id
+            return None
+
+        tasks = [asyncio.ensure_future(search(url)) for url in urls]
+        error: Optional[BaseException] = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    client_id = await next_done
+                except aiohttp.ClientError as e:
+                    error = e
+                    continue
+                if client_id:
+                    return client_id
+        finally:
+            # stop searching the other scripts
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        raise ClientIDGenerationError(
+            "Could not find client_id in asset scripts"
+        ) from error
+
+    async def _new_client_id(self, stale: Optional[str]) -> str:
+        """
+        Returns a client ID from the client ID cache, or generates one
+        """
+        client_id = self._cached_client_id(stale)
+        if client_id is None:
+            client_id = await self.generate_client_id(self.session)
+            self._store_client_id(client_id)
+        return client_id
+
+    async def _renew_client_id(self, stale: str) -> bool:
+        """
+        Async version of `soundcloud.SoundCloud._renew_client_id`
+        """
+        if not self.context._client_id_generated:
+            return False
+        async with self.context._get_async_client_id_lock():
+            if self.client_id != stale:
+                # renewed by another task meanwhile
+                return True
+            if await self.is_client_id_valid():
+                # the auth token or the resource is the problem
+                return False
+            self.client_id = await self._new_client_id(stale)
+            return self.client_id != stale
+
+    async def is_client_id_valid(self) -> bool:
+        """
+        Checks if current client_id is valid.
+        The result is reused for a few minutes.
+        """
+        await self._get_session()  # generates the client ID if needed
+        client_id = self.client_id
+        valid = self._checked_client_id(client_id)
+        if valid is None:
+            valid = await _check_client_id_async(self, client_id)
+            self._record_client_id_check(client_id, valid)
+        return valid
+
+    async def is_auth_token_valid(self) -> bool:
+        """
+        Checks if current auth_token is valid
+        """
+        try:
+            await MeRequest.call_async(self)
+            return True
+        except aiohttp.ClientResponseError as err:
+            if err.status == 401:
+                return False
+            else:
+                raise
+
+    async def get_me(self, fields: Optional[Sequence[str]] = None) -> Optional[User]:
+        """
+        Gets the user associated with client's auth token
+        Only the given fields are decoded if fields is given.
+        """
+        return await MeRequest.call_async(self, fields=fields)
+
+    def get_my_history(self, **kwargs) -> AsyncGenerator[HistoryItem, None]:
+        """
+        Returns the stream of recently listened tracks
+        for the client's auth token
+        """
+        return MeHistoryRequest.iter_async(self, **kwargs)
+
+    def get_my_stream(self, **kwargs) -> AsyncGenerator[StreamItem, None]:
+        """
+        Returns the stream of recent uploads/reposts
+        for the client's auth token
+        """
+        return MeStreamRequest.iter_async(self, **kwargs)
+
+    async def resolve(
+        self, url: str, fields: Optional[Sequence[str]] = None
+    ) -> Optional[SearchItem]:
+        """
+        Returns the resource at the given URL if it
+        exists, otherwise return None.
+        Only the given fields are decoded if fields is given.
+        """
+        return await ResolveRequest.call_async(self, url=url, fields=fields)
+
+    async def resolve_many(
+        self, urls: Iterable[str], max_workers: Optional[int] = None
+    ) -> List[Optional[Permalink]]:
+        """
+        Returns the kind and ID of the resources at the given URLs, in
+        the same order, or None for URLs of resources which don't exist.
+
+        URLs are normalized and deduplicated. URLs in the client's
+        permalink index are looked up there, and the others are resolved
+        with up to max_workers requests at once, see `get_tracks`.
+        """
+        normalized, known = self._known_permalinks(urls)
+        missing = [url for url in dict.fromkeys(normalized) if url not in known]
+        semaphore = asyncio.Semaphore(max(self._max_workers(max_workers), 1))
+
+        async def resolve(url: str) -> Optional[Permalink]:
+            async with semaphore:
+                resource = await self.resolve(url, self._PERMALINK_FIELDS)
+            return self._resolved_permalink(url, resource)
+
+        known.update(zip(missing, await asyncio.gather(*map(resolve, missing))))
+        if self.permalink_index is not None:
+            self.permalink_index.flush()
+        return [known[url] for url in normalized]
+
+    def search(self, query: str, **kwargs) -> AsyncGenerator[SearchItem, None]:
+        """
+        Search for users, tracks, and playlists
+        """
+        return SearchRequest.iter_async(self, q=query, **kwargs)
+
+    def search_albums(
+        self, query: str, **kwargs
+    ) -> AsyncGenerator[AlbumPlaylist, None]:
+        """
+        Search for albums (not playlists)
+        """
+        return SearchAlbumsRequest.iter_async(self, q=query, **kwargs)
+
+    def search_playlists(
+        self, query: str, **kwargs
+    ) -> AsyncGenerator[AlbumPlaylist, None]:
+        """
+        Search for playlists
+        """
+        return SearchPlaylistsRequest.iter_async(self, q=query, **kwargs)
+
+    def search_tracks(self, query: str, **kwargs) -> AsyncGenerator[Track, None]:
+        """
+        Search for tracks
+        """
+        return SearchTracksRequest.iter_async(self, q=query, **kwargs)
+
+    def search_users(self, query: str, **kwargs) -> AsyncGenerator[User, None]:
+        """
+        Search for users
+        """
+        return SearchUsersRequest.iter_async(self, q=query, **kwargs)
+
+    def get_tag_tracks_recent(self, tag: str, **kwargs) -> AsyncGenerator[Track, None]:
+        """
+        Get most recent tracks for this tag
+        """
+        return TagRecentTracksRequest.iter_async(self, tag=tag, **kwargs)
+
+    async def get_playlist(
+        self, playlist_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[BasicAlbumPlaylist]:
+        """
+        Returns the playlist with the given playlist_id.
+        If the ID is invalid, return None.
+        Only the given fields are decoded if fields is given.
+        """
+        return await PlaylistRequest.call_async(
+            self, playlist_id=playlist_id, fields=fields
+        )
+
+    async def post_playlist(
+        self, sharing: Literal["private", "public"], title: str, tracks: List[int]
+    ) -> Optional[BasicAlbumPlaylist]:
+        """
+        Create a new playlist
+        """
+        body = {"playlist": {"sharing": sharing, "title": title, "tracks": tracks}}
+        return await PostPlaylistRequest.call_async(self, body=body)
+
+    async def delete_playlist(self, playlist_id: int) -> Optional[NoContentResponse]:
+        """
+        Delete a playlist
+        """
+        return await DeletePlaylistRequest.call_async(self, playlist_id=playlist_id)
+
+    def get_playlist_likers(
+        self, playlist_id: int, **kwargs
+    ) -> AsyncGenerator[User, None]:
+        """
+        Get people who liked this playlist
+        """
+        return PlaylistLikersRequest.iter_async(self, playlist_id=playlist_id, **kwargs)
+
+    def get_playlist_reposters(
+        self, playlist_id: int, **kwargs
+    ) -> AsyncGenerator[User, None]:
+        """
+        Get people who reposted this playlist
+        """
+        return PlaylistRepostersRequest.iter_async(
+            self, playlist_id=playlist_id, **kwargs
+        )
+
+    async def get_track(
+        self, track_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[BasicTrack]:
+        """
+        Returns the track with the given track_id.
+        If the ID is invalid, return None.
+        Only the given fields are decoded if fields is given.
+        """
+        return await TrackRequest.call_async(self, track_id=track_id, fields=fields)
+
+    async def get_tracks(
+        self,
+        track_ids: List[int],
+        playlistId: Optional[int] = None,
+        playlistSecretToken: Optional[str] = None,
+        chunk_size: int = 50,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> TrackList:
+        """
+        Returns the tracks with the given track_ids, in the same order.
+        Can be used to get track info for hidden tracks in a hidden playlist.
+
+        Duplicate IDs are removed, and the IDs are requested in chunks of
+        chunk_size, with up to max_workers chunks requested concurrently.
+        max_workers defaults to 4, or to the largest limit of the client's
+        concurrency limiter, which then decides how many are in flight.
+        IDs of tracks which were not returned are listed in
+        `TrackList.missing_ids`.
+        """
+        params = self._tracks_params(playlistId, playlistSecretToken, kwargs)
+        chunks = self._track_id_chunks(track_ids, chunk_size)
+        semaphore = asyncio.Semaphore(max(self._max_workers(max_workers), 1))
+
+        async def get_chunk(chunk: List[int]) -> List[BasicTrack]:
+            async with semaphore:
+                return await TracksRequest.call_async(
+                    self, ids=",".join(map(str, chunk)), **params
+                )
+
+        results = await asyncio.gather(*map(get_chunk, chunks))
+        return self._ordered_tracks(chunks, results)
+
+    def get_track_albums(
+        self, track_id: int, **kwargs
+    ) -> AsyncGenerator[BasicAlbumPlaylist, None]:
+        """
+        Get albums that this track is in
+        """
+        return TrackAlbumsRequest.iter_async(self, track_id=track_id, **kwargs)
+
+    def get_track_playlists(
+        self, track_id: int, **kwargs
+    ) -> AsyncGenerator[BasicAlbumPlaylist, None]:
+        """
+        Get playlists that this track is in
+        """
+        return TrackPlaylistsRequest.iter_async(self, track_id=track_id, **kwargs)
+
+    def get_track_comments(
+        self, track_id: int, threaded: int = 0, **kwargs
+    ) -> AsyncGenerator[BasicComment, None]:
+        """
+        Get comments on this track
+        """
+        return TrackCommentsRequest.iter_async(
+            self, track_id=track_id, threaded=threaded, **kwargs
+        )
+
+    async def get_track_comments_with_interactions(
+        self, track_id: int, threaded: int = 0, **kwargs
+    ) -> AsyncGenerator[CommentWithInteractions, None]:
+        """
+        Get comments on this track with interaction data. Requires authentication.
+        """
+        track = await self.get_track(track_id)
+        if not track:
+            return
+        comments = self.get_track_comments(track_id, threaded, **kwargs)
+        async for chunk in _chunks(comments, 10):
+            result = await UserInteractionsRequest.call_async(
+                self, self._comment_interactions_query(track, chunk)
+            )
+            if not result:
+                return
+            for comment_with_interactions in self._with_interactions(chunk, result):
+                yield comment_with_interactions
+
+    def get_track_likers(self, track_id: int, **kwargs) -> AsyncGenerator[User, None]:
+        """
+        Get users who liked this track
+        """
+        return TrackLikersRequest.iter_async(self, track_id=track_id, **kwargs)
+
+    def get_track_related(
+        self, track_id: int, **kwargs
+    ) -> AsyncGenerator[BasicTrack, None]:
+        """
+        Get related tracks
+        """
+        return TrackRelatedRequest.iter_async(self, track_id=track_id, **kwargs)
+
+    def get_track_reposters(
+        self, track_id: int, **kwargs
+    ) -> AsyncGenerator[User, None]:
+        """
+        Get users who reposted this track
+        """
+        return TrackRepostersRequest.iter_async(self, track_id=track_id, **kwargs)
+
+    async def get_track_original_download(
+        self, track_id: int, token: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get track original download link. If track is private,
+        requires secret token to be provided (last part of secret URL).
+        Requires authentication.
+        """
+        if token is not None:
+            download = await TrackOriginalDownloadRequest.call_async(
+                self, track_id=track_id, secret_token=token
+            )
+        else:
+            download = await TrackOriginalDownloadRequest.call_async(
+                self, track_id=track_id
+            )
+        if download is None:
+            return None
+        else:
+            return download.redirectUri
+
+    async def _download_target(self, track: Union[int, BaseTrack]) -> BaseTrack:
+        if not isinstance(track, int):
+            return track
+        resource = await self.get_track(track)
+        if resource is None:
+            raise DownloadError(f"Track {track} not found")
+        return resource
+
+    async def get_stream_url(
+        self, track: Union[int, BaseTrack], transcoding: Optional[Transcoding] = None
+    ) -> Optional[str]:
+        """
+        Returns the signed URL of the audio of a track in the given
+        transcoding, or in the one `select_transcoding` prefers.
+        Returns None if the track can't be streamed.
+
+        Raises:
+            DownloadError: The track doesn't exist or
+                has no downloadable transcoding
+        """
+        resource = await self._download_target(track)
+        return await _stream_url_async(
+            self, resource, _resolve_transcoding(resource, transcoding)
+        )
+
+    async def download_track(
+        self,
+        track: Union[int, BaseTrack],
+        path: str,
+        transcoding: Optional[Transcoding] = None,
+        workers: int = 8,
+        part_size: int = 1 << 20,
+        resume: bool = True,
+        verify: bool = True,
+    ) -> DownloadResult:
+        """
+        Downloads the audio of a track to a file, see
+        `SoundCloud.download_track`. Parts are downloaded by up
+        to workers tasks at once.
+        """
+        return await _download_async(
+            self,
+            await self._download_target(track),
+            path,
+            transcoding,
+            workers,
+            part_size,
+            resume,
+            verify,
+        )
+
+    async def stream_track_audio(
+        self,
+        track: Union[int, BaseTrack],
+        transcoding: Optional[Transcoding] = None,
+        read_ahead: int = 4,
+        part_size: int = 1 << 20,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Yields the audio of a track in order, see
+        `SoundCloud.stream_track_audio`
+        """
+        chunks = _stream_async(
+            self, await self._download_target(track), transcoding, read_ahead, part_size
+        )
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    async def get_user(
+        self, user_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[User]:
+        """
+        Returns the user with the given user_id.
+        If the ID is invalid, return None.
+        Only the given fields are decoded if fields is given.
+        """
+        return await UserRequest.call_async(self, user_id=user_id, fields=fields)
+
+    async def get_user_by_username(
+        self, username: str, fields: Optional[Sequence[str]] = None
+    ) -> Optional[User]:
+        """
+        Returns the user with the given username.
+        If the username is invalid, return None.
+        Only the given fields are decoded if fields is given.
+        """
+        if fields and "kind" not in fields:
+            fields = ("kind", *fields)
+        resource = await self.resolve(f"https://soundcloud.com/{username}", fields)
+        # not an isinstance check, as the client may decode into views
+        if resource and self._field(resource, "kind") == "user":
+            return cast(User, resource)
+        else:
+            return None
+
+    def get_user_comments(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[Comment, None]:
+        """
+        Get comments by this user
+        """
+        return UserCommentsRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_conversation_messages(
+        self, user_id: int, conversation_id: int, **kwargs
+    ) -> AsyncGenerator[Message, None]:
+        """
+        Get messages in this conversation
+        """
+        return UserConversationMessagesRequest.iter_async(
+            self, user_id=user_id, conversation_id=conversation_id, **kwargs
+        )
+
+    def get_conversations(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[Conversation, None]:
+        """
+        Get conversations including this user
+        """
+        return UserConversationsRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_unread_conversations(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[Conversation, None]:
+        """
+        Get conversations unread by this user
+        """
+        return UserConversationsUnreadRequest.iter_async(
+            self, user_id=user_id, **kwargs
+        )
+
+    def get_user_emails(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[UserEmail, None]:
+        """
+        Get user's email addresses. Requires authentication.
+        """
+        return UserEmailsRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_featured_profiles(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[User, None]:
+        """
+        Get profiles featured by this user
+        """
+        return UserFeaturedProfilesRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_followers(self, user_id: int, **kwargs) -> AsyncGenerator[User, None]:
+        """
+        Get user's followers
+        """
+        return UserFollowersRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_following(self, user_id: int, **kwargs) -> AsyncGenerator[User, None]:
+        """
+        Get users this user is following
+        """
+        return UserFollowingsRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_likes(self, user_id: int, **kwargs) -> AsyncGenerator[Like, None]:
+        """
+        Get likes by this user
+        """
+        return UserLikesRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_related_artists(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[User, None]:
+        """
+        Get artists related to this user
+        """
+        return UserRelatedArtistsRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_reposts(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[RepostItem, None]:
+        """
+        Get reposts by this user
+        """
+        return UserRepostsRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_stream(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[StreamItem, None]:
+        """
+        Returns generator of track uploaded by given user and
+        reposts by this user
+        """
+        return UserStreamRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_tracks(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[BasicTrack, None]:
+        """
+        Get tracks uploaded by this user
+        """
+        return UserTracksRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_popular_tracks(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[BasicTrack, None]:
+        """
+        Get popular tracks uploaded by this user
+        """
+        return UserToptracksRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_albums(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[BasicAlbumPlaylist, None]:
+        """
+        Get albums uploaded by this user
+        """
+        return UserAlbumsRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    def get_user_playlists(
+        self, user_id: int, **kwargs
+    ) -> AsyncGenerator[BasicAlbumPlaylist, None]:
+        """
+        Get playlists uploaded by this user
+        """
+        return UserPlaylistsRequest.iter_async(self, user_id=user_id, **kwargs)
+
+    async def get_user_links(self, user_urn: str, **kwargs) -> List[WebProfile]:
+        """
+        Get links in this user's description
+        """
+        return await UserWebProfilesRequest.call_async(
+            self, user_urn=user_urn, **kwargs
+        )
+
+
+__all__ = ["AsyncSoundCloud"]
@@ -0,0 +1,325 @@
+"""
+Caches for API responses.
+
+A cache stores the raw body of successful GET responses, plus 404s,
+for a TTL chosen per endpoint. Once an entry expires, the client
+revalidates it with its ETag or Last-Modified value if the server sent
+one, and keeps using the stored body while the server answers 304.
+"""
+
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple
+
+__all__ = ["Cache", "CachedResponse", "MemoryCache", "SQLiteCache"]
+
+
+@dataclass
+class CachedResponse:
+    """
+    Response stored in a cache
+    """
+
+    status: int
+    body: bytes
+    expires: float
+    """Time after which the response must be revalidated, as a UNIX timestamp"""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires
+
+    @property
+    def revalidatable(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+
+class Cache(ABC):
+    """
+    Base class of response caches
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        ttls: Optional[Dict[str, float]] = None,
+        not_found_ttl: float = 3600,
+        max_bytes: int = 64 * 1024 * 1024,
+        compress: bool = False,
+    ) -> None:
+        """
+        Args:
+            ttl: Seconds responses are used without revalidation.
+            ttls: TTLs overriding ttl for some endpoints, keyed by
+                their path template, e.g. `"/tracks/{track_id}"`.
+                A TTL of 0 disables caching for the endpoint. `"/me"`
+                isn't cached unless given here, so that checking the
+                auth token always asks the server.
+            not_found_ttl: Seconds 404 responses are cached for.
+                0 disables caching them.
+            max_bytes: Size of stored responses above which the
+                least recently used ones are evicted.
+            compress: Whether to compress stored responses.
+        """
+        self.ttl = ttl
+        self.ttls = {"/me": 0.0, **(ttls or {})}
+        self.not_found_ttl = not_found_ttl
+        self.max_bytes = max_bytes
+        self.compress = compress
+
+    def ttl_for(self, endpoint: str, status: int) -> float:
+        """
+        Returns the number of seconds to cache a response to
+        the given endpoint with the given status for
+        """
+        if status == 404:
+            return self.not_found_ttl
+        return self.ttls.get(endpoint, self.ttl)
+
+    def response(
+        self, endpoint: str, status: int, body: bytes, headers: Mapping[str, str]
+    ) -> CachedResponse:
+        """
+        Creates the entry to cache for a response
+        """
+        return CachedResponse(
+            status,
+            body,
+            time.time() + self.ttl_for(endpoint, status),
+            headers.get("ETag"),
+            headers.get("Last-Modified"),
+        )
+
+    def refreshed(self, endpoint: str, response: CachedResponse) -> CachedResponse:
+        """
+        Returns the given entry with its TTL restarted, after the
+        server confirmed it is still valid
+        """
+        return CachedResponse(
+            response.status,
+            response.body,
+            time.time() + self.ttl_for(endpoint, response.status),
+            response.etag,
+            response.last_modified,
+        )
+
+    def _encode(self, body: bytes) -> Tuple[bytes, bool]:
+        if self.compress and body:
+            return zlib.compress(body), True
+        return body, False
+
+    @staticmethod
+    def _decode(body: bytes, compressed: bool) -> bytes:
+        return zlib.decompress(body) if compressed else body
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Returns the entry stored under key, fresh or not
+        """
+
+    @abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        """
+        Stores an entry under key, evicting entries if needed
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes the entry stored under key, if any
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Removes every entry
+        """
+
+
+class MemoryCache(Cache):
+    """
+    Cache keeping responses in memory
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._entries: "OrderedDict[str, Tuple[CachedResponse, bool]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entry_size(key: str, response: CachedResponse) -> int:
+        return len(key) + len(response.body)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        stored, compressed = entry
+        return CachedResponse(
+            stored.status,
+            self._decode(stored.body, compressed),
+            stored.expires,
+            stored.etag,
+            stored.last_modified,
+        )
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        body, compressed = self._encode(response.body)
+        stored = CachedResponse(
+            response.status,
+            body,
+            response.expires,
+            response.etag,
+            response.last_modified,
+        )
+        size = self._entry_size(key, stored)
+        if size > self.max_bytes:
+            self.delete(key)
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (stored, compressed)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= self._entry_size(key, entry[0])
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class SQLiteCache(Cache):
+    """
+    Cache keeping responses in an SQLite database, which
+    can be shared between processes
+    """
+
+    def __init__(self, path: str, *args, **kwargs) -> None:
+        """
+        Args:
+            path: Path of the database file. Created if it doesn't exist.
+
+        See `Cache` for the remaining arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, status INTEGER, body BLOB, "
+                "compressed INTEGER, expires REAL, etag TEXT, "
+                "last_modified TEXT, size INTEGER, accessed REAL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+            # total size of the responses, kept by triggers so that
+            # storing a response doesn't sum the sizes of all of them
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses_size ("
+                "id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER)"
+            )
+            self._db.execute(
+                "INSERT OR IGNORE INTO responses_size "
+                "SELECT 0, COALESCE(SUM(size), 0) FROM responses"
+            )
+            self._db.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_inserted "
+                "AFTER INSERT ON responses BEGIN "
+                "UPDATE responses_size SET size = size + new.size; END"
+            )
+            self._db.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_deleted "
+                "AFTER DELETE ON responses BEGIN "
+                "UPDATE responses_size SET size = size - old.size; END"
+            )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT status, body, compressed, expires, etag, last_modified "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        status, body, compressed, expires, etag, last_modified = row
+        return CachedResponse(
+            status, self._decode(body, compressed), expires, etag, last_modified
+        )
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        body, compressed = self._encode(response.body)
+        size = len(key) + len(body)
+        if size > self.max_bytes:
+            self.delete(key)
+            return
+        with self._lock, self._db:
+            # deleted first, as rows replaced on conflict don't fire triggers
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.execute(
+                "INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status,
+                    body,
+                    compressed,
+                    response.expires,
+                    response.etag,
+                    response.last_modified,
+                    size,
+                    time.time(),
+                ),
+            )
+            (total,) = self._db.execute("SELECT size FROM responses_size").fetchone()
+            if total > self.max_bytes:
+                self._evict(total - self.max_bytes)
+
+    def _evict(self, excess: int) -> None:
+        keys = []
+        # read from the index, only as far as needed
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed")
+        for key, size in rows:
+            keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        rows.close()
+        self._db.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,107 @@
+"""
+Client IDs shared between processes.
+
+A `ClientIDCache` keeps the last client ID a client generated in a file,
+for a TTL. Clients created without a client ID read it from there, and
+only scrape soundcloud.com for a new one if it is missing or expired.
+A client which gets a 401 for its generated client ID checks whether
+the ID was revoked and, if so, generates a new one, stores it, and
+sends the request again.
+"""
+
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Any, Optional
+
+__all__ = ["ClientIDCache"]
+
+
+class ClientIDCache:
+    """
+    Client ID stored in a file, which can be shared by processes
+    """
+
+    def __init__(self, path: str, ttl: float = 24 * 60 * 60) -> None:
+        """
+        Args:
+            path: Path of the file. Created if it doesn't exist.
+            ttl: Seconds a stored client ID is used for.
+        """
+        self.path = path
+        self.ttl = ttl
+
+    def get(self) -> Optional[str]:
+        """
+        Returns the stored client ID, or None if there is
+        none, it expired or the file can't be read
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            client_id, expires = data["client_id"], data["expires"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not isinstance(client_id, str) or time.time() >= expires:
+            return None
+        return client_id
+
+    def set(self, client_id: str) -> None:
+        """
+        Stores a client ID for ttl seconds
+        """
+        _write_json(
+            self.path, {"client_id": client_id, "expires": time.time() + self.ttl}
+        )
+
+
+def _write_json(path: str, data: Any) -> None:
+    """
+    Writes JSON to a file, see `_write_file`
+    """
+    _write_file(path, json.dumps(data).encode())
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """
+    Writes to a temporary file and moves it in place, so that
+    other processes never read a partially written file
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class _ClientIDScanner:
+    """
+    Searches the chunks of an asset script for the client ID,
+    without holding more than a chunk of the script at once
+    """
+
+    _REGEX = re.compile(rb"client_id:\"([^\"]+)\"")
+    # longer than any match, so one split between chunks is still found
+    _OVERLAP = 256
+
+    def __init__(self) -> None:
+        self._tail = b""
+
+    def feed(self, chunk: bytes) -> Optional[str]:
+        """
+        Searches the next chunk of the script, and
+        returns the client ID once it is found
+        """
+        text = self._tail + chunk
+        match = self._REGEX.search(text)
+        if match:
+            return match.group(1).decode()
+        self._tail = text[-self._OVERLAP :]
+        return None
@@ -0,0 +1,162 @@
+"""
+Adaptive limit on the number of requests in flight.
+
+`AdaptiveConcurrency` adjusts its limit with additive increase,
+multiplicative decrease (AIMD), like TCP congestion control. Each
+request which succeeds while the limit is in use raises the limit by
+about one per round of `limit` requests. A request which is throttled
+(429), finds the server overloaded (502 to 504), fails to connect, or
+takes much longer than the fastest recent requests cuts the limit by
+`backoff`, at most once per round, since requests started before a cut
+saw the old limit.
+
+Bulk operations, such as `get_tracks` or collections fetched with
+`concurrency`, then run as many requests at once as the server handles
+well at the time.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+__all__ = ["AdaptiveConcurrency"]
+
+
+class AdaptiveConcurrency:
+    """
+    Limit on the requests in flight, adjusted with AIMD.
+    Shared by the threads and event loops of a process.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        """
+        Args:
+            initial: Limit to start with.
+            min_limit: Smallest limit.
+            max_limit: Largest limit.
+            backoff: Factor the limit is multiplied by on failures.
+            latency_tolerance: How many times longer than the fastest
+                recent requests requests may take on average before
+                the limit is cut.
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.decreases = 0
+        """Number of times the limit was cut"""
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._baseline: Optional[float] = None
+        self._latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._async_waiters: Deque[
+            Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]
+        ] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current limit on the requests in flight"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight"""
+        return self._in_flight
+
+    def acquire(self) -> float:
+        """
+        Waits until a request can be sent, and returns
+        the time it started at, to pass to `release`
+        """
+        with self._available:
+            while self._in_flight >= int(self._limit):
+                self._available.wait()
+            self._in_flight += 1
+        return time.monotonic()
+
+    async def acquire_async(self) -> float:
+        """
+        Async version of `acquire`
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return time.monotonic()
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            finally:
+                with self._lock:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    def release(self, started: float, ok: bool) -> None:
+        """
+        Records the outcome of a request started at started, and
+        lets the next one be sent. ok is False if the request was
+        throttled or failed with a server or connection error.
+        """
+        latency = time.monotonic() - started
+        with self._lock:
+            limited = self._in_flight >= int(self._limit)
+            self._in_flight -= 1
+            if ok:
+                self._succeeded(started, latency, limited)
+            else:
+                self._decrease(started)
+            self._available.notify_all()
+            waiters, self._async_waiters = self._async_waiters, deque()
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def _succeeded(self, started: float, latency: float, limited: bool) -> None:
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        else:
+            # let the baseline follow latencies up slowly, so that one
+            # unusually fast request doesn't cut the limit for good
+            self._baseline += (latency - self._baseline) * 0.01
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += (latency - self._latency) * 0.2
+        # latencies of a few milliseconds are too noisy to compare
+        if self._latency > self.latency_tolerance * max(self._baseline, 0.01):
+            self._decrease(started)
+        elif limited:
+            # only raise a limit which is used, so it
+            # doesn't drift up while requests are few
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def _decrease(self, started: float) -> None:
+        if started < self._last_decrease:
+            # the request was sent before the last cut
+            return
+        self._limit = max(self.min_limit, self._limit * self.backoff)
+        self._last_decrease = time.monotonic()
+        self._latency = self._baseline
+        self.decreases += 1
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,191 @@
+"""
+State shared by many clients.
+
+A `ClientContext` holds what clients can share: the connection pools,
+the response cache, the client ID, the rate and concurrency limiters
+and the retry policy. Clients created with a context only keep their
+auth token and decoding options, so they are cheap to create, e.g.
+one per user of a web service, and all reuse the same warm connections.
+
+Responses to authenticated requests are cached apart for each auth
+token, so users sharing a context only share cached responses to
+unauthenticated requests.
+"""
+
+import asyncio
+import threading
+from typing import Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from soundcloud.cache import Cache
+from soundcloud.client_id import ClientIDCache
+from soundcloud.concurrency import AdaptiveConcurrency
+from soundcloud.json_backend import JSONBackend, get_json_backend
+from soundcloud.permalink import PermalinkIndex
+from soundcloud.rate_limit import RateLimiter
+from soundcloud.retry import RetryPolicy, RetryStats
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore[assignment]
+
+__all__ = ["ClientContext"]
+
+
+class ClientContext:
+    """
+    Connection pools, cache, client ID and limits shared by clients
+    """
+
+    client_id: str
+    """SoundCloud client ID used by the clients. Empty until generated."""
+    cache: Optional[Cache]
+    """Cache for responses to GET requests, if any."""
+    json_backend: JSONBackend
+    """Backend parsing the JSON of responses."""
+    retry_policy: RetryPolicy
+    """How requests failing with transient errors are retried."""
+    retry_stats: RetryStats
+    """Counts of the retries made by the clients."""
+    rate_limiter: Optional[RateLimiter]
+    """Rate limiter every request waits for, if any."""
+    concurrency_limiter: Optional[AdaptiveConcurrency]
+    """Limit on the requests in flight, if any."""
+    client_id_cache: Optional[ClientIDCache]
+    """File generated client IDs are stored in, if any."""
+    permalink_index: Optional[PermalinkIndex]
+    """Index of the permalink URLs of decoded resources, if any."""
+    _session: Optional[requests.Session]
+    _async_session: Optional["aiohttp.ClientSession"]
+    _owns_session: bool
+    _owns_async_session: bool
+    _client_id_generated: bool
+    _client_id_check: Optional[Tuple[str, bool, float]]
+    _client_id_lock: threading.Lock
+    _session_lock: threading.Lock
+    _async_client_id_lock: Optional[asyncio.Lock]
+
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        async_session: Optional["aiohttp.ClientSession"] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        cache: Optional[Cache] = None,
+        json_backend: Union[str, JSONBackend, None] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrency] = None,
+        client_id_cache: Optional[ClientIDCache] = None,
+        permalink_index: Optional[PermalinkIndex] = None,
+    ) -> None:
+        """
+        Args:
+            client_id: SoundCloud client ID. Generated by the first
+                client using the context if not given.
+            session: Session sync clients send requests with. Created
+                on first use if not given.
+            async_session: Session async clients send requests with.
+                Created on first use if not given.
+            pool_connections: Number of connection pools to keep,
+                one per host.
+            pool_maxsize: Maximum number of connections kept per host.
+                The async session opens at most pool_maxsize connections
+                to a host, and pool_connections * pool_maxsize in all.
+            keep_alive: Whether to reuse connections between requests.
+
+        See `soundcloud.SoundCloud` for the remaining arguments.
+        Sessions which are given are not closed by `close`.
+        """
+        self.client_id = client_id or ""
+        self.cache = cache
+        self.json_backend = get_json_backend(json_backend)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.client_id_cache = client_id_cache
+        self.permalink_index = permalink_index
+        self._session = session
+        self._async_session = async_session
+        self._owns_session = session is None
+        self._owns_async_session = async_session is None
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._keep_alive = keep_alive
+        # only client IDs the clients generated are renewed on 401,
+        # client IDs passed in are used as given
+        self._client_id_generated = not client_id
+        self._client_id_check = None
+        self._client_id_lock = threading.Lock()
+        # created on first use, in the event loop using the context
+        self._async_client_id_lock = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Session sync clients send requests with
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    @property
+    def async_session(self) -> "aiohttp.ClientSession":
+        """
+        Session async clients send requests with.
+        Must first be used in the event loop using it.
+        """
+        if self._async_session is None:
+            # aiohttp limits the connections in all, not the hosts
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_connections * self._pool_maxsize,
+                limit_per_host=self._pool_maxsize,
+                force_close=not self._keep_alive,
+            )
+            self._async_session = aiohttp.ClientSession(connector=connector)
+        return self._async_session
+
+    def _create_session(self) -> requests.Session:
+        # urllib3 connection pools are thread-safe, and clients pass their
+        # headers and parameters with each request. The only session state
+        # requests change is the cookie jar, which locks itself, so a
+        # single session can be shared by all threads using the clients
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections, pool_maxsize=self._pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _get_async_client_id_lock(self) -> asyncio.Lock:
+        if self._async_client_id_lock is None:
+            self._async_client_id_lock = asyncio.Lock()
+        return self._async_client_id_lock
+
+    def close(self) -> None:
+        """
+        Closes the sync session, unless it was passed in by the caller
+        """
+        if self._owns_session and self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def close_async(self) -> None:
+        """
+        Closes the async session, unless it was passed in by the caller
+        """
+        if self._owns_async_session and self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
@@ -0,0 +1,730 @@
+"""
+Concurrent crawls of the social graph.
+
+A `Crawler` expands users and tracks into their followers, followings,
+related artists, likers and related tracks, with a pool of threads
+sharing one client. Each relation found is written to an `EdgeSink` as
+an `Edge`, and the resources it leads to are queued in a `Frontier`,
+up to a depth and number of nodes, in the order given by a priority.
+
+The frontier remembers every node it ever queued in a `VisitedSet`:
+an `IntSet` storing 12 to 24 bytes per node, or a `BloomFilter` storing
+a couple of bytes per node at the cost of skipping a small fraction of
+them. A `MemoryFrontier` checkpoints itself to a file, from which an
+interrupted crawl resumes. An `SQLiteFrontier` keeps the crawl in a
+database, which several processes, on one or more machines sharing the
+file, can crawl together.
+"""
+
+import csv
+import heapq
+import itertools
+import math
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import requests
+
+from soundcloud.client_id import _write_file
+
+if TYPE_CHECKING:
+    from soundcloud.soundcloud import SoundCloud
+
+__all__ = [
+    "BloomFilter",
+    "CSVSink",
+    "CrawlStats",
+    "Crawler",
+    "Edge",
+    "EdgeSink",
+    "Frontier",
+    "IntSet",
+    "MemoryFrontier",
+    "MemorySink",
+    "Node",
+    "SQLiteFrontier",
+    "VisitedSet",
+]
+
+
+class Node(NamedTuple):
+    """
+    User or track to expand
+    """
+
+    kind: str
+    """Either user or track"""
+    id: int
+    depth: int = 0
+    """Number of edges from the seeds"""
+    priority: float = 0
+    """Nodes with lower priorities are expanded first,
+    then nodes with lower depths"""
+
+
+class Edge(NamedTuple):
+    """
+    Relation between two nodes
+    """
+
+    relation: str
+    """Name of the relation, see `Crawler`"""
+    source: int
+    """ID of the node expanded"""
+    target: int
+    """ID of the node found"""
+    resource: Any = None
+    """Resource of the node found"""
+
+
+class _Relation(NamedTuple):
+    source: str
+    target: str
+    method: str
+
+
+_RELATIONS: Dict[str, _Relation] = {
+    "followers": _Relation("user", "user", "get_user_followers"),
+    "following": _Relation("user", "user", "get_user_following"),
+    "related_artists": _Relation("user", "user", "get_user_related_artists"),
+    "likers": _Relation("track", "user", "get_track_likers"),
+    "related_tracks": _Relation("track", "track", "get_track_related"),
+}
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(key: int) -> int:
+    """
+    Scrambles the bits of a 64-bit key (splitmix64 finalizer)
+    """
+    key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & _MASK
+    return key ^ (key >> 31)
+
+
+def _node_key(kind: str, id: int) -> int:
+    return id << 1 | (kind == "track")
+
+
+class VisitedSet(ABC):
+    """
+    Base class of the sets of nodes a frontier queued, keyed by
+    non-negative integers below 2**63. Not thread-safe.
+    """
+
+    @abstractmethod
+    def add(self, key: int) -> bool:
+        """
+        Adds a key, and returns whether it wasn't in the set
+        """
+
+    @abstractmethod
+    def __contains__(self, key: object) -> bool:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class IntSet(VisitedSet):
+    """
+    Exact set of integers, stored in an open-addressing hash
+    table of 64-bit slots, at most two thirds full
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Args:
+            capacity: Number of keys to make room for. The table
+                grows past it as needed.
+        """
+        size = 8
+        while size * 2 < capacity * 3:
+            size *= 2
+        self._table = array("Q", bytes(8 * size))
+        self._len = 0
+
+    def _slot(self, stored: int) -> int:
+        # slots hold key + 1, so that 0 marks an empty slot
+        table = self._table
+        mask = len(table) - 1
+        i = _mix(stored) & mask
+        while table[i] != 0 and table[i] != stored:
+            i = (i + 1) & mask
+        return i
+
+    def add(self, key: int) -> bool:
+        i = self._slot(key + 1)
+        if self._table[i] != 0:
+            return False
+        self._table[i] = key + 1
+        self._len += 1
+        if self._len * 3 > len(self._table) * 2:
+            self._grow()
+        return True
+
+    def _grow(self) -> None:
+        old = self._table
+        self._table = array("Q", bytes(16 * len(old)))
+        for stored in old:
+            if stored:
+                self._table[self._slot(stored)] = stored
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, int) or key < 0:
+            return False
+        return self._table[self._slot(key + 1)] != 0
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class BloomFilter(VisitedSet):
+    """
+    Probabilistic set of integers, using a fixed number of bits. Keys
+    added are always found, and keys which weren't added are found with
+    a probability of about error_rate while the filter holds at most
+    capacity keys. A crawl using it skips that fraction of its nodes.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        Args:
+            capacity: Number of keys the filter is sized for.
+            error_rate: Probability of finding a key which wasn't added.
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("Expected capacity >= 1 and 0 < error_rate < 1")
+        self._size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._len = 0
+
+    def _positions(self, key: int) -> Iterator[int]:
+        # double hashing, see Kirsch and Mitzenmacher,
+        # "Less Hashing, Same Performance"
+        first = _mix(key)
+        second = _mix(first) | 1
+        for i in range(self._hashes):
+            yield (first + i * second) % self._size
+
+    def add(self, key: int) -> bool:
+        added = False
+        for position in self._positions(key):
+            byte, bit = position >> 3, 1 << (position & 7)
+            if not self._bits[byte] & bit:
+                self._bits[byte] |= bit
+                added = True
+        self._len += added
+        return added
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, int):
+            return False
+        return all(
+            self._bits[position >> 3] & 1 << (position & 7)
+            for position in self._positions(key)
+        )
+
+    def __len__(self) -> int:
+        """
+        Number of keys added, not counting keys
+        which were found without being added
+        """
+        return self._len
+
+
+class Frontier(ABC):
+    """
+    Base class of the queues of nodes to expand. A node is only ever
+    queued once. Nodes popped are claimed until marked done.
+    """
+
+    @abstractmethod
+    def push(self, nodes: Iterable[Node], max_nodes: Optional[int] = None) -> int:
+        """
+        Queues the nodes which were never queued, as long as fewer
+        than max_nodes nodes were ever queued, and returns their number
+        """
+
+    @abstractmethod
+    def pop(self) -> Optional[Node]:
+        """
+        Claims the queued node to expand next, or returns None
+        if no node is queued
+        """
+
+    @abstractmethod
+    def done(self, node: Node) -> None:
+        """
+        Marks a claimed node as expanded
+        """
+
+    @abstractmethod
+    def idle(self) -> bool:
+        """
+        Whether no node is queued or claimed, i.e. the crawl is finished
+        """
+
+    def checkpoint(self) -> None:
+        """
+        Saves the state of the crawl, if the frontier isn't already
+        durable. Nodes claimed are saved as queued.
+        """
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryFrontier(Frontier):
+    """
+    Frontier kept in memory, checkpointed to a file
+    """
+
+    def __init__(
+        self, visited: Optional[VisitedSet] = None, path: Optional[str] = None
+    ) -> None:
+        """
+        Args:
+            visited: Set of the nodes queued. An `IntSet` if not given.
+            path: File the frontier is checkpointed to. If it exists,
+                the frontier is restored from it, visited included. The
+                file is unpickled, so it must come from a trusted source.
+        """
+        self.path = path
+        self.visited = IntSet() if visited is None else visited
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[float, int, int, Node]] = []
+        self._claimed: Dict[Tuple[str, int], Node] = {}
+        self._seq = 0
+        if path is not None and os.path.exists(path):
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+            self.visited = state["visited"]
+            for node in state["nodes"]:
+                self._queue_node(node)
+
+    def _queue_node(self, node: Node) -> None:
+        # seq keeps nodes of equal priority and depth in FIFO order
+        heapq.heappush(self._queue, (node.priority, node.depth, self._seq, node))
+        self._seq += 1
+
+    def push(self, nodes: Iterable[Node], max_nodes: Optional[int] = None) -> int:
+        added = 0
+        with self._lock:
+            for node in nodes:
+                if max_nodes is not None and len(self.visited) >= max_nodes:
+                    break
+                if self.visited.add(_node_key(node.kind, node.id)):
+                    self._queue_node(node)
+                    added += 1
+        return added
+
+    def pop(self) -> Optional[Node]:
+        with self._lock:
+            if not self._queue:
+                return None
+            node = heapq.heappop(self._queue)[-1]
+            self._claimed[node.kind, node.id] = node
+            return node
+
+    def done(self, node: Node) -> None:
+        with self._lock:
+            self._claimed.pop((node.kind, node.id), None)
+
+    def idle(self) -> bool:
+        with self._lock:
+            return not self._queue and not self._claimed
+
+    def __len__(self) -> int:
+        """
+        Number of nodes queued
+        """
+        return len(self._queue)
+
+    def checkpoint(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            nodes = [entry[-1] for entry in self._queue]
+            nodes.extend(self._claimed.values())
+            data = pickle.dumps({"visited": self.visited, "nodes": nodes})
+        _write_file(self.path, data)
+
+
+class SQLiteFrontier(Frontier):
+    """
+    Frontier kept in an SQLite database, which can be shared by the
+    crawlers of several processes. Nodes claimed by a process which
+    didn't mark them done within lease seconds are queued again.
+    """
+
+    def __init__(self, path: str, lease: float = 600) -> None:
+        """
+        Args:
+            path: Path of the database file. Created if it doesn't exist.
+            lease: Seconds after which claimed nodes are queued again.
+        """
+        self.path = path
+        self.lease = lease
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        # readers don't block the writer. Commits are written to the WAL
+        # without syncing it: they survive a crash of the process, but
+        # the last ones may be lost if the machine crashes before they
+        # are synced to the database file, at the latest by checkpoint
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        with self._transaction():
+            # state: 0 queued, 1 claimed, 2 done
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS nodes ("
+                "kind TEXT, id INTEGER, depth INTEGER, priority REAL, "
+                "state INTEGER, claimed REAL, UNIQUE (kind, id))"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS nodes_queue "
+                "ON nodes (state, priority, depth)"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        # taking the write lock upfront, so that processes
+        # never claim the same node
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def push(self, nodes: Iterable[Node], max_nodes: Optional[int] = None) -> int:
+        added = 0
+        with self._transaction():
+            # rows are never deleted, so the largest rowid is their number
+            (queued,) = self._db.execute(
+                "SELECT COALESCE(MAX(rowid), 0) FROM nodes"
+            ).fetchone()
+            for node in nodes:
+                if max_nodes is not None and queued + added >= max_nodes:
+                    break
+                cursor = self._db.execute(
+                    "INSERT OR IGNORE INTO nodes VALUES (?, ?, ?, ?, 0, NULL)",
+                    (node.kind, node.id, node.depth, node.priority),
+                )
+                added += cursor.rowcount
+        return added
+
+    def pop(self) -> Optional[Node]:
+        now = time.time()
+        with self._transaction():
+            self._db.execute(
+                "UPDATE nodes SET state = 0 WHERE state = 1 AND claimed < ?",
+                (now - self.lease,),
+            )
+            row = self._db.execute(
+                "SELECT rowid, kind, id, depth, priority FROM nodes "
+                "WHERE state = 0 ORDER BY priority, depth LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE nodes SET state = 1, claimed = ? WHERE rowid = ?",
+                (now, row[0]),
+            )
+        return Node(*row[1:])
+
+    def done(self, node: Node) -> None:
+        with self._transaction():
+            self._db.execute(
+                "UPDATE nodes SET state = 2 WHERE kind = ? AND id = ?",
+                (node.kind, node.id),
+            )
+
+    def idle(self) -> bool:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM nodes WHERE state < 2 LIMIT 1"
+            ).fetchone()
+        return row is None
+
+    def __len__(self) -> int:
+        """
+        Number of nodes queued
+        """
+        with self._lock:
+            (queued,) = self._db.execute(
+                "SELECT COUNT(*) FROM nodes WHERE state = 0"
+            ).fetchone()
+        return queued
+
+    def checkpoint(self) -> None:
+        """
+        Syncs the commits in the WAL to the database file, without
+        waiting for the other processes' transactions
+        """
+        with self._lock:
+            self._db.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class EdgeSink(ABC):
+    """
+    Base class of the destinations of the edges found.
+    Edges are written by one thread at a time.
+    """
+
+    @abstractmethod
+    def write(self, edges: Sequence[Edge]) -> None:
+        """
+        Writes the edges found by expanding a node
+        """
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySink(EdgeSink):
+    """
+    Sink keeping the edges in a list, without their resources
+    """
+
+    def __init__(self) -> None:
+        self.edges: List[Edge] = []
+
+    def write(self, edges: Sequence[Edge]) -> None:
+        self.edges.extend(edge._replace(resource=None) for edge in edges)
+
+
+class CSVSink(EdgeSink):
+    """
+    Sink appending the relation, source and target
+    of the edges to a CSV file
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def write(self, edges: Sequence[Edge]) -> None:
+        # opened for each node expanded, which is cheap next to its
+        # requests, so that no file is left open if the sink isn't closed
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(
+                (edge.relation, edge.source, edge.target) for edge in edges
+            )
+
+
+@dataclass
+class CrawlStats:
+    """
+    Counts of a crawl
+    """
+
+    nodes: int = 0
+    """Nodes expanded"""
+    edges: int = 0
+    """Edges found"""
+    errors: int = 0
+    """Nodes which couldn't be expanded because of failed requests"""
+
+
+class Crawler:
+    """
+    Crawls the graph of users and tracks with a pool of threads.
+
+    Relations:
+        followers: Users following a user.
+        following: Users a user follows.
+        related_artists: Artists related to a user.
+        likers: Users who liked a track.
+        related_tracks: Tracks related to a track.
+    """
+
+    def __init__(
+        self,
+        client: "SoundCloud",
+        relations: Sequence[str] = ("followers", "following"),
+        frontier: Optional[Frontier] = None,
+        sink: Optional[EdgeSink] = None,
+        max_depth: int = 1,
+        max_nodes: Optional[int] = None,
+        max_edges: Optional[int] = None,
+        page_size: Optional[int] = None,
+        priority: Optional[Callable[[Edge], float]] = None,
+        workers: int = 8,
+        checkpoint_interval: float = 60,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """
+        Args:
+            client: Client the threads share.
+            relations: Relations to follow.
+            frontier: Frontier of the crawl. A `MemoryFrontier` if not given.
+            sink: Sink of the edges found. A `MemorySink` if not given.
+            max_depth: Depth past which nodes aren't queued.
+            max_nodes: Number of nodes past which nodes aren't queued.
+            max_edges: Number of edges to follow per node and relation.
+                All of them if not given.
+            page_size: Number of resources to request per page.
+            priority: Function giving the priority of the node an edge
+                leads to, lower first. Nodes are expanded breadth-first
+                if not given.
+            workers: Number of threads expanding nodes.
+            checkpoint_interval: Seconds between frontier checkpoints.
+            poll_interval: Seconds idle threads wait for nodes
+                other threads or processes are expanding.
+
+        Raises:
+            ValueError: A relation is unknown
+        """
+        unknown = set(relations) - set(_RELATIONS)
+        if unknown:
+            raise ValueError(f"Unknown relations: {', '.join(sorted(unknown))}")
+        self.client = client
+        self.relations = relations
+        self.frontier = MemoryFrontier() if frontier is None else frontier
+        self.sink = MemorySink() if sink is None else sink
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.max_edges = max_edges
+        self.page_size = page_size
+        self.priority = priority
+        self.workers = workers
+        self.checkpoint_interval = checkpoint_interval
+        self.poll_interval = poll_interval
+        self.stats = CrawlStats()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def run(self, seeds: Iterable[Tuple[str, int]] = ()) -> CrawlStats:
+        """
+        Queues the seeds, given as (kind, id) pairs, and expands nodes
+        until the frontier is idle or `stop` is called. Seeds already
+        queued, e.g. by the crawl being resumed, are skipped.
+        Checkpoints the frontier periodically and when returning.
+        Nodes whose requests fail are counted as errors, while other
+        errors stop the crawl and are raised.
+        """
+        self.stats = CrawlStats()
+        self._stop.clear()
+        self.frontier.push((Node(kind, id) for kind, id in seeds), self.max_nodes)
+        executor = ThreadPoolExecutor(self.workers)
+        futures: List[Future] = [
+            executor.submit(self._work) for _ in range(self.workers)
+        ]
+        try:
+            while wait(futures, timeout=self.checkpoint_interval).not_done:
+                self.checkpoint()
+        finally:
+            # threads finish the nodes they are expanding
+            self._stop.set()
+            executor.shutdown()
+            self.checkpoint()
+        for future in futures:
+            future.result()
+        return self.stats
+
+    def stop(self) -> None:
+        """
+        Makes `run` return once the nodes being expanded are done
+        """
+        self._stop.set()
+
+    def checkpoint(self) -> None:
+        """
+        Checkpoints the frontier
+        """
+        # no node is marked done while its edges aren't written
+        with self._lock:
+            self.frontier.checkpoint()
+
+    def _work(self) -> None:
+        try:
+            self._expand_nodes()
+        except BaseException:
+            # other threads stop too, and run raises the error
+            self._stop.set()
+            raise
+
+    def _expand_nodes(self) -> None:
+        while not self._stop.is_set():
+            node = self.frontier.pop()
+            if node is None:
+                if self.frontier.idle():
+                    return
+                self._stop.wait(self.poll_interval)
+                continue
+            try:
+                edges = self._expand(node)
+            except requests.RequestException:
+                # e.g. a user which was deleted since it was queued
+                with self._lock:
+                    self.stats.errors += 1
+                    self.frontier.done(node)
+                continue
+            children = []
+            if node.depth < self.max_depth:
+                children = [
+                    Node(
+                        _RELATIONS[edge.relation].target,
+                        edge.target,
+                        node.depth + 1,
+                        self.priority(edge) if self.priority else 0,
+                    )
+                    for edge in edges
+                ]
+            with self._lock:
+                self.sink.write(edges)
+                self.frontier.push(children, self.max_nodes)
+                self.frontier.done(node)
+                self.stats.nodes += 1
+                self.stats.edges += len(edges)
+
+    def _expand(self, node: Node) -> List[Edge]:
+        """
+        Returns the edges of a node, for each relation
+        """
+        kwargs = {} if self.page_size is None else {"limit": self.page_size}
+        edges = []
+        for name in self.relations:
+            relation = _RELATIONS[name]
+            if relation.source != node.kind:
+                continue
+            resources = getattr(self.client, relation.method)(node.id, **kwargs)
+            try:
+                for resource in itertools.islice(resources, self.max_edges):
+                    edges.append(Edge(name, node.id, resource.id, resource))
+            finally:
+                resources.close()
+        return edges
@@ -0,0 +1,757 @@
+"""
+Audio downloads.
+
+`select_transcoding` picks the transcoding of a track to download by
+quality, mime type and protocol. `SoundCloud.download_track` exchanges
+it for a signed stream URL, and downloads the segments of an HLS
+transcoding, or byte ranges of a progressive one, with a pool of
+threads (tasks for the async client).
+
+Parts are written at their offset in a `.part` file allocated upfront,
+next to a manifest recording the size and CRC32 of each part written.
+An interrupted download resumes with the parts it misses, once the
+parts it kept are checked against their CRC32. A complete file is
+checked whole, then moved in place.
+
+`SoundCloud.stream_track_audio` yields the audio in order instead, as
+the bytes of each segment or byte range. It downloads a few parts ahead
+of the one consumed, and holds no more than that many in memory.
+"""
+
+import asyncio
+import errno
+import itertools
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import urljoin
+
+import requests
+
+from soundcloud.client_id import _write_json
+from soundcloud.exceptions import DownloadError
+from soundcloud.rate_limit import MEDIA
+from soundcloud.requests import _NOT_FOUND_STATUS_CODES, _send, _send_async
+from soundcloud.resource.track import BaseTrack, Media, Transcoding
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from soundcloud.async_soundcloud import AsyncSoundCloud
+    from soundcloud.soundcloud import SoundCloud, _SoundCloudBase
+
+__all__ = ["DownloadResult", "select_transcoding"]
+
+# protocols which can be downloaded, unlike encrypted HLS
+_PROTOCOLS = ("progressive", "hls")
+_ATTRIBUTE_REGEX = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
+
+
+def select_transcoding(
+    track: Union[BaseTrack, Media, Iterable[Transcoding]],
+    protocols: Sequence[str] = _PROTOCOLS,
+    mime_types: Optional[Sequence[str]] = None,
+    qualities: Sequence[str] = ("hq", "sq"),
+    snipped: bool = False,
+) -> Optional[Transcoding]:
+    """
+    Returns the transcoding of a track preferred by quality, then by
+    mime type, then by protocol, or None if none is acceptable
+
+    Args:
+        track: Track, its media, or its transcodings.
+        protocols: Acceptable protocols, preferred first. Only
+            progressive and hls can be downloaded.
+        mime_types: Acceptable mime types, preferred first,
+            e.g. `("audio/mpeg",)`. Any if not given.
+        qualities: Qualities, preferred first. Other qualities come last.
+        snipped: Whether previews of the track are acceptable.
+    """
+    if isinstance(track, BaseTrack):
+        track = track.media
+    transcodings = track.transcodings if isinstance(track, Media) else track
+
+    def rank(transcoding: Transcoding) -> Tuple[int, int, int]:
+        quality = transcoding.quality
+        mime_type = transcoding.format.mime_type
+        return (
+            qualities.index(quality) if quality in qualities else len(qualities),
+            mime_types.index(mime_type) if mime_types else 0,
+            protocols.index(transcoding.format.protocol),
+        )
+
+    acceptable = [
+        transcoding
+        for transcoding in transcodings
+        if transcoding.format.protocol in protocols
+        and transcoding.format.protocol in _PROTOCOLS
+        and (not mime_types or transcoding.format.mime_type in mime_types)
+        and (snipped or not transcoding.snipped)
+    ]
+    return min(acceptable, key=rank, default=None)
+
+
+@dataclass
+class DownloadResult:
+    """
+    Audio of a track downloaded to a file
+    """
+
+    path: str
+    size: int
+    """Size of the file in bytes"""
+    parts: int
+    """Number of segments or byte ranges the audio was downloaded in"""
+    resumed_parts: int
+    """Parts kept from an interrupted download"""
+    transcoding: Transcoding
+
+
+class _Part(NamedTuple):
+    url: str
+    start: Optional[int]
+    """Offset of the part in the resource at url, if it is a byte range"""
+    size: Optional[int]
+    """Size of the part, if known before it is downloaded"""
+
+
+def _playlist_parts(text: str, url: str) -> List[_Part]:
+    """
+    Returns the parts of an HLS media playlist: the media
+    initialization section, if any, and the segments
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if not lines or lines[0] != "#EXTM3U":
+        raise DownloadError("Invalid HLS playlist")
+    if "#EXT-X-ENDLIST" not in lines:
+        raise DownloadError("HLS playlist is incomplete")
+    parts: List[_Part] = []
+    # segments without a byte range offset start where the last one ended
+    ends: Dict[str, int] = {}
+    byte_range: Optional[str] = None
+
+    def add(uri: str, byte_range: Optional[str]) -> None:
+        uri = urljoin(url, uri)
+        if byte_range is None:
+            parts.append(_Part(uri, None, None))
+            return
+        size, _, start = byte_range.partition("@")
+        offset = int(start) if start else ends.get(uri, 0)
+        ends[uri] = offset + int(size)
+        parts.append(_Part(uri, offset, int(size)))
+
+    for line in lines[1:]:
+        tag, _, value = line.partition(":")
+        attributes = {k: v.strip('"') for k, v in _ATTRIBUTE_REGEX.findall(value)}
+        if tag == "#EXT-X-STREAM-INF":
+            raise DownloadError("HLS master playlists are not supported")
+        elif tag == "#EXT-X-KEY" and attributes.get("METHOD") != "NONE":
+            raise DownloadError("Encrypted HLS playlists are not supported")
+        elif tag == "#EXT-X-MAP":
+            add(attributes["URI"], attributes.get("BYTERANGE"))
+        elif tag == "#EXT-X-BYTERANGE":
+            byte_range = value
+        elif not line.startswith("#"):
+            add(line, byte_range)
+            byte_range = None
+    if not parts:
+        raise DownloadError("HLS playlist has no segments")
+    return parts
+
+
+def _byte_ranges(url: str, size: int, part_size: int) -> List[_Part]:
+    return [
+        _Part(url, start, min(part_size, size - start))
+        for start in range(0, size, part_size)
+    ]
+
+
+class _Download:
+    """
+    Parts of a download written to a file, with
+    a manifest of the parts written so far
+    """
+
+    def __init__(self, path: str, source: str, parts: List[_Part], resume: bool):
+        self.path = path
+        self.source = source
+        self.parts = parts
+        self.sizes = [part.size for part in parts]
+        self.crcs: List[Optional[int]] = [None] * len(parts)
+        self._tmp_path = f"{path}.part"
+        self._manifest_path = f"{path}.part.json"
+        # parts downloaded before the ones preceding them have a size
+        self._unwritten: Dict[int, bytes] = {}
+        self._lock = threading.Lock()
+        resumed = resume and self._load_manifest()
+        # owned by the download until finish or close, which callers
+        # call on success and failure, as parts are written at their
+        # offsets for as long as the download runs
+        self._file = open(self._tmp_path, "r+b" if resumed else "w+b")  # noqa: SIM115
+        try:
+            if None not in self.sizes:
+                self._allocate(sum(self.sizes))  # type: ignore[arg-type]
+            self._check_kept_parts()
+        except BaseException:
+            self._file.close()
+            raise
+        self.resumed_parts = len(self.parts) - len(self.pending())
+
+    def _load_manifest(self) -> bool:
+        """
+        Restores the sizes and CRC32s of the parts written by an
+        interrupted download of the same parts, if there was one
+        """
+        if not os.path.exists(self._tmp_path):
+            return False
+        try:
+            with open(self._manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            sizes, crcs = manifest["sizes"], manifest["crcs"]
+            source = manifest["source"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        if source != self.source or len(sizes) != len(self.parts):
+            return False
+        # sizes unknown to one of the downloads, e.g. of
+        # a segment which failed to be probed, may differ
+        if any(
+            old != new
+            for old, new in zip(sizes, self.sizes)
+            if old is not None and new is not None
+        ):
+            return False
+        self.sizes = [
+            new if new is not None else old for old, new in zip(sizes, self.sizes)
+        ]
+        self.crcs = crcs
+        return True
+
+    def _allocate(self, size: int) -> None:
+        """
+        Sets the size of the file, reserving its space on disk if
+        possible, so that a full disk fails before downloading
+        """
+        self._file.truncate(size)
+        if size > 0 and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(self._file.fileno(), 0, size)
+            except OSError as e:
+                if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL):  # not supported
+                    raise
+
+    def _offset(self, index: int) -> Optional[int]:
+        sizes = self.sizes[:index]
+        return None if None in sizes else sum(sizes)  # type: ignore[arg-type]
+
+    def _read(self, index: int) -> bytes:
+        self._file.seek(self._offset(index))  # type: ignore[arg-type]
+        return self._file.read(self.sizes[index])  # type: ignore[arg-type]
+
+    def _check_kept_parts(self) -> None:
+        for i, crc in enumerate(self.crcs):
+            if crc is not None and zlib.crc32(self._read(i)) != crc:
+                self.crcs[i] = None
+
+    def part(self, index: int) -> _Part:
+        """
+        Returns a part, with its size if it is known by now
+        """
+        return self.parts[index]._replace(size=self.sizes[index])
+
+    def pending(self) -> List[int]:
+        """
+        Returns the indexes of the parts to download
+        """
+        return [i for i, crc in enumerate(self.crcs) if crc is None]
+
+    def complete(self, index: int, data: bytes) -> None:
+        """
+        Writes a downloaded part, once the parts preceding it have a size
+        """
+        with self._lock:
+            self.sizes[index] = len(data)
+            self._unwritten[index] = data
+            written = False
+            for i in sorted(self._unwritten):
+                offset = self._offset(i)
+                if offset is None:
+                    break
+                data = self._unwritten.pop(i)
+                self._file.seek(offset)
+                self._file.write(data)
+                self.crcs[i] = zlib.crc32(data)
+                written = True
+            if written:
+                # parts are only recorded once written
+                self._file.flush()
+                _write_json(
+                    self._manifest_path,
+                    {"source": self.source, "sizes": self.sizes, "crcs": self.crcs},
+                )
+
+    def finish(self, transcoding: Transcoding, verify: bool) -> DownloadResult:
+        """
+        Checks the file and moves it in place
+
+        Raises:
+            DownloadError: The file doesn't match the parts downloaded
+        """
+        try:
+            size = sum(self.sizes)  # type: ignore[arg-type]
+            self._file.truncate(size)
+            if verify:
+                for i, crc in enumerate(self.crcs):
+                    if zlib.crc32(self._read(i)) != crc:
+                        raise DownloadError(f"Part {i} of {self.path} is corrupt")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+        os.replace(self._tmp_path, self.path)
+        os.remove(self._manifest_path)
+        return DownloadResult(
+            self.path, size, len(self.parts), self.resumed_parts, transcoding
+        )
+
+    def close(self) -> None:
+        """
+        Closes the file, keeping it and the manifest to resume from
+        """
+        self._file.close()
+
+
+def _resolve_transcoding(
+    track: BaseTrack, transcoding: Optional[Transcoding]
+) -> Transcoding:
+    if transcoding is None:
+        transcoding = select_transcoding(track)
+        if transcoding is None:
+            raise DownloadError(f"Track {track.id} has no downloadable transcoding")
+    return transcoding
+
+
+def _stream_params(client: "_SoundCloudBase", track: BaseTrack) -> Dict[str, str]:
+    return {
+        "client_id": client.client_id,
+        "track_authorization": track.track_authorization,
+    }
+
+
+def _media_headers(client: "_SoundCloudBase", part: Optional[_Part] = None):
+    # sizes are compared with Content-Length, so bodies must not be encoded,
+    # and the auth token isn't sent to the CDN
+    headers = {**client._get_default_headers(), "Accept-Encoding": "identity"}
+    if part is not None and part.start is not None and part.size is not None:
+        headers["Range"] = f"bytes={part.start}-{part.start + part.size - 1}"
+    return headers
+
+
+def _check_part(part: _Part, status: int, data: bytes) -> Optional[str]:
+    """
+    Returns why a downloaded part is wrong, if it is
+    """
+    if part.start is not None and status != 206:
+        return "the server ignored the byte range"
+    if part.size is not None and len(data) != part.size:
+        return f"expected {part.size} bytes, got {len(data)}"
+    return None
+
+
+def _stream_url(
+    client: "SoundCloud", track: BaseTrack, transcoding: Transcoding
+) -> Optional[str]:
+    """
+    Exchanges a transcoding for a signed URL of its audio,
+    or returns None if the track can't be streamed
+    """
+    with _send(
+        client,
+        "GET",
+        transcoding.url,
+        params=_stream_params(client, track),
+        headers=client._get_headers(True),
+    ) as r:
+        if r.status_code in _NOT_FOUND_STATUS_CODES + (403,):
+            return None
+        r.raise_for_status()
+        return client.json_backend.loads(r.content)["url"]
+
+
+def _probe(client: "SoundCloud", url: str) -> Tuple[Optional[int], bool]:
+    """
+    Returns the size of a resource, if known, and
+    whether it can be downloaded in byte ranges
+    """
+    with _send(client, "HEAD", url, family=MEDIA, headers=_media_headers(client)) as r:
+        if not r.ok or "Content-Length" not in r.headers:
+            return None, False
+        ranges = r.headers.get("Accept-Ranges") == "bytes"
+        return int(r.headers["Content-Length"]), ranges
+
+
+def _plan(
+    client: "SoundCloud",
+    url: str,
+    protocol: str,
+    part_size: int,
+    executor: Executor,
+    probe: bool = True,
+) -> List[_Part]:
+    """
+    Returns the parts to download the audio at a stream URL in. The
+    sizes of HLS segments are probed if probe is True, so that they
+    can be written at their offset as soon as they are downloaded.
+    """
+    if protocol == "progressive":
+        size, ranges = _probe(client, url)
+        if size is None or not ranges or size == 0:
+            return [_Part(url, None, size)]
+        return _byte_ranges(url, size, part_size)
+    with _send(client, "GET", url, family=MEDIA, headers=_media_headers(client)) as r:
+        r.raise_for_status()
+        parts = _playlist_parts(r.text, r.url)
+    if not probe:
+        return parts
+    unsized = [i for i, part in enumerate(parts) if part.size is None]
+    probes = executor.map(lambda i: _probe(client, parts[i].url)[0], unsized)
+    for i, size in zip(unsized, probes):
+        parts[i] = parts[i]._replace(size=size)
+    return parts
+
+
+def _fetch_part(client: "SoundCloud", part: _Part) -> bytes:
+    """
+    Downloads a part, retrying truncated ones
+    as the client's retry policy says
+    """
+    policy = client.retry_policy
+    attempt = 0
+    while True:
+        # the body is streamed so that a truncated one is retried here
+        with _send(
+            client,
+            "GET",
+            part.url,
+            family=MEDIA,
+            headers=_media_headers(client, part),
+            stream=True,
+        ) as r:
+            r.raise_for_status()
+            try:
+                data = r.content
+                error = _check_part(part, r.status_code, data)
+            except (
+                requests.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+            ) as e:
+                error = str(e)
+        if error is None:
+            return data
+        delay = policy.delay(attempt)
+        if not policy.should_retry(attempt, None, True) or delay is None:
+            raise DownloadError(f"Failed to download {part.url}: {error}")
+        client.retry_stats.record_retry("truncated")
+        time.sleep(delay)
+        attempt += 1
+
+
+def _fetch_in_order(
+    client: "SoundCloud", executor: Executor, parts: Iterable[_Part], window: int
+) -> Generator[bytes, None, None]:
+    """
+    Downloads parts, up to window at once, and yields them in order.
+    A part is only requested once the part window places before it
+    is consumed, so that at most window parts are held in memory, on
+    top of the one the consumer may still hold.
+    """
+    parts = iter(parts)
+    futures: Deque[Future] = deque(
+        executor.submit(_fetch_part, client, part)
+        for part in itertools.islice(parts, window)
+    )
+    try:
+        while futures:
+            data = futures[0].result()
+            futures.popleft()
+            yield data
+            del data
+            for part in itertools.islice(parts, 1):
+                futures.append(executor.submit(_fetch_part, client, part))
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _download(
+    client: "SoundCloud",
+    track: BaseTrack,
+    path: str,
+    transcoding: Optional[Transcoding],
+    workers: int,
+    part_size: int,
+    resume: bool,
+    verify: bool,
+) -> DownloadResult:
+    transcoding = _resolve_transcoding(track, transcoding)
+    url = _stream_url(client, track, transcoding)
+    if url is None:
+        raise DownloadError(f"Track {track.id} can't be streamed")
+    with ThreadPoolExecutor(workers) as executor:
+        parts = _plan(client, url, transcoding.format.protocol, part_size, executor)
+        download = _Download(path, transcoding.url, parts, resume)
+        pending = download.pending()
+        # sizes of parts are looked up as they are requested,
+        # since parts written before them may have told them
+        chunks = _fetch_in_order(
+            client, executor, (download.part(i) for i in pending), workers
+        )
+        try:
+            for index, data in zip(pending, chunks):
+                download.complete(index, data)
+        except BaseException:
+            chunks.close()
+            download.close()
+            raise
+    return download.finish(transcoding, verify)
+
+
+def _stream(
+    client: "SoundCloud",
+    track: BaseTrack,
+    transcoding: Optional[Transcoding],
+    read_ahead: int,
+    part_size: int,
+) -> Generator[bytes, None, None]:
+    transcoding = _resolve_transcoding(track, transcoding)
+    url = _stream_url(client, track, transcoding)
+    if url is None:
+        raise DownloadError(f"Track {track.id} can't be streamed")
+    with ThreadPoolExecutor(read_ahead) as executor:
+        parts = _plan(
+            client, url, transcoding.format.protocol, part_size, executor, False
+        )
+        if len(parts) > 1 or parts[0].start is not None:
+            yield from _fetch_in_order(client, executor, parts, read_ahead)
+            return
+    # audio which can't be requested in byte ranges, or a playlist of a
+    # single segment, is read as it arrives
+    with _send(
+        client,
+        "GET",
+        parts[0].url,
+        family=MEDIA,
+        headers=_media_headers(client),
+        stream=True,
+    ) as r:
+        r.raise_for_status()
+        yield from r.iter_content(part_size)
+
+
+async def _stream_url_async(
+    client: "AsyncSoundCloud", track: BaseTrack, transcoding: Transcoding
+) -> Optional[str]:
+    """
+    Async version of `_stream_url`
+    """
+    async with await _send_async(
+        client,
+        "GET",
+        transcoding.url,
+        params=_stream_params(client, track),
+        headers=client._get_headers(True),
+    ) as r:
+        if r.status in _NOT_FOUND_STATUS_CODES + (403,):
+            return None
+        r.raise_for_status()
+        return client.json_backend.loads(await r.read())["url"]
+
+
+async def _probe_async(
+    client: "AsyncSoundCloud", url: str
+) -> Tuple[Optional[int], bool]:
+    """
+    Async version of `_probe`
+    """
+    async with await _send_async(
+        client, "HEAD", url, family=MEDIA, headers=_media_headers(client)
+    ) as r:
+        if not r.ok or "Content-Length" not in r.headers:
+            return None, False
+        ranges = r.headers.get("Accept-Ranges") == "bytes"
+        return int(r.headers["Content-Length"]), ranges
+
+
+async def _plan_async(
+    client: "AsyncSoundCloud",
+    url: str,
+    protocol: str,
+    part_size: int,
+    workers: int,
+    probe: bool = True,
+) -> List[_Part]:
+    """
+    Async version of `_plan`
+    """
+    if protocol == "progressive":
+        size, ranges = await _probe_async(client, url)
+        if size is None or not ranges or size == 0:
+            return [_Part(url, None, size)]
+        return _byte_ranges(url, size, part_size)
+    async with await _send_async(
+        client, "GET", url, family=MEDIA, headers=_media_headers(client)
+    ) as r:
+        r.raise_for_status()
+        parts = _playlist_parts(await r.text(), str(r.url))
+    if not probe:
+        return parts
+    semaphore = asyncio.Semaphore(workers)
+
+    async def probe_size(part: _Part) -> _Part:
+        if part.size is not None:
+            return part
+        async with semaphore:
+            size, _ = await _probe_async(client, part.url)
+        return part._replace(size=size)
+
+    return list(await asyncio.gather(*map(probe_size, parts)))
+
+
+async def _fetch_part_async(client: "AsyncSoundCloud", part: _Part) -> bytes:
+    """
+    Async version of `_fetch_part`
+    """
+    policy = client.retry_policy
+    attempt = 0
+    while True:
+        async with await _send_async(
+            client, "GET", part.url, family=MEDIA, headers=_media_headers(client, part)
+        ) as r:
+            r.raise_for_status()
+            try:
+                data = await r.read()
+                error = _check_part(part, r.status, data)
+            except aiohttp.ClientPayloadError as e:
+                error = str(e)
+        if error is None:
+            return data
+        delay = policy.delay(attempt)
+        if not policy.should_retry(attempt, None, True) or delay is None:
+            raise DownloadError(f"Failed to download {part.url}: {error}")
+        client.retry_stats.record_retry("truncated")
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _fetch_in_order_async(
+    client: "AsyncSoundCloud", parts: Iterable[_Part], window: int
+) -> AsyncGenerator[bytes, None]:
+    """
+    Async version of `_fetch_in_order`
+    """
+    parts = iter(parts)
+    futures: Deque["asyncio.Future[bytes]"] = deque(
+        asyncio.ensure_future(_fetch_part_async(client, part))
+        for part in itertools.islice(parts, window)
+    )
+    try:
+        while futures:
+            data = await futures[0]
+            futures.popleft()
+            yield data
+            del data
+            for part in itertools.islice(parts, 1):
+                futures.append(asyncio.ensure_future(_fetch_part_async(client, part)))
+    finally:
+        for future in futures:
+            future.cancel()
+        await asyncio.gather(*futures, return_exceptions=True)
+
+
+async def _download_async(
+    client: "AsyncSoundCloud",
+    track: BaseTrack,
+    path: str,
+    transcoding: Optional[Transcoding],
+    workers: int,
+    part_size: int,
+    resume: bool,
+    verify: bool,
+) -> DownloadResult:
+    """
+    Async version of `_download`
+    """
+    transcoding = _resolve_transcoding(track, transcoding)
+    url = await _stream_url_async(client, track, transcoding)
+    if url is None:
+        raise DownloadError(f"Track {track.id} can't be streamed")
+    parts = await _plan_async(
+        client, url, transcoding.format.protocol, part_size, workers
+    )
+    download = _Download(path, transcoding.url, parts, resume)
+    pending = download.pending()
+    chunks = _fetch_in_order_async(client, (download.part(i) for i in pending), workers)
+    try:
+        for index in pending:
+            download.complete(index, await chunks.__anext__())
+    except BaseException:
+        await chunks.aclose()
+        download.close()
+        raise
+    return download.finish(transcoding, verify)
+
+
+async def _stream_async(
+    client: "AsyncSoundCloud",
+    track: BaseTrack,
+    transcoding: Optional[Transcoding],
+    read_ahead: int,
+    part_size: int,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Async version of `_stream`
+    """
+    transcoding = _resolve_transcoding(track, transcoding)
+    url = await _stream_url_async(client, track, transcoding)
+    if url is None:
+        raise DownloadError(f"Track {track.id} can't be streamed")
+    parts = await _plan_async(
+        client, url, transcoding.format.protocol, part_size, read_ahead, False
+    )
+    if len(parts) > 1 or parts[0].start is not None:
+        chunks = _fetch_in_order_async(client, parts, read_ahead)
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+        return
+    async with await _send_async(
+        client, "GET", parts[0].url, family=MEDIA, headers=_media_headers(client)
+    ) as r:
+        r.raise_for_status()
+        async for chunk in r.content.iter_chunked(part_size):
+            yield chunk
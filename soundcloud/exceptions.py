@@ -4,4 +4,10 @@ class ClientIDGenerationError(Exception):
     """
 
 
-__all__ = ["ClientIDGenerationError"]
+class DownloadError(Exception):
+    """
+    Raised when the audio of a track could not be downloaded.
+    """
+
+
+__all__ = ["ClientIDGenerationError", "DownloadError"]
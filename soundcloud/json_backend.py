@@ -0,0 +1,192 @@
+"""
+Backends parsing the JSON of responses.
+
+Response bodies are parsed straight from their bytes, without decoding
+them to `str` first. By default the client uses the fastest backend
+installed: `orjson`, then `msgspec`, then the standard library `json`.
+"""
+
+import codecs
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+__all__ = ["JSONBackend", "get_json_backend"]
+
+_DELIMITERS = frozenset(",:]} \t\n\r")
+
+
+@dataclass(frozen=True)
+class JSONBackend:
+    """
+    Parses JSON from bytes
+    """
+
+    name: str
+    loads: Callable[[bytes], Any]
+
+
+def _backends() -> Dict[str, JSONBackend]:
+    backends = {}
+    if orjson is not None:
+        backends["orjson"] = JSONBackend("orjson", orjson.loads)
+    if msgspec is not None:
+        backends["msgspec"] = JSONBackend("msgspec", msgspec.json.decode)
+    backends["json"] = JSONBackend("json", json.loads)
+    return backends
+
+
+_BACKENDS = _backends()
+_NAMES = ("orjson", "msgspec", "json")
+
+
+def get_json_backend(backend: Union[str, JSONBackend, None] = None) -> JSONBackend:
+    """
+    Returns the JSON backend with the given name,
+    or the fastest one installed if no name is given
+
+    Args:
+        backend: "orjson", "msgspec" or "json". Backends
+            are returned as they are.
+
+    Raises:
+        ValueError: The backend is unknown or not installed
+    """
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend is None:
+        return next(iter(_BACKENDS.values()))
+    try:
+        return _BACKENDS[backend]
+    except KeyError:
+        if backend in _NAMES:
+            raise ValueError(f"JSON backend {backend!r} is not installed") from None
+        raise ValueError(f"Unknown JSON backend {backend!r}") from None
+
+
+class CollectionParser:
+    """
+    Parses a page of a collection incrementally from chunks of its body.
+    Items of the "collection" array are returned as soon as they are
+    complete, and only the unparsed end of the body is kept in memory.
+    The other fields of the page, such as next_href, are collected in
+    `page`. Items are parsed with the standard library `json`, which
+    can tell where they end.
+    """
+
+    _START, _KEY, _COLON, _VALUE, _AFTER_VALUE = range(5)
+    _ITEMS, _FIRST_ITEM, _ITEM, _AFTER_ITEM, _DONE = range(5, 10)
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self) -> None:
+        self.page: Dict[str, Any] = {}
+        """Fields of the page other than its items"""
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = self._START
+        self._key = ""
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Parses the next chunk of the body,
+        and returns the items it completed
+
+        Raises:
+            ValueError: The body is not a valid page
+        """
+        self._buffer += self._text.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Parses the end of the body, and returns
+        the fields of the page other than its items
+
+        Raises:
+            ValueError: The body is not a valid page
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        if self._parse(final=True) or self._state != self._DONE:
+            raise ValueError("Incomplete collection page")
+        return self.page
+
+    def _parse(self, final: bool) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = self._WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos == len(buffer) or self._state == self._DONE:
+                break
+            char = buffer[pos]
+            state = self._state
+            if state == self._START:
+                self._expect(char, "{")
+                self._state = self._KEY
+                pos += 1
+            elif state == self._KEY and char == "}":
+                self._state = self._DONE
+                pos += 1
+            elif state == self._COLON:
+                self._expect(char, ":")
+                self._state = self._ITEMS if self._key == "collection" else self._VALUE
+                pos += 1
+            elif state in (self._AFTER_VALUE, self._AFTER_ITEM):
+                if char == ",":
+                    self._state = (
+                        self._KEY if state == self._AFTER_VALUE else self._ITEM
+                    )
+                elif char == ("}" if state == self._AFTER_VALUE else "]"):
+                    self._state = (
+                        self._DONE if state == self._AFTER_VALUE else self._AFTER_VALUE
+                    )
+                else:
+                    raise ValueError(f"Unexpected {char!r} in collection page")
+                pos += 1
+            elif state == self._ITEMS:
+                self._expect(char, "[")
+                self._state = self._FIRST_ITEM
+                pos += 1
+            elif state == self._FIRST_ITEM and char == "]":
+                self._state = self._AFTER_VALUE
+                pos += 1
+            else:
+                # a key, a field value or an item
+                try:
+                    value, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                if not final and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+                    # a number may go on in the next chunk
+                    break
+                pos = end
+                if state == self._KEY:
+                    self._key = value
+                    self._state = self._COLON
+                elif state == self._VALUE:
+                    self.page[self._key] = value
+                    self._state = self._AFTER_VALUE
+                else:
+                    items.append(value)
+                    self._state = self._AFTER_ITEM
+        self._buffer = buffer[pos:]
+        return items
+
+    @staticmethod
+    def _expect(char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} in collection page, got {char!r}")
@@ -0,0 +1,309 @@
+"""
+Resumable pagination.
+
+Collections are returned as a `Paginator` (`AsyncPaginator` for the
+async client), which yields their resources like a generator and tells,
+as a `Cursor`, where the collection continues from. A cursor can be
+turned into a dict, e.g. to store it as JSON, and passed back as
+`cursor` to continue the collection from there, in another process.
+
+A `CursorJournal` checkpoints the cursor of a collection to a file each
+time a page is finished. Passed as `journal`, it makes the collection
+continue from its last checkpoint, so an interrupted crawl resumes
+without fetching the pages it finished again.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from soundcloud.client_id import _write_json
+
+__all__ = ["AsyncPaginator", "Cursor", "CursorJournal", "Paginator"]
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Position in a collection
+    """
+
+    url: Optional[str]
+    """Url of the page the position is in, or None
+    once the collection is finished"""
+    params: Dict[str, List[str]] = field(default_factory=dict)
+    """Query parameters of the page, without the client ID"""
+    skip: int = 0
+    """Number of resources of the page already yielded"""
+
+    @property
+    def done(self) -> bool:
+        """Whether the collection is finished"""
+        return self.url is None
+
+    def query(self, client_id: str) -> Dict[str, Any]:
+        """
+        Returns the query parameters to request the page with
+        """
+        return {**self.params, "client_id": [client_id]}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> "Cursor":
+        return cls(
+            d["url"],
+            {k: list(v) for k, v in d.get("params", {}).items()},
+            d.get("skip", 0),
+        )
+
+
+def _cursor_params(params: Mapping[str, Any]) -> Dict[str, List[str]]:
+    """
+    Returns query parameters as stored in a cursor
+    """
+    return {
+        k: [str(item) for item in (v if isinstance(v, (list, tuple)) else (v,))]
+        for k, v in params.items()
+        if k != "client_id" and v is not None
+    }
+
+
+class CursorJournal:
+    """
+    Cursor of a collection checkpointed to a file
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: Path of the file. Created on the first checkpoint.
+        """
+        self.path = path
+
+    def load(self) -> Optional[Cursor]:
+        """
+        Returns the last checkpointed cursor, or None if there is none
+
+        Raises:
+            ValueError: The file isn't a journal
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        try:
+            return Cursor.from_dict(data)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid cursor journal '{self.path}'") from e
+
+    def save(self, cursor: Cursor) -> None:
+        """
+        Checkpoints a cursor, replacing the previous one at once
+        """
+        _write_json(self.path, cursor.to_dict())
+
+
+class _Page(NamedTuple):
+    url: str
+    params: Mapping[str, Any]
+    collection: Any
+    """List of raw resources, or an iterator of those
+    parsed so far when the page is streamed"""
+    data: Optional[dict]
+    """Raw page, or None when it is streamed"""
+
+
+class _Position:
+    """
+    Tracks the position of a paginator and checkpoints it
+    """
+
+    def __init__(
+        self,
+        convert: Callable[[Any], Any],
+        next_page: Callable[[dict], Tuple[Optional[str], dict]],
+        start: Cursor,
+        journal: Optional[CursorJournal],
+    ) -> None:
+        self._convert = convert
+        self._next_page = next_page
+        self._journal = journal
+        self._url = start.url
+        self._params = start.params
+        self._skip = start.skip
+        # resources of the first page already yielded before resuming
+        self._to_skip = start.skip
+        self._page: Optional[_Page] = None
+
+    @property
+    def cursor(self) -> Cursor:
+        """
+        Where the collection continues from
+        """
+        return Cursor(self._url, self._params, self._skip)
+
+    def checkpoint(self) -> None:
+        """
+        Saves the cursor to the journal, if any. Called after each
+        page, and can be called after handling each resource to not
+        handle the resources of the current page again on resume.
+        """
+        if self._journal is not None:
+            self._journal.save(self.cursor)
+
+    def _finish_page(self) -> None:
+        page = self._page
+        if page is None:
+            return
+        # resources to skip are only on the first page
+        self._to_skip = 0
+        if page.data is not None:
+            url, params = self._next_page(page.data)
+            self._url, self._params, self._skip = url, _cursor_params(params), 0
+            self.checkpoint()
+        # streamed pages are checkpointed when the next one starts
+
+    def _start_page(self, page: _Page) -> None:
+        self._page = page
+        self._url, self._params = page.url, _cursor_params(page.params)
+        self._skip = self._to_skip
+        if page.data is None:
+            self.checkpoint()
+
+    def _finish(self) -> None:
+        if self._url is not None:
+            self._url, self._params, self._skip = None, {}, 0
+            self.checkpoint()
+
+
+class Paginator(_Position, Generator[T, None, None]):
+    """
+    Resources of a collection, yielded page after page.
+    `cursor` tells where the collection continues from.
+    """
+
+    def __init__(
+        self,
+        pages: Generator[_Page, None, None],
+        convert: Callable[[Any], T],
+        next_page: Callable[[dict], Tuple[Optional[str], dict]],
+        start: Cursor,
+        journal: Optional[CursorJournal] = None,
+    ) -> None:
+        super().__init__(convert, next_page, start, journal)
+        self._pages = pages
+        self._items: Iterator[Any] = iter(())
+
+    def send(self, value: None) -> T:
+        while True:
+            try:
+                resource = next(self._items)
+            except StopIteration:
+                self._finish_page()
+                try:
+                    page = next(self._pages)
+                except StopIteration:
+                    self._finish()
+                    raise
+                self._start_page(page)
+                self._items = iter(page.collection)
+                continue
+            if self._to_skip:
+                self._to_skip -= 1
+                continue
+            self._skip += 1
+            return self._convert(resource)
+
+    def throw(self, typ: Any, val: Any = None, tb: Any = None) -> T:
+        self.close()
+        if val is None:
+            val = typ() if isinstance(typ, type) else typ
+        raise val.with_traceback(tb)
+
+    def close(self) -> None:
+        """
+        Stops fetching pages
+        """
+        self._pages.close()
+
+
+class AsyncPaginator(_Position, AsyncGenerator[T, None]):
+    """
+    Async version of `Paginator`
+    """
+
+    def __init__(
+        self,
+        pages: AsyncGenerator[_Page, None],
+        convert: Callable[[Any], T],
+        next_page: Callable[[dict], Tuple[Optional[str], dict]],
+        start: Cursor,
+        journal: Optional[CursorJournal] = None,
+    ) -> None:
+        super().__init__(convert, next_page, start, journal)
+        self._pages = pages
+        self._items: Iterator[Any] = iter(())
+        self._async_items: Optional[AsyncIterator[Any]] = None
+
+    async def _next_resource(self) -> Any:
+        if self._async_items is not None:
+            return await self._async_items.__anext__()
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    async def asend(self, value: None) -> T:
+        while True:
+            try:
+                resource = await self._next_resource()
+            except StopAsyncIteration:
+                self._finish_page()
+                try:
+                    page = await self._pages.__anext__()
+                except StopAsyncIteration:
+                    self._finish()
+                    raise
+                self._start_page(page)
+                if page.data is None:
+                    self._async_items = page.collection
+                else:
+                    self._async_items = None
+                    self._items = iter(page.collection)
+                continue
+            if self._to_skip:
+                self._to_skip -= 1
+                continue
+            self._skip += 1
+            return self._convert(resource)
+
+    async def athrow(self, typ: Any, val: Any = None, tb: Any = None) -> T:
+        await self.aclose()
+        if val is None:
+            val = typ() if isinstance(typ, type) else typ
+        raise val.with_traceback(tb)
+
+    async def aclose(self) -> None:
+        """
+        Stops fetching pages
+        """
+        await self._pages.aclose()
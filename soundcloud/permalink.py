@@ -0,0 +1,189 @@
+"""
+Index of permalink URLs.
+
+A `PermalinkIndex` maps the permalink URLs of users, tracks and
+playlists to their kind and ID. Given to a client, it is filled with the
+permalink URLs of every user, track and playlist in the responses the
+client decodes, and `resolve_many` resolves the URLs it knows without
+requesting `/resolve`.
+"""
+
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+__all__ = ["Permalink", "PermalinkIndex", "normalize_url"]
+
+_KINDS = frozenset({"user", "track", "playlist"})
+_HOSTS = frozenset({"soundcloud.com", "www.soundcloud.com", "m.soundcloud.com"})
+# number of URLs looked up per query, below SQLite's limit on parameters
+_QUERY_SIZE = 500
+
+
+class Permalink(NamedTuple):
+    """
+    Resource a permalink URL leads to
+    """
+
+    kind: str
+    """One of user, track or playlist"""
+    id: int
+
+
+def normalize_url(url: str) -> str:
+    """
+    Returns a SoundCloud URL in the form of permalink URLs: with
+    the https scheme, the soundcloud.com host, a lowercase path, and
+    no query, fragment or trailing slash. Secret tokens keep their
+    case. URLs of other hosts are returned without surrounding spaces.
+    """
+    url = url.strip()
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    if parts.netloc.lower() not in _HOSTS:
+        return url
+    segments = parts.path.strip("/").split("/")
+    path = "/".join(
+        segment if i >= 2 and segment.startswith("s-") else segment.lower()
+        for i, segment in enumerate(segments)
+    )
+    return f"https://soundcloud.com/{path}"
+
+
+def _canonical_url(url: str) -> str:
+    # permalink URLs in responses are usually normalized already
+    if url.startswith("https://soundcloud.com/") and url.islower():
+        if not url.endswith("/") and "?" not in url and "#" not in url:
+            return url
+    return normalize_url(url)
+
+
+def _permalinks(data: Any) -> List[Tuple[str, Permalink]]:
+    """
+    Returns the permalink URLs of the users, tracks and playlists
+    in a JSON response, nested ones included. Only objects with a
+    kind, and the items of lists, are searched for nested ones.
+    """
+    found = []
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if type(item) is list:
+            stack.extend(v for v in item if type(v) is dict)
+            continue
+        if type(item) is not dict:
+            continue
+        if item.get("kind") in _KINDS:
+            url, id = item.get("permalink_url"), item.get("id")
+            if type(url) is str and type(id) is int:
+                found.append((_canonical_url(url), Permalink(item["kind"], id)))
+        for v in item.values():
+            if type(v) is dict:
+                if "kind" in v:
+                    stack.append(v)
+            elif type(v) is list and v and type(v[0]) is dict:
+                stack.append(v)
+    return found
+
+
+class PermalinkIndex:
+    """
+    Permalink URLs stored in an SQLite database, which can be shared
+    between processes. URLs added are written in batches.
+    """
+
+    def __init__(self, path: str, batch_size: int = 256) -> None:
+        """
+        Args:
+            path: Path of the database file. Created if it doesn't exist.
+            batch_size: Number of URLs added after which they are written.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Permalink] = {}
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS permalinks ("
+                "url TEXT PRIMARY KEY, kind TEXT, id INTEGER) WITHOUT ROWID"
+            )
+
+    def get(self, url: str) -> Optional[Permalink]:
+        """
+        Returns what the given URL leads to, or None if it isn't indexed
+        """
+        url = normalize_url(url)
+        return self.get_many([url]).get(url)
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, Permalink]:
+        """
+        Returns what the indexed URLs among the given
+        ones lead to, keyed by their normalized URL
+        """
+        found: Dict[str, Permalink] = {}
+        with self._lock:
+            rest = []
+            for url in dict.fromkeys(map(normalize_url, urls)):
+                permalink = self._pending.get(url)
+                if permalink is None:
+                    rest.append(url)
+                else:
+                    found[url] = permalink
+            for i in range(0, len(rest), _QUERY_SIZE):
+                chunk = rest[i : i + _QUERY_SIZE]
+                rows = self._db.execute(
+                    "SELECT url, kind, id FROM permalinks "
+                    f"WHERE url IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for url, kind, id in rows:
+                    found[url] = Permalink(kind, id)
+        return found
+
+    def add(self, url: str, permalink: Permalink) -> None:
+        """
+        Indexes what a URL leads to
+        """
+        self._add([(normalize_url(url), permalink)])
+
+    def _add(self, entries: Iterable[Tuple[str, Permalink]]) -> None:
+        with self._lock:
+            self._pending.update(entries)
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def _index(self, data: Any) -> None:
+        """
+        Indexes the permalink URLs in a JSON response
+        """
+        self._add(_permalinks(data))
+
+    def _flush(self) -> None:
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO permalinks VALUES (?, ?, ?)",
+                ((url, kind, id) for url, (kind, id) in self._pending.items()),
+            )
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """
+        Writes the URLs added
+        """
+        with self._lock:
+            self._flush()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush()
+            (count,) = self._db.execute("SELECT COUNT(*) FROM permalinks").fetchone()
+        return count
+
+    def close(self) -> None:
+        """
+        Writes the URLs added and closes the database
+        """
+        with self._lock:
+            self._flush()
+            self._db.close()
@@ -0,0 +1,183 @@
+"""
+Client-side rate limits.
+
+A rate limiter spaces out requests with a token bucket per endpoint
+family: `"api-v2"` for the v2 API, `"graphql"` for graph.soundcloud.com
+and `"media"` for audio downloaded from the CDN. Each request, retries
+included, takes a token from its family's bucket, waiting until one is
+available. Buckets refill at `Rate.per_second` and hold at most
+`Rate.burst` tokens. A waiting request reserves its token, so requests
+are served in order and the budget is used fully.
+
+`SQLiteRateLimiter` keeps its buckets in an SQLite database, so every
+process using the same file shares one budget.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Mapping, Tuple
+
+__all__ = [
+    "API_V2",
+    "GRAPHQL",
+    "MEDIA",
+    "MemoryRateLimiter",
+    "Rate",
+    "RateLimiter",
+    "SQLiteRateLimiter",
+]
+
+API_V2 = "api-v2"
+GRAPHQL = "graphql"
+MEDIA = "media"
+
+
+@dataclass(frozen=True)
+class Rate:
+    """
+    Rate of requests allowed for an endpoint family
+    """
+
+    per_second: float
+    """Tokens added to the bucket every second"""
+    burst: float = 1.0
+    """Tokens the bucket holds, i.e. requests which
+    can be sent at once after being idle"""
+
+    def __post_init__(self) -> None:
+        if self.per_second <= 0:
+            raise ValueError("per_second must be positive")
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+
+class RateLimiter(ABC):
+    """
+    Base class of rate limiters
+    """
+
+    def __init__(self, limits: Mapping[str, Rate]) -> None:
+        """
+        Args:
+            limits: Rates keyed by endpoint family, e.g.
+                `{API_V2: Rate(10, burst=20), GRAPHQL: Rate(2)}`.
+                Families without a rate are not limited.
+        """
+        self.limits: Dict[str, Rate] = dict(limits)
+
+    def reserve(self, family: str) -> float:
+        """
+        Takes a token from the bucket of an endpoint family,
+        and returns the seconds to wait before using it
+        """
+        rate = self.limits.get(family)
+        if rate is None:
+            return 0.0
+        return self._reserve(family, rate)
+
+    def acquire(self, family: str) -> None:
+        """
+        Waits for a token from the bucket of an endpoint family
+        """
+        delay = self.reserve(family)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, family: str) -> None:
+        """
+        Async version of `acquire`
+        """
+        delay = self.reserve(family)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @abstractmethod
+    def _reserve(self, family: str, rate: Rate) -> float:
+        """
+        Takes a token from the bucket of an endpoint family limited
+        to rate, and returns the seconds to wait before using it
+        """
+
+    @staticmethod
+    def _take(tokens: float, updated: float, rate: Rate) -> Tuple[float, float, float]:
+        """
+        Refills a bucket last updated at updated and takes a token from it.
+        Returns the tokens left, negative if tokens are owed, the time the
+        bucket was updated at, and the seconds to wait for the token taken.
+        """
+        now = max(time.time(), updated)
+        tokens = min(rate.burst, tokens + (now - updated) * rate.per_second) - 1
+        return tokens, now, max(0.0, -tokens / rate.per_second)
+
+
+class MemoryRateLimiter(RateLimiter):
+    """
+    Rate limiter shared by the threads of a process
+    """
+
+    def __init__(self, limits: Mapping[str, Rate]) -> None:
+        super().__init__(limits)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, family: str, rate: Rate) -> float:
+        with self._lock:
+            tokens, updated = self._buckets.get(family, (rate.burst, 0.0))
+            tokens, updated, delay = self._take(tokens, updated, rate)
+            self._buckets[family] = (tokens, updated)
+        return delay
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """
+    Rate limiter keeping its buckets in an SQLite database,
+    which can be shared between processes
+    """
+
+    def __init__(self, path: str, limits: Mapping[str, Rate]) -> None:
+        """
+        Args:
+            path: Path of the database file. Created if it doesn't exist.
+
+        See `RateLimiter` for the remaining arguments.
+        """
+        super().__init__(limits)
+        self.path = path
+        self._lock = threading.Lock()
+        # transactions are started explicitly, to lock the database
+        # while a bucket is read and updated
+        self._db = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "family TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+
+    def _reserve(self, family: str, rate: Rate) -> float:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT tokens, updated FROM buckets WHERE family = ?", (family,)
+                ).fetchone()
+                tokens, updated = row if row is not None else (rate.burst, 0.0)
+                tokens, updated, delay = self._take(tokens, updated, rate)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)",
+                    (family, tokens, updated),
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+        return delay
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -1,39 +1,82 @@
+import asyncio
+import hashlib
+import itertools
+import queue
 import string
-from dataclasses import asdict, dataclass
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from functools import partial
 import sys
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
     ClassVar,
+    Deque,
     Dict,
+    FrozenSet,
     Generator,
     Generic,
+    Iterable,
     List,
+    Mapping,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
 )
 
 import requests
+from dacite import UnionMatchError
 
+from soundcloud.cache import CachedResponse
+from soundcloud.json_backend import CollectionParser
+from soundcloud.pagination import (
+    AsyncPaginator,
+    Cursor,
+    CursorJournal,
+    Paginator,
+    _cursor_params,
+    _Page,
+)
+from soundcloud.rate_limit import API_V2, GRAPHQL, MEDIA
 from soundcloud.resource.aliases import Like, RepostItem, SearchItem, StreamItem
 from soundcloud.resource.base import BaseData
 from soundcloud.resource.comment import BasicComment, Comment
 from soundcloud.resource.conversation import Conversation
+from soundcloud.resource.decoder import (
+    DEFAULT_DECODER_CONFIG,
+    DecoderConfig,
+    IdentityMap,
+    get_union_decoder,
+)
 from soundcloud.resource.download import OriginalDownload
 from soundcloud.resource.graphql import UserInteraction
 from soundcloud.resource.history import HistoryItem
 from soundcloud.resource.message import Message
 from soundcloud.resource.playlist import AlbumPlaylist, BasicAlbumPlaylist
+from soundcloud.resource.projection import projection
 from soundcloud.resource.response import NoContentResponse
 from soundcloud.resource.track import BasicTrack, Track
 from soundcloud.resource.user import User, UserEmail
 from soundcloud.resource.web_profile import WebProfile
 
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
-    from soundcloud.soundcloud import SoundCloud
+    from soundcloud.async_soundcloud import AsyncSoundCloud
+    from soundcloud.soundcloud import SoundCloud, _SoundCloudBase
 
 if sys.version_info >= (3, 8):
     from typing import Protocol
@@ -51,24 +94,383 @@ except ImportError:
         return getattr(tp, "__origin__", None)
 
 
-from urllib.parse import parse_qs, urljoin, urlparse
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse
 
 
-def _convert_dict(d, return_type: Type[BaseData]):
+def _convert_dict(
+    d,
+    return_type: Type[BaseData],
+    config: DecoderConfig = DEFAULT_DECODER_CONFIG,
+    identity_map: Optional[IdentityMap] = None,
+):
+    if identity_map is not None:
+        with identity_map.active():
+            return _convert_dict(d, return_type, config)
     union = get_origin(return_type) is Union
     if union:
-        for t in get_args(return_type):
-            try:
-                return t.from_dict(d)
-            except Exception:
-                pass
+        try:
+            return get_union_decoder(return_type, config)(d)
+        except UnionMatchError:
+            pass
     else:
-        return return_type.from_dict(d)
+        return return_type.from_dict(d, config)
     raise ValueError(f"Could not convert {d} to type {return_type}")
 
 
+def _index_permalinks(client: "_SoundCloudBase", data: Any) -> None:
+    """
+    Adds the permalink URLs in a response to the client's index, if any
+    """
+    if client.permalink_index is not None:
+        client.permalink_index._index(data)
+
+
 T = TypeVar("T", bound=BaseData)
 
+_NOT_FOUND_STATUS_CODES = (400, 404, 500)
+# the API answers 500 for some missing resources, but a collection is
+# only missing on 400 or 404. 500 is retried on its pages instead, so
+# that a transient error doesn't end the collection or abort a crawl.
+_MISSING_PAGE_STATUS_CODES = (400, 404)
+_PAGE_RETRY_STATUSES = frozenset({500})
+# bytes of a streamed page read at once
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _encode_params(params: dict) -> List[Tuple[str, str]]:
+    # aiohttp is stricter than requests about query values, so
+    # flatten and stringify them the same way requests would
+    encoded = []
+    for k, v in params.items():
+        if v is None:
+            continue
+        for item in v if isinstance(v, (list, tuple)) else (v,):
+            encoded.append((k, str(item)))
+    return encoded
+
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+# responses telling the server is overloaded. 500 is left out, as the
+# API also answers it for some missing resources.
+_OVERLOADED_STATUS_CODES = (429, 502, 503, 504)
+
+
+def _client_id_param(params: Any) -> Optional[str]:
+    """
+    Returns the client ID in the query parameters of a request, given as
+    a dict, possibly with list values, or as a list of pairs
+    """
+    if isinstance(params, dict):
+        value = params.get("client_id")
+        if isinstance(value, list):
+            return value[0] if value else None
+        return value
+    for k, v in params or ():
+        if k == "client_id":
+            return v
+    return None
+
+
+def _with_client_id(params: Any, client_id: str) -> Any:
+    """
+    Returns query parameters with their client ID replaced
+    """
+    if isinstance(params, dict):
+        return {**params, "client_id": client_id}
+    return [(k, client_id if k == "client_id" else v) for k, v in params]
+
+
+def _request(
+    client: "SoundCloud", method: str, url: str, family: str, **kwargs
+) -> requests.Response:
+    """
+    Sends a request once the client's concurrency limiter, if any, allows it.
+    Requests to the CDN aren't limited, as their slot would be released
+    once the headers are received, long before a download finishes.
+    """
+    concurrency = client.concurrency_limiter
+    if concurrency is None or family == MEDIA:
+        return client.session.request(method, url, **kwargs)
+    started = concurrency.acquire()
+    ok = False
+    try:
+        r = client.session.request(method, url, **kwargs)
+        ok = r.status_code not in _OVERLOADED_STATUS_CODES
+        return r
+    finally:
+        concurrency.release(started, ok)
+
+
+async def _request_async(
+    client: "AsyncSoundCloud",
+    session: "aiohttp.ClientSession",
+    method: str,
+    url: str,
+    family: str,
+    **kwargs,
+) -> "aiohttp.ClientResponse":
+    """
+    Async version of `_request`
+    """
+    concurrency = client.concurrency_limiter
+    if concurrency is None or family == MEDIA:
+        return await session.request(method, url, **kwargs)
+    started = await concurrency.acquire_async()
+    ok = False
+    try:
+        r = await session.request(method, url, **kwargs)
+        ok = r.status not in _OVERLOADED_STATUS_CODES
+        return r
+    finally:
+        concurrency.release(started, ok)
+
+
+def _send(
+    client: "SoundCloud",
+    method: str,
+    url: str,
+    idempotent: Optional[bool] = None,
+    family: str = API_V2,
+    renew_client_id: bool = True,
+    retry_statuses: FrozenSet[int] = frozenset(),
+    **kwargs,
+) -> requests.Response:
+    """
+    Sends a request, retrying it as the client's retry policy says, and
+    on retry_statuses too. Every attempt waits for the client's rate
+    limiter, if any, using the limits of the given endpoint family.
+    A request answered with 401 is sent once more if the client renewed
+    its client ID in the meantime.
+    Returns the last response, which may still be an error.
+    """
+    limiter = client.rate_limiter
+    policy = client.retry_policy
+    if retry_statuses:
+        policy = replace(policy, statuses=policy.statuses | retry_statuses)
+    if idempotent is None:
+        idempotent = method in _IDEMPOTENT_METHODS
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire(family)
+        try:
+            r = _request(client, method, url, family, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if not policy.should_retry(attempt, None, idempotent):
+                if attempt > 0:
+                    client.retry_stats.record_exhausted()
+                raise
+            delay = policy.delay(attempt)
+            reason = type(e).__name__
+        else:
+            stale = _client_id_param(kwargs.get("params"))
+            if (
+                r.status_code == 401
+                and renew_client_id
+                and stale is not None
+                and client._renew_client_id(stale)
+            ):
+                r.close()
+                kwargs["params"] = _with_client_id(kwargs["params"], client.client_id)
+                renew_client_id = False
+                continue
+            retry = policy.should_retry(attempt, r.status_code, idempotent)
+            delay = policy.delay(attempt, r.headers.get("Retry-After"))
+            if not retry or delay is None:
+                if attempt > 0 and r.status_code in policy.statuses:
+                    client.retry_stats.record_exhausted()
+                return r
+            r.close()
+            reason = str(r.status_code)
+        client.retry_stats.record_retry(reason)
+        time.sleep(cast(float, delay))
+        attempt += 1
+
+
+async def _send_async(
+    client: "AsyncSoundCloud",
+    method: str,
+    url: str,
+    idempotent: Optional[bool] = None,
+    family: str = API_V2,
+    renew_client_id: bool = True,
+    retry_statuses: FrozenSet[int] = frozenset(),
+    **kwargs,
+) -> "aiohttp.ClientResponse":
+    """
+    Async version of `_send`
+    """
+    session = await client._get_session()
+    if _client_id_param(kwargs.get("params")) == "":
+        # the request was prepared before _get_session generated the client ID
+        kwargs["params"] = _with_client_id(kwargs["params"], client.client_id)
+    limiter = client.rate_limiter
+    policy = client.retry_policy
+    if retry_statuses:
+        policy = replace(policy, statuses=policy.statuses | retry_statuses)
+    if idempotent is None:
+        idempotent = method in _IDEMPOTENT_METHODS
+    attempt = 0
+    while True:
+        if limiter is not None:
+            await limiter.acquire_async(family)
+        try:
+            r = await _request_async(client, session, method, url, family, **kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if not policy.should_retry(attempt, None, idempotent):
+                if attempt > 0:
+                    client.retry_stats.record_exhausted()
+                raise
+            delay = policy.delay(attempt)
+            reason = type(e).__name__
+        else:
+            stale = _client_id_param(kwargs.get("params"))
+            if (
+                r.status == 401
+                and renew_client_id
+                and stale is not None
+                and await client._renew_client_id(stale)
+            ):
+                r.release()
+                kwargs["params"] = _with_client_id(kwargs["params"], client.client_id)
+                renew_client_id = False
+                continue
+            retry = policy.should_retry(attempt, r.status, idempotent)
+            delay = policy.delay(attempt, r.headers.get("Retry-After"))
+            if not retry or delay is None:
+                if attempt > 0 and r.status in policy.statuses:
+                    client.retry_stats.record_exhausted()
+                return r
+            r.release()
+            reason = str(r.status)
+        client.retry_stats.record_retry(reason)
+        await asyncio.sleep(cast(float, delay))
+        attempt += 1
+
+
+# track requested to check whether a client ID is valid
+_CHECK_TRACK_ID = 1032303631
+
+
+def _check_client_id(client: "SoundCloud", client_id: str) -> bool:
+    """
+    Returns whether the API accepts a client ID, reading only the
+    status of a request for a track
+    """
+    with _send(
+        client,
+        "GET",
+        f"{Request.base}/tracks/{_CHECK_TRACK_ID}",
+        renew_client_id=False,
+        params={"client_id": client_id},
+        headers=client._get_headers(False),
+    ) as r:
+        if r.status_code == 401:
+            return False
+        if r.status_code not in _NOT_FOUND_STATUS_CODES:
+            r.raise_for_status()
+        return True
+
+
+async def _check_client_id_async(client: "AsyncSoundCloud", client_id: str) -> bool:
+    """
+    Async version of `_check_client_id`
+    """
+    async with await _send_async(
+        client,
+        "GET",
+        f"{Request.base}/tracks/{_CHECK_TRACK_ID}",
+        renew_client_id=False,
+        params={"client_id": client_id},
+        headers=client._get_headers(False),
+    ) as r:
+        if r.status == 401:
+            return False
+        if r.status not in _NOT_FOUND_STATUS_CODES:
+            r.raise_for_status()
+        return True
+
+
+_DONE = object()
+
+
+def _prefetch(
+    pages: Generator[_Page, None, None], depth: int
+) -> Generator[_Page, None, None]:
+    """
+    Consumes pages in a background thread, buffering up to depth
+    of them ahead of the caller. Closing the returned generator
+    stops the thread after its current request.
+    """
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue(depth)
+    stop = threading.Event()
+
+    def put(item: Tuple[Any, Optional[BaseException]]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+            put((_DONE, None))
+        except BaseException as e:
+            put((None, e))
+        finally:
+            pages.close()
+
+    thread = threading.Thread(target=produce, name="soundcloud-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if error is not None:
+                raise error
+            if page is _DONE:
+                return
+            yield page
+    finally:
+        stop.set()
+
+
+async def _prefetch_async(
+    pages: AsyncGenerator[_Page, None], depth: int
+) -> AsyncGenerator[_Page, None]:
+    """
+    Async version of `_prefetch`, consuming pages in a separate task
+    """
+    buffer: "asyncio.Queue[Tuple[Any, Optional[BaseException]]]" = asyncio.Queue(depth)
+
+    async def produce() -> None:
+        try:
+            async for page in pages:
+                await buffer.put((page, None))
+            await buffer.put((_DONE, None))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await buffer.put((None, e))
+        finally:
+            await pages.aclose()
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if error is not None:
+                raise error
+            if page is _DONE:
+                return
+            yield page
+    finally:
+        task.cancel()
+
 
 @dataclass
 class Request(Generic[T]):
@@ -89,37 +491,244 @@ class Request(Generic[T]):
                 args[k] = kwargs.pop(k)
         return self.base + self.format_url.format(**args)
 
+    def _prepare(
+        self, client: "_SoundCloudBase", use_auth: bool, kwargs: dict
+    ) -> Tuple[str, dict, Dict[str, str]]:
+        """
+        Returns the url, query parameters and headers
+        to request the resource with
+        """
+        resource_url = self._format_url_and_remove_params(kwargs)
+        params = kwargs
+        params["client_id"] = client.client_id
+        return resource_url, params, client._get_headers(use_auth)
+
+    def _cache_key(
+        self, client: "_SoundCloudBase", url: str, params: dict, headers: dict
+    ) -> Optional[str]:
+        """
+        Returns the key to cache the response under,
+        or None if it shouldn't be cached
+        """
+        cache = client.cache
+        if (
+            cache is None
+            or self.method != "GET"
+            or cache.ttl_for(self.format_url, 200) <= 0
+        ):
+            return None
+        query = urlencode(
+            sorted(
+                (k, v) for k, v in params.items() if k != "client_id" and v is not None
+            ),
+            doseq=True,
+        )
+        # responses to authenticated requests are specific to the user
+        authorization = headers.get("Authorization")
+        scope = (
+            hashlib.sha256(authorization.encode()).hexdigest()[:16]
+            if authorization
+            else ""
+        )
+        return f"{scope}|{url}?{query}"
+
+    def _lookup(
+        self, client: "_SoundCloudBase", key: Optional[str], headers: dict
+    ) -> Optional[CachedResponse]:
+        """
+        Returns the cached response under key, if it is fresh or can be
+        revalidated. Adds the headers to revalidate it with to headers.
+        """
+        if key is None or client.cache is None:
+            return None
+        cached = client.cache.get(key)
+        if cached is None or cached.fresh:
+            return cached
+        if not cached.revalidatable:
+            return None
+        if cached.etag is not None:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified is not None:
+            headers["If-Modified-Since"] = cached.last_modified
+        return cached
+
+    def _revalidated(
+        self, client: "_SoundCloudBase", key: str, cached: CachedResponse
+    ) -> Any:
+        """
+        Restarts the TTL of a cached response the server confirmed
+        is still valid, and returns its data
+        """
+        if client.cache is not None:
+            client.cache.set(key, client.cache.refreshed(self.format_url, cached))
+        return self._cached_data(client, cached)
+
+    @staticmethod
+    def _cached_data(client: "_SoundCloudBase", cached: CachedResponse) -> Any:
+        """
+        Returns the data of a cached response, or None for cached 404s
+        """
+        if cached.status == 404:
+            return None
+        return client.json_backend.loads(cached.body)
+
+    def _store(
+        self,
+        client: "_SoundCloudBase",
+        key: Optional[str],
+        status_code: int,
+        body: bytes,
+        headers: Mapping[str, str],
+    ) -> None:
+        cache = client.cache
+        if key is None or cache is None or status_code not in (200, 404):
+            return
+        if cache.ttl_for(self.format_url, status_code) <= 0:
+            return
+        cache.set(key, cache.response(self.format_url, status_code, body, headers))
+
+    def _resource_type(self, fields: Optional[Sequence[str]]) -> Any:
+        """
+        Returns the type to convert resources to,
+        projected onto the given fields if any
+        """
+        if fields:
+            return projection(self.return_type, fields)
+        return self.return_type
+
+    def _convert_response(
+        self,
+        client: "_SoundCloudBase",
+        status_code: int,
+        data: Any,
+        config: Optional[DecoderConfig] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[T]:
+        if self.return_type == NoContentResponse:
+            return NoContentResponse(status_code)  # type: ignore[return-value]
+        _index_permalinks(client, data)
+        return _convert_dict(
+            data,
+            self._resource_type(fields),
+            config or client.decoder_config,
+            client.identity_map,
+        )
+
     def __call__(
         self,
         client: "SoundCloud",
         use_auth: bool = True,
         body: Optional[dict] = None,
+        decoder_config: Optional[DecoderConfig] = None,
+        fields: Optional[Sequence[str]] = None,
         **kwargs,
     ) -> Optional[T]:
         """
         Requests the resource at the given url with
         parameters given by kwargs. Converts the resource
         to type T and returns it. If the
-        resource does not exist, returns None
+        resource does not exist, returns None.
+        decoder_config overrides the client's decoder config.
         """
-        resource_url = self._format_url_and_remove_params(kwargs)
-        params = kwargs
-        params["client_id"] = client.client_id
-        headers = client._get_default_headers()
-
-        if use_auth and client._authorization is not None:
-            headers["Authorization"] = client._authorization
-
-        with requests.request(
-            self.method, resource_url, json=body, headers=headers, params=params
+        resource_url, params, headers = self._prepare(client, use_auth, kwargs)
+        key = self._cache_key(client, resource_url, params, headers)
+        cached = self._lookup(client, key, headers)
+        if cached is not None and cached.fresh:
+            data = self._cached_data(client, cached)
+            return (
+                None
+                if data is None
+                else self._convert_response(client, 200, data, decoder_config, fields)
+            )
+        with _send(
+            client,
+            self.method,
+            resource_url,
+            json=body,
+            headers=headers,
+            params=params,
         ) as r:
-            if r.status_code in (400, 404, 500):
+            if r.status_code == 304 and key is not None and cached is not None:
+                data = self._revalidated(client, key, cached)
+                return (
+                    None
+                    if data is None
+                    else self._convert_response(
+                        client, 200, data, decoder_config, fields
+                    )
+                )
+            if r.status_code in _NOT_FOUND_STATUS_CODES:
+                self._store(client, key, r.status_code, b"", r.headers)
                 return None
             r.raise_for_status()
 
         if self.return_type == NoContentResponse:
-            return NoContentResponse(r.status_code)  # type: ignore[return-value]
-        return _convert_dict(r.json(), self.return_type)
+            return self._convert_response(
+                client, r.status_code, None, decoder_config, fields
+            )
+        resource = self._convert_response(
+            client,
+            r.status_code,
+            client.json_backend.loads(r.content),
+            decoder_config,
+            fields,
+        )
+        self._store(client, key, r.status_code, r.content, r.headers)
+        return resource
+
+    async def call_async(
+        self,
+        client: "AsyncSoundCloud",
+        use_auth: bool = True,
+        body: Optional[dict] = None,
+        decoder_config: Optional[DecoderConfig] = None,
+        fields: Optional[Sequence[str]] = None,
+        **kwargs,
+    ) -> Optional[T]:
+        """
+        Async version of `__call__`
+        """
+        resource_url, params, headers = self._prepare(client, use_auth, kwargs)
+        key = self._cache_key(client, resource_url, params, headers)
+        cached = self._lookup(client, key, headers)
+        if cached is not None and cached.fresh:
+            data = self._cached_data(client, cached)
+            return (
+                None
+                if data is None
+                else self._convert_response(client, 200, data, decoder_config, fields)
+            )
+        async with await _send_async(
+            client,
+            self.method,
+            resource_url,
+            json=body,
+            headers=headers,
+            params=_encode_params(params),
+        ) as r:
+            if r.status == 304 and key is not None and cached is not None:
+                data = self._revalidated(client, key, cached)
+                return (
+                    None
+                    if data is None
+                    else self._convert_response(
+                        client, 200, data, decoder_config, fields
+                    )
+                )
+            if r.status in _NOT_FOUND_STATUS_CODES:
+                self._store(client, key, r.status, b"", r.headers)
+                return None
+            r.raise_for_status()
+            if self.return_type == NoContentResponse:
+                return self._convert_response(
+                    client, r.status, None, decoder_config, fields
+                )
+            content = await r.read()
+        resource = self._convert_response(
+            client, r.status, client.json_backend.loads(content), decoder_config, fields
+        )
+        self._store(client, key, r.status, content, r.headers)
+        return resource
 
 
 @dataclass
@@ -130,40 +739,523 @@ class CollectionRequest(Request, Generic[T]):
     to type T before yielding
     """
 
+    def _prepare_collection(
+        self,
+        client: "_SoundCloudBase",
+        use_auth: bool,
+        offset: Optional[str],
+        limit: Optional[int],
+        kwargs: dict,
+    ) -> Tuple[str, dict, Dict[str, str]]:
+        resource_url, params, headers = self._prepare(client, use_auth, kwargs)
+        if offset is not None:
+            params["offset"] = offset
+        if limit is not None:
+            params["limit"] = limit
+        return resource_url, params, headers
+
+    @staticmethod
+    def _next_page(client: "_SoundCloudBase", data: dict) -> Tuple[Optional[str], dict]:
+        """
+        Returns the url and query parameters of the page after
+        the given page, or None if it is the last page
+        """
+        next_href = data.get("next_href")
+        if not next_href:
+            return None, {}
+        parsed = urlparse(next_href)
+        params: Dict[str, Any] = parse_qs(parsed.query)
+        params["client_id"] = [client.client_id]  # next_href doesn't contain client_id
+        return urljoin(next_href, parsed.path), params
+
+    @staticmethod
+    def _offset_plan(
+        client: "_SoundCloudBase",
+        data: dict,
+        offset: Optional[str],
+        total: Optional[int],
+    ) -> Optional[Tuple[str, dict, range]]:
+        """
+        Returns the url, query parameters and offsets of the pages after
+        the given first page if the collection is paginated by numeric
+        offsets and its total size is known, otherwise None
+        """
+        url, params = CollectionRequest._next_page(client, data)
+        if url is None:
+            return None
+        next_offset = params.get("offset", [""])[0]
+        if not next_offset.isdigit():
+            # opaque cursor, pages can only be followed one by one
+            return None
+        if total is None:
+            total = data.get("total_results")
+            if total is None:
+                return None
+        start = int(offset) if offset is not None and str(offset).isdigit() else 0
+        step = int(next_offset) - start
+        if step <= 0:
+            return None
+        # the server may cap the requested limit, so use its page size
+        params["limit"] = [str(step)]
+        return url, params, range(int(next_offset), total, step)
+
+    @staticmethod
+    def _check_stream(stream: bool, prefetch: int, concurrency: int) -> None:
+        if stream and (prefetch > 0 or concurrency > 0):
+            raise ValueError("stream can't be combined with prefetch or concurrency")
+
+    def _start(
+        self,
+        client: "_SoundCloudBase",
+        use_auth: bool,
+        offset: Optional[str],
+        limit: Optional[int],
+        cursor: Optional[Cursor],
+        journal: Optional[CursorJournal],
+        kwargs: dict,
+    ) -> Tuple[Optional[str], dict, Dict[str, str], Cursor]:
+        """
+        Returns the url, query parameters and headers of the first page
+        to request, and the cursor of the position to start from
+        """
+        url, params, headers = self._prepare_collection(
+            client, use_auth, offset, limit, kwargs
+        )
+        if cursor is None and journal is not None:
+            cursor = journal.load()
+        if cursor is None:
+            return url, params, headers, Cursor(url, _cursor_params(params))
+        return cursor.url, cursor.query(client.client_id), headers, cursor
+
+    def _converter(
+        self,
+        client: "_SoundCloudBase",
+        decoder_config: Optional[DecoderConfig],
+        fields: Optional[Sequence[str]],
+        identity_map: Optional[IdentityMap],
+    ) -> Callable[[Any], T]:
+        """
+        Returns the function converting the
+        raw resources of the collection
+        """
+        convert = partial(
+            _convert_dict,
+            return_type=self._resource_type(fields),
+            config=decoder_config or client.decoder_config,
+            identity_map=client.identity_map if identity_map is None else identity_map,
+        )
+        if client.permalink_index is None:
+            return convert
+
+        def convert_indexed(resource: Any) -> T:
+            _index_permalinks(client, resource)
+            return convert(resource)
+
+        return convert_indexed
+
+    @staticmethod
+    def _with_offset(params: dict, offset: int) -> dict:
+        params = dict(params)
+        params["offset"] = [str(offset)]
+        return params
+
+    def _get_page(
+        self,
+        client: "SoundCloud",
+        url: str,
+        params: dict,
+        headers: Dict[str, str],
+        missing_ok: bool = True,
+    ) -> Optional[dict]:
+        """
+        Returns a raw page, or None if it doesn't exist and missing_ok
+        """
+        with _send(
+            client,
+            "GET",
+            url,
+            retry_statuses=_PAGE_RETRY_STATUSES,
+            params=params,
+            headers=headers,
+        ) as r:
+            if missing_ok and r.status_code in _MISSING_PAGE_STATUS_CODES:
+                return None
+            r.raise_for_status()
+            return client.json_backend.loads(r.content)
+
+    def _follow(
+        self,
+        client: "SoundCloud",
+        url: Optional[str],
+        params: dict,
+        headers: Dict[str, str],
+        missing_ok: bool = True,
+    ) -> Generator[_Page, None, None]:
+        """
+        Yields the pages of the collection, following next_href.
+        Pages after the first one must exist, so that a collection
+        is never cut short by an error.
+        """
+        while url:
+            data = self._get_page(client, url, params, headers, missing_ok)
+            if data is None:
+                return
+            yield _Page(url, params, data["collection"], data)
+            url, params = self._next_page(client, data)
+            missing_ok = False
+
+    def _stream(
+        self,
+        client: "SoundCloud",
+        url: Optional[str],
+        params: dict,
+        headers: Dict[str, str],
+    ) -> Generator[_Page, None, None]:
+        """
+        Yields the pages of the collection, following next_href.
+        The resources of each page are yielded as soon as they
+        are parsed from the response body.
+        """
+        missing_ok = True
+        while url:
+            parser = CollectionParser()
+            with _send(
+                client,
+                "GET",
+                url,
+                retry_statuses=_PAGE_RETRY_STATUSES,
+                params=params,
+                headers=headers,
+                stream=True,
+            ) as r:
+                if missing_ok and r.status_code in _MISSING_PAGE_STATUS_CODES:
+                    return
+                r.raise_for_status()
+                chunks = r.iter_content(_STREAM_CHUNK_SIZE)
+                yield _Page(url, params, self._parsed(chunks, parser), None)
+            url, params = self._next_page(client, parser.close())
+            missing_ok = False
+
+    @staticmethod
+    def _parsed(
+        chunks: Iterable[bytes], parser: CollectionParser
+    ) -> Generator[Any, None, None]:
+        for chunk in chunks:
+            yield from parser.feed(chunk)
+
+    def _fan_out(
+        self,
+        client: "SoundCloud",
+        url: str,
+        params: dict,
+        headers: Dict[str, str],
+        offset: Optional[str],
+        total: Optional[int],
+        concurrency: int,
+    ) -> Generator[_Page, None, None]:
+        """
+        Yields the pages of the collection, fetching up to
+        concurrency pages at once when their offsets can be computed
+        from the first page. Falls back to following next_href.
+        Pages after the first one must exist, as in `_follow`.
+        """
+        data = self._get_page(client, url, params, headers)
+        if data is None:
+            return
+        yield _Page(url, params, data["collection"], data)
+        plan = self._offset_plan(client, data, offset, total)
+        if plan is not None:
+            url, params, offsets = plan
+            executor = ThreadPoolExecutor(concurrency)
+            window: Deque[Tuple[dict, Future]] = deque()
+            pending = iter(offsets)
+
+            def submit(page_offset: int) -> None:
+                page_params = self._with_offset(params, page_offset)
+                window.append(
+                    (
+                        page_params,
+                        executor.submit(
+                            self._get_page,
+                            client,
+                            url,
+                            page_params,
+                            headers,
+                            missing_ok=False,
+                        ),
+                    )
+                )
+
+            try:
+                for page_offset in itertools.islice(pending, concurrency):
+                    submit(page_offset)
+                while window:
+                    page_params, future = window.popleft()
+                    data = future.result()
+                    if not data["collection"]:
+                        # the total was an overestimate
+                        return
+                    for page_offset in itertools.islice(pending, 1):
+                        submit(page_offset)
+                    yield _Page(url, page_params, data["collection"], data)
+            finally:
+                for _, future in window:
+                    future.cancel()
+                executor.shutdown(wait=False)
+        # items added past the known total, or cursor pagination
+        next_url, params = self._next_page(client, data)
+        yield from self._follow(client, next_url, params, headers, missing_ok=False)
+
     def __call__(
         self,
         client: "SoundCloud",
         use_auth: bool = True,
         body: Optional[dict] = None,
+        decoder_config: Optional[DecoderConfig] = None,
+        fields: Optional[Sequence[str]] = None,
         offset: Optional[str] = None,
         limit: Optional[int] = None,
+        prefetch: int = 0,
+        concurrency: int = 0,
+        total: Optional[int] = None,
+        identity_map: Optional[IdentityMap] = None,
+        stream: bool = False,
+        cursor: Optional[Cursor] = None,
+        journal: Optional[CursorJournal] = None,
         **kwargs,
-    ) -> Generator[T, None, None]:
-        resource_url = self._format_url_and_remove_params(kwargs)
-        params = kwargs
-        params["client_id"] = client.client_id
-        if offset is not None:
-            params["offset"] = offset
-        if limit is not None:
-            params["limit"] = limit
-        headers = client._get_default_headers()
-        if use_auth and client._authorization is not None:
-            headers["Authorization"] = client._authorization
-        while resource_url:
-            with requests.get(resource_url, params=params, headers=headers) as r:
-                if r.status_code in (400, 404, 500):
+    ) -> Paginator[T]:
+        """
+        Yields the resources of every page. If prefetch is positive,
+        up to that many following pages are fetched in a background
+        thread while the current page is consumed.
+
+        If concurrency is positive and the collection is paginated by
+        numeric offsets, the offsets of all pages are computed from the
+        first page and up to that many pages are fetched at once.
+        This needs the size of the collection, given as total (e.g.
+        `User.followers_count`) or reported by the endpoint. Resources
+        are still yielded in order.
+
+        If stream is True, each page is parsed as its body is received,
+        and its resources are yielded as soon as they are complete.
+        This lowers the time to the first resource and the memory taken
+        by large pages, but can't be combined with prefetch or concurrency.
+
+        decoder_config and identity_map override the client's
+        for the resources of this collection.
+
+        The returned paginator tells where the collection continues
+        from as its `cursor`. Given a cursor, the collection continues
+        from it, with the other parameters it was fetched with. Given a
+        journal, the cursor is checkpointed to it after each page, and
+        the collection continues from its last checkpoint.
+
+        Raises:
+            ValueError: stream is combined with prefetch or concurrency
+        """
+        self._check_stream(stream, prefetch, concurrency)
+        url, params, headers, start = self._start(
+            client, use_auth, offset, limit, cursor, journal, kwargs
+        )
+        # offset of the first page, from which the others are computed
+        offset = start.params.get("offset", [None])[0]
+        pages: Generator[_Page, None, None]
+        if stream:
+            pages = self._stream(client, url, params, headers)
+        elif concurrency > 0 and url is not None:
+            pages = self._fan_out(
+                client, url, params, headers, offset, total, concurrency
+            )
+        else:
+            pages = self._follow(client, url, params, headers)
+        if prefetch > 0:
+            pages = _prefetch(pages, prefetch)
+        return Paginator(
+            pages,
+            self._converter(client, decoder_config, fields, identity_map),
+            partial(self._next_page, client),
+            start,
+            journal,
+        )
+
+    async def _get_page_async(
+        self,
+        client: "AsyncSoundCloud",
+        url: str,
+        params: dict,
+        headers: Dict[str, str],
+        missing_ok: bool = True,
+    ) -> Optional[dict]:
+        async with await _send_async(
+            client,
+            "GET",
+            url,
+            retry_statuses=_PAGE_RETRY_STATUSES,
+            params=_encode_params(params),
+            headers=headers,
+        ) as r:
+            if missing_ok and r.status in _MISSING_PAGE_STATUS_CODES:
+                return None
+            r.raise_for_status()
+            return client.json_backend.loads(await r.read())
+
+    async def _follow_async(
+        self,
+        client: "AsyncSoundCloud",
+        url: Optional[str],
+        params: dict,
+        headers: Dict[str, str],
+        missing_ok: bool = True,
+    ) -> AsyncGenerator[_Page, None]:
+        """
+        Async version of `_follow`
+        """
+        while url:
+            data = await self._get_page_async(client, url, params, headers, missing_ok)
+            if data is None:
+                return
+            yield _Page(url, params, data["collection"], data)
+            url, params = self._next_page(client, data)
+            missing_ok = False
+
+    async def _stream_async(
+        self,
+        client: "AsyncSoundCloud",
+        url: Optional[str],
+        params: dict,
+        headers: Dict[str, str],
+    ) -> AsyncGenerator[_Page, None]:
+        """
+        Async version of `_stream`
+        """
+        missing_ok = True
+        while url:
+            parser = CollectionParser()
+            async with await _send_async(
+                client,
+                "GET",
+                url,
+                retry_statuses=_PAGE_RETRY_STATUSES,
+                params=_encode_params(params),
+                headers=headers,
+            ) as r:
+                if missing_ok and r.status in _MISSING_PAGE_STATUS_CODES:
                     return
                 r.raise_for_status()
-                data = r.json()
-                for resource in data["collection"]:
-                    yield _convert_dict(resource, self.return_type)
-                resource_url = data.get("next_href", None)
-                parsed = urlparse(resource_url)
-                params = parse_qs(parsed.query)
-                params["client_id"] = [
-                    client.client_id
-                ]  # next_href doesn't contain client_id
-                resource_url = urljoin(resource_url, parsed.path)
+                chunks = r.content.iter_chunked(_STREAM_CHUNK_SIZE)
+                yield _Page(url, params, self._parsed_async(chunks, parser), None)
+            url, params = self._next_page(client, parser.close())
+            missing_ok = False
+
+    @staticmethod
+    async def _parsed_async(
+        chunks: AsyncIterator[bytes], parser: CollectionParser
+    ) -> AsyncGenerator[Any, None]:
+        async for chunk in chunks:
+            for resource in parser.feed(chunk):
+                yield resource
+
+    async def _fan_out_async(
+        self,
+        client: "AsyncSoundCloud",
+        url: str,
+        params: dict,
+        headers: Dict[str, str],
+        offset: Optional[str],
+        total: Optional[int],
+        concurrency: int,
+    ) -> AsyncGenerator[_Page, None]:
+        """
+        Async version of `_fan_out`
+        """
+        data = await self._get_page_async(client, url, params, headers)
+        if data is None:
+            return
+        yield _Page(url, params, data["collection"], data)
+        plan = self._offset_plan(client, data, offset, total)
+        if plan is not None:
+            url, params, offsets = plan
+            window: Deque[Tuple[dict, asyncio.Future]] = deque()
+            pending = iter(offsets)
+
+            def submit(page_offset: int) -> None:
+                page_params = self._with_offset(params, page_offset)
+                window.append(
+                    (
+                        page_params,
+                        asyncio.ensure_future(
+                            self._get_page_async(
+                                client, url, page_params, headers, missing_ok=False
+                            )
+                        ),
+                    )
+                )
+
+            try:
+                for page_offset in itertools.islice(pending, concurrency):
+                    submit(page_offset)
+                while window:
+                    page_params, task = window.popleft()
+                    data = await task
+                    if not data["collection"]:
+                        return
+                    for page_offset in itertools.islice(pending, 1):
+                        submit(page_offset)
+                    yield _Page(url, page_params, data["collection"], data)
+            finally:
+                for _, task in window:
+                    task.cancel()
+        next_url, params = self._next_page(client, data)
+        async for page in self._follow_async(
+            client, next_url, params, headers, missing_ok=False
+        ):
+            yield page
+
+    def iter_async(
+        self,
+        client: "AsyncSoundCloud",
+        use_auth: bool = True,
+        body: Optional[dict] = None,
+        decoder_config: Optional[DecoderConfig] = None,
+        fields: Optional[Sequence[str]] = None,
+        offset: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: int = 0,
+        concurrency: int = 0,
+        total: Optional[int] = None,
+        identity_map: Optional[IdentityMap] = None,
+        stream: bool = False,
+        cursor: Optional[Cursor] = None,
+        journal: Optional[CursorJournal] = None,
+        **kwargs,
+    ) -> AsyncPaginator[T]:
+        """
+        Async version of `__call__`. Pages are prefetched
+        in a separate task instead of a thread.
+        """
+        self._check_stream(stream, prefetch, concurrency)
+        url, params, headers, start = self._start(
+            client, use_auth, offset, limit, cursor, journal, kwargs
+        )
+        offset = start.params.get("offset", [None])[0]
+        pages: AsyncGenerator[_Page, None]
+        if stream:
+            pages = self._stream_async(client, url, params, headers)
+        elif concurrency > 0 and url is not None:
+            pages = self._fan_out_async(
+                client, url, params, headers, offset, total, concurrency
+            )
+        else:
+            pages = self._follow_async(client, url, params, headers)
+        if prefetch > 0:
+            pages = _prefetch_async(pages, prefetch)
+        return AsyncPaginator(
+            pages,
+            self._converter(client, decoder_config, fields, identity_map),
+            partial(self._next_page, client),
+            start,
+            journal,
+        )
 
 
 @dataclass
@@ -175,22 +1267,90 @@ class ListRequest(Request, Generic[T]):
     """
 
     def __call__(
-        self, client: "SoundCloud", use_auth=True, body: Optional[dict] = None, **kwargs
+        self,
+        client: "SoundCloud",
+        use_auth=True,
+        body: Optional[dict] = None,
+        decoder_config: Optional[DecoderConfig] = None,
+        fields: Optional[Sequence[str]] = None,
+        **kwargs,
     ) -> List[T]:
-        resource_url = self._format_url_and_remove_params(kwargs)
-        params = kwargs
-        params["client_id"] = client.client_id
-        headers = client._get_default_headers()
-        if use_auth and client._authorization is not None:
-            headers["Authorization"] = client._authorization
-        resources = []
-        with requests.get(resource_url, params=params, headers=headers) as r:
-            if r.status_code in (400, 404, 500):
-                return []
-            r.raise_for_status()
-            for resource in r.json():
-                resources.append(_convert_dict(resource, self.return_type))
-        return resources
+        resource_url, params, headers = self._prepare(client, use_auth, kwargs)
+        return_type = self._resource_type(fields)
+        key = self._cache_key(client, resource_url, params, headers)
+        cached = self._lookup(client, key, headers)
+        if cached is not None and cached.fresh:
+            data = self._cached_data(client, cached) or []
+        else:
+            with _send(
+                client, "GET", resource_url, params=params, headers=headers
+            ) as r:
+                if r.status_code == 304 and key is not None and cached is not None:
+                    data = self._revalidated(client, key, cached) or []
+                elif r.status_code in _NOT_FOUND_STATUS_CODES:
+                    self._store(client, key, r.status_code, b"", r.headers)
+                    return []
+                else:
+                    r.raise_for_status()
+                    data = client.json_backend.loads(r.content)
+                    self._store(client, key, r.status_code, r.content, r.headers)
+        _index_permalinks(client, data)
+        return [
+            _convert_dict(
+                resource,
+                return_type,
+                decoder_config or client.decoder_config,
+                client.identity_map,
+            )
+            for resource in data
+        ]
+
+    async def call_async(
+        self,
+        client: "AsyncSoundCloud",
+        use_auth=True,
+        body: Optional[dict] = None,
+        decoder_config: Optional[DecoderConfig] = None,
+        fields: Optional[Sequence[str]] = None,
+        **kwargs,
+    ) -> List[T]:
+        """
+        Async version of `__call__`
+        """
+        resource_url, params, headers = self._prepare(client, use_auth, kwargs)
+        return_type = self._resource_type(fields)
+        key = self._cache_key(client, resource_url, params, headers)
+        cached = self._lookup(client, key, headers)
+        if cached is not None and cached.fresh:
+            data = self._cached_data(client, cached) or []
+        else:
+            async with await _send_async(
+                client,
+                "GET",
+                resource_url,
+                params=_encode_params(params),
+                headers=headers,
+            ) as r:
+                if r.status == 304 and key is not None and cached is not None:
+                    data = self._revalidated(client, key, cached) or []
+                elif r.status in _NOT_FOUND_STATUS_CODES:
+                    self._store(client, key, r.status, b"", r.headers)
+                    return []
+                else:
+                    r.raise_for_status()
+                    content = await r.read()
+                    data = client.json_backend.loads(content)
+                    self._store(client, key, r.status, content, r.headers)
+        _index_permalinks(client, data)
+        return [
+            _convert_dict(
+                resource,
+                return_type,
+                decoder_config or client.decoder_config,
+                client.identity_map,
+            )
+            for resource in data
+        ]
 
 
 class DataclassInstance(Protocol):
@@ -208,30 +1368,82 @@ class GraphQLRequest(Generic[Q, T]):
     return_type: Type[T]
     query_template_str: str
 
-    def __call__(
-        self,
-        client: "SoundCloud",
-        query_args: Q,
-        use_auth=True,
-    ) -> Optional[T]:
+    def _prepare(
+        self, client: "_SoundCloudBase", query_args: Q, use_auth: bool
+    ) -> Tuple[dict, dict, Dict[str, str]]:
+        """
+        Returns the body, query parameters and headers to send the query with
+        """
         params = {}
         params["client_id"] = client.client_id
-        headers = client._get_default_headers()
+        headers = client._get_headers(use_auth)
         headers["Apollographql-Client-Name"] = "v2"
-        if use_auth and client._authorization is not None:
-            headers["Authorization"] = client._authorization
 
         data = {
             "operationName": self.operation_name,
             "query": self.query_template_str,
             "variables": asdict(query_args),
         }
+        return data, params, headers
 
-        with requests.post(self.base, json=data, params=params, headers=headers) as r:
-            if r.status_code in (400, 404, 500):
+    def __call__(
+        self,
+        client: "SoundCloud",
+        query_args: Q,
+        use_auth=True,
+    ) -> Optional[T]:
+        data, params, headers = self._prepare(client, query_args, use_auth)
+        # queries don't change anything, so they are safe to retry
+        with _send(
+            client,
+            "POST",
+            self.base,
+            idempotent=True,
+            family=GRAPHQL,
+            json=data,
+            params=params,
+            headers=headers,
+        ) as r:
+            if r.status_code in _NOT_FOUND_STATUS_CODES:
+                return None
+            r.raise_for_status()
+            return _convert_dict(
+                client.json_backend.loads(r.content)["data"],
+                self.return_type,
+                client.decoder_config,
+                client.identity_map,
+            )
+
+    async def call_async(
+        self,
+        client: "AsyncSoundCloud",
+        query_args: Q,
+        use_auth=True,
+    ) -> Optional[T]:
+        """
+        Async version of `__call__`
+        """
+        data, params, headers = self._prepare(client, query_args, use_auth)
+        async with await _send_async(
+            client,
+            "POST",
+            self.base,
+            idempotent=True,
+            family=GRAPHQL,
+            json=data,
+            params=_encode_params(params),
+            headers=headers,
+        ) as r:
+            if r.status in _NOT_FOUND_STATUS_CODES:
                 return None
             r.raise_for_status()
-            return _convert_dict(r.json()["data"], self.return_type)
+            result = client.json_backend.loads(await r.read())
+        return _convert_dict(
+            result["data"],
+            self.return_type,
+            client.decoder_config,
+            client.identity_map,
+        )
 
 
 """
@@ -1,6 +1,7 @@
 from soundcloud.resource.aliases import Like, RepostItem, SearchItem, StreamItem
 from soundcloud.resource.comment import BasicComment, Comment, CommentSelf
 from soundcloud.resource.conversation import Conversation
+from soundcloud.resource.decoder import DecoderConfig, IdentityMap
 from soundcloud.resource.download import OriginalDownload
 from soundcloud.resource.graphql import CommentWithInteractions
 from soundcloud.resource.history import HistoryItem
@@ -49,6 +50,8 @@ __all__ = [
     "CommentWithInteractions",
     "CommentSelf",
     "Conversation",
+    "DecoderConfig",
+    "IdentityMap",
     "OriginalDownload",
     "HistoryItem",
     "PlaylistLike",
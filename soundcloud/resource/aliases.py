@@ -1,5 +1,6 @@
 from typing import Union
 
+from soundcloud.resource.decoder import by_key, by_value, register_discriminator
 from soundcloud.resource.like import PlaylistLike, TrackLike
 from soundcloud.resource.playlist import AlbumPlaylist
 from soundcloud.resource.stream import (
@@ -24,3 +25,31 @@ StreamItem = Union[
     TrackStreamItem, PlaylistStreamItem, TrackStreamRepostItem, PlaylistStreamRepostItem
 ]
 """Generic feed item"""
+
+register_discriminator(Like, by_key({"track": TrackLike, "playlist": PlaylistLike}))
+register_discriminator(
+    RepostItem,
+    by_value(
+        "type",
+        {
+            "track-repost": TrackStreamRepostItem,
+            "playlist-repost": PlaylistStreamRepostItem,
+        },
+    ),
+)
+register_discriminator(
+    SearchItem,
+    by_value("kind", {"user": User, "track": Track, "playlist": AlbumPlaylist}),
+)
+register_discriminator(
+    StreamItem,
+    by_value(
+        "type",
+        {
+            "track": TrackStreamItem,
+            "playlist": PlaylistStreamItem,
+            "track-repost": TrackStreamRepostItem,
+            "playlist-repost": PlaylistStreamRepostItem,
+        },
+    ),
+)
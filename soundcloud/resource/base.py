@@ -2,15 +2,34 @@ import datetime
 from dataclasses import dataclass
 
 import dateutil.parser
-from dacite import Config, from_dict
+from dacite import Config
+from dateutil.tz import UTC
+
+from soundcloud.resource.decoder import (
+    DEFAULT_DECODER_CONFIG,
+    DecoderConfig,
+    get_decoder,
+)
+
+
+def parse_datetime(s: str) -> datetime.datetime:
+    """
+    Parses an ISO-8601 timestamp. Timestamps in the
+    "YYYY-MM-DDTHH:MM:SSZ" format returned by the API take
+    a fast path, anything else is parsed by dateutil.
+    """
+    if len(s) == 20 and s[19] == "Z" and s[10] == "T":
+        try:
+            return datetime.datetime.fromisoformat(s[:19]).replace(tzinfo=UTC)
+        except ValueError:
+            pass
+    return dateutil.parser.isoparse(s)
 
 
 @dataclass
 class BaseData:
-    dacite_config = Config(
-        type_hooks={datetime.datetime: dateutil.parser.isoparse}, cast=[tuple]
-    )
+    dacite_config = Config(type_hooks={datetime.datetime: parse_datetime}, cast=[tuple])
 
     @classmethod
-    def from_dict(cls, d: dict):
-        return from_dict(cls, d, cls.dacite_config)
+    def from_dict(cls, d: dict, config: DecoderConfig = DEFAULT_DECODER_CONFIG):
+        return get_decoder(cls, config)(d)
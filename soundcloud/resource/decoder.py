@@ -0,0 +1,613 @@
+"""
+Compiled decoders for resource dataclasses.
+
+The first time a dataclass is decoded, a conversion function specialised
+for its fields is generated and cached. The result is identical to
+`dacite.from_dict` with `BaseData.dacite_config`, including the errors
+raised for missing or wrongly typed values, which union decoding relies on.
+"""
+
+import contextlib
+import datetime
+import sys
+import threading
+import weakref
+from contextvars import ContextVar
+from dataclasses import MISSING, Field, dataclass, fields, is_dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    get_type_hints,
+)
+
+from dacite import from_dict
+from dacite.exceptions import (
+    DaciteError,
+    DaciteFieldError,
+    MissingValueError,
+    UnionMatchError,
+    WrongTypeError,
+)
+
+try:
+    from typing import get_args, get_origin  # type: ignore[attr-defined]
+except ImportError:
+    # get_args and get_origin for version < 3.8
+    def get_args(tp):  # type: ignore[misc]
+        return getattr(tp, "__args__", ())
+
+    def get_origin(tp):  # type: ignore[no-redef]
+        return getattr(tp, "__origin__", None)
+
+
+Decoder = Callable[[Mapping[str, Any]], Any]
+Discriminator = Callable[[Mapping[str, Any]], Optional[type]]
+
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+_PRIMITIVES = (str, int, bool, float)
+_NONE_TYPE = type(None)
+
+# low-cardinality string fields, interned with DecoderConfig.intern_strings
+_INTERNED_FIELDS = frozenset(
+    {
+        "kind",
+        "sharing",
+        "policy",
+        "monetization_model",
+        "embeddable_by",
+        "mime_type",
+        "protocol",
+        "preset",
+        "quality",
+        "state",
+        "licence",
+        "set_type",
+        "type",
+        "network",
+        "country_code",
+        "genre",
+    }
+)
+
+
+@dataclass(frozen=True)
+class DecoderConfig:
+    """
+    Options for decoding API responses into resources
+    """
+
+    trusted: bool = False
+    """Skip runtime type checks of decoded values. Faster, but
+    malformed responses may produce resources with wrongly typed fields."""
+
+    lazy_datetimes: bool = False
+    """Keep timestamps as strings until their attribute is first read.
+    Malformed timestamps then raise when read instead of when decoded.
+    Resources are then instances of subclasses of the resource classes,
+    with the same names, which compare equal to regular instances."""
+
+    intern_strings: bool = False
+    """Intern the values of enum-like string fields such as `kind`,
+    `sharing`, `policy` or `Format.mime_type`, so that equal values
+    share a single string in memory."""
+
+    output: 'Literal["resource", "view", "raw"]' = "resource"
+    """What responses are decoded into: resource dataclasses, lazy views
+    over the parsed JSON (see `soundcloud.resource.view`), or the parsed
+    JSON itself. The options below only apply to resources."""
+
+    slots: bool = False
+    """Decode into the slotted variants of the resource classes (see
+    `soundcloud.resource.slots`), which take less memory per instance.
+    Can't be combined with lazy_datetimes."""
+
+    def __post_init__(self) -> None:
+        if self.output not in ("resource", "view", "raw"):
+            raise ValueError(f"Invalid output: {self.output!r}")
+        if self.slots and self.lazy_datetimes:
+            raise ValueError("slots can't be combined with lazy_datetimes")
+
+
+DEFAULT_DECODER_CONFIG = DecoderConfig()
+
+_decoders: Dict[Tuple[type, DecoderConfig], Decoder] = {}
+_union_decoders: Dict[Tuple[Any, DecoderConfig], Decoder] = {}
+# decoders compiled along with the one being compiled, published to
+# _decoders together once they are all compiled
+_compiling: Dict[Tuple[type, DecoderConfig], Decoder] = {}
+_compile_lock = threading.RLock()
+_discriminators: Dict[Any, Discriminator] = {}
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class IdentityMap:
+    """
+    Shares decoded resources between responses. While the map is in
+    use, decoding a resource with the same class and `urn` (or `id`,
+    for resources without an urn) as an earlier one returns the earlier
+    instance instead of a new one, with its nested resources. Shared
+    instances should not be modified.
+    """
+
+    def __init__(self, weak: bool = False) -> None:
+        """
+        Args:
+            weak: Only share instances while they are referenced
+                elsewhere, instead of keeping all of them alive.
+        """
+        self._instances: MutableMapping[Tuple[type, Hashable], Any] = (
+            weakref.WeakValueDictionary() if weak else {}
+        )
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def clear(self) -> None:
+        self._instances.clear()
+
+    @contextlib.contextmanager
+    def active(self) -> Iterator["IdentityMap"]:
+        """
+        Uses the map for resources decoded in the with block
+        """
+        token = _active_identity_map.set(self)
+        try:
+            yield self
+        finally:
+            _active_identity_map.reset(token)
+
+
+_active_identity_map: "ContextVar[Optional[IdentityMap]]" = ContextVar(
+    "identity_map", default=None
+)
+
+
+class _LazyDatetime:
+    """
+    Field descriptor parsing a timestamp stored as a string on first read
+    """
+
+    def __init__(self, name: str, parse: Callable[[str], datetime.datetime]):
+        self.name = name
+        self.parse = parse
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            # behave like a field without a default value
+            raise AttributeError(self.name)
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if isinstance(value, str):
+            value = instance.__dict__[self.name] = self.parse(value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+
+_lazy_variants: Dict[type, type] = {}
+
+
+def _lazy_variant(
+    cls: type, names: Sequence[str], parse: Callable[[str], datetime.datetime]
+) -> type:
+    """
+    Returns the subclass of a resource class which parses the timestamps
+    of the given fields on first read. It has the same name, compares
+    equal to instances of the class with equal fields, and is pickled as
+    the class itself, which stays untouched.
+    """
+    variant = _lazy_variants.get(cls)
+    if variant is not None:
+        return variant
+    field_names = [f.name for f in fields(cls)]
+
+    def __eq__(self: Any, other: Any) -> Any:
+        if type(other) not in (cls, variant):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in field_names)
+
+    def __reduce__(self: Any) -> Any:
+        return cls, tuple(getattr(self, name) for name in field_names)
+
+    namespace: Dict[str, Any] = {name: _LazyDatetime(name, parse) for name in names}
+    namespace.update(
+        __eq__=__eq__,
+        __reduce__=__reduce__,
+        __module__=cls.__module__,
+        __qualname__=cls.__qualname__,
+    )
+    variant = _lazy_variants[cls] = type(cls.__name__, (cls,), namespace)
+    return variant
+
+
+def _raw(d: Mapping[str, Any]) -> Any:
+    return d
+
+
+def get_decoder(cls: type, config: DecoderConfig = DEFAULT_DECODER_CONFIG) -> Decoder:
+    """
+    Returns the cached decoder for the given dataclass,
+    compiling it on first use
+    """
+    if config.output == "raw":
+        return _raw
+    if config.output == "view":
+        from soundcloud.resource.view import view_class
+
+        return view_class(cls)
+    key = (cls, config)
+    decoder = _decoders.get(key)
+    if decoder is None:
+        decoder = _Compiler(config).compile(cls)
+    return decoder
+
+
+def get_union_decoder(
+    union: Any, config: DecoderConfig = DEFAULT_DECODER_CONFIG
+) -> Decoder:
+    """
+    Returns the cached decoder for a union of dataclasses. It tries the
+    member picked by the union's registered discriminator first, then
+    the other members in order, and raises UnionMatchError if none match.
+    Only decoding errors make it try the next member.
+    """
+    if config.output == "raw":
+        return _raw
+    if config.output == "view":
+        from soundcloud.resource.view import union_view
+
+        return union_view(union)
+    key = (union, config)
+    decoder = _union_decoders.get(key)
+    if decoder is not None:
+        return decoder
+
+    members = get_args(union)
+    decoders = [get_decoder(m, config) for m in members]
+    by_member = dict(zip(members, decoders))
+    discriminator = _discriminators.get(union)
+
+    def decode_union(d):
+        if not isinstance(d, Mapping):
+            raise UnionMatchError(union, d)
+        picked = None
+        error: Optional[DaciteError] = None
+        if discriminator is not None:
+            picked = by_member.get(discriminator(d))
+            if picked is not None:
+                try:
+                    return picked(d)
+                except DaciteError as e:
+                    error = e
+        for decoder in decoders:
+            if decoder is picked:
+                continue
+            try:
+                return decoder(d)
+            except DaciteError:
+                pass
+        # the error of the member picked tells why the payload didn't match
+        raise UnionMatchError(union, d) from error
+
+    _union_decoders[key] = decode_union
+    return decode_union
+
+
+def register_discriminator(union: Any, discriminator: Discriminator) -> None:
+    """
+    Registers a function picking the member of a union to decode a
+    payload as, or None if it can't tell. Must be registered before
+    the union is first decoded.
+    """
+    _discriminators[union] = discriminator
+
+
+def by_value(key: str, members: Dict[Any, type]) -> Discriminator:
+    """
+    Discriminates by the value of the given key
+    """
+
+    def discriminate(d: Mapping[str, Any]) -> Optional[type]:
+        return members.get(d.get(key))
+
+    return discriminate
+
+
+def by_key(members: Dict[str, type], default: Optional[type] = None) -> Discriminator:
+    """
+    Discriminates by the first of the given keys present in the payload
+    """
+    items = list(members.items())
+
+    def discriminate(d: Mapping[str, Any]) -> Optional[type]:
+        for key, member in items:
+            if key in d:
+                return member
+        return default
+
+    return discriminate
+
+
+def _optional_arg(tp: Any) -> Any:
+    """
+    Returns X if tp is Optional[X], otherwise None
+    """
+    if get_origin(tp) is Union:
+        args = get_args(tp)
+        if len(args) == 2 and _NONE_TYPE in args:
+            return args[0] if args[1] is _NONE_TYPE else args[1]
+    return None
+
+
+def _published(key: Tuple[type, DecoderConfig]) -> Decoder:
+    """
+    Returns a decoder referenced before it was compiled,
+    waiting for another thread to finish compiling it
+    """
+    decoder = _decoders.get(key)
+    if decoder is None:
+        with _compile_lock:
+            decoder = _decoders[key]
+    return decoder
+
+
+class _Compiler:
+    def __init__(self, config: DecoderConfig):
+        self.config = config
+        self.namespace: Dict[str, Any] = {
+            "MissingValueError": MissingValueError,
+            "WrongTypeError": WrongTypeError,
+            "UnionMatchError": UnionMatchError,
+            "DaciteFieldError": DaciteFieldError,
+            "Mapping": Mapping,
+            "active_identity_map": _active_identity_map.get,
+            "intern": sys.intern,
+        }
+        self.lazy_datetimes: List[str] = []
+
+    def _name(self, obj: Any) -> str:
+        name = f"_{len(self.namespace)}"
+        self.namespace[name] = obj
+        return name
+
+    def _decoder_ref(self, cls: type) -> str:
+        key = (cls, self.config)
+        decoder = _decoders.get(key) or _compiling.get(key)
+        if decoder is None:
+            # reserve the slot first so recursive types resolve lazily
+            _compiling[key] = lambda d: _published(key)(d)
+            _compiling[key] = decoder = _Compiler(self.config)._compile(cls)
+        return self._name(decoder)
+
+    def compile(self, cls: type) -> Decoder:
+        key = (cls, self.config)
+        with _compile_lock:
+            if _compiling:
+                # compiling a union inside another decoder
+                self._decoder_ref(cls)
+                return _compiling.get(key) or _decoders[key]
+            if key not in _decoders:
+                try:
+                    self._decoder_ref(cls)
+                    _decoders.update(_compiling)
+                finally:
+                    _compiling.clear()
+        return _decoders[key]
+
+    def _compile(self, cls: type) -> Decoder:
+        base_config = getattr(cls, "dacite_config", None)
+        target = cls
+        if self.config.slots and base_config is not None:
+            from soundcloud.resource.slots import slotted
+
+            target = slotted(cls)
+        try:
+            hints = get_type_hints(cls)
+            if base_config is None or base_config.type_hooks.keys() != {
+                datetime.datetime
+            }:
+                raise _Unsupported
+            hook = base_config.type_hooks[datetime.datetime]
+            self.namespace["parse_datetime"] = hook
+            lines: List[str] = []
+            args: List[str] = []
+            for i, f in enumerate(fields(cls)):
+                if not f.init:
+                    raise _Unsupported
+                var = f"v{i}"
+                self._field(lines, var, f, hints[f.name])
+                args.append(var)
+        except _Unsupported:
+            return lambda d: from_dict(target, d, base_config)
+        if self.lazy_datetimes:
+            target = _lazy_variant(cls, self.lazy_datetimes, hook)
+        cls_name = self._name(target)
+        construct = f"{cls_name}({', '.join(args)})"
+        names = {f.name for f in fields(cls)}
+        identity = "urn" if "urn" in names else "id" if "id" in names else None
+        if identity is not None:
+            lines[:0] = [
+                "identity = None",
+                "identity_map = active_identity_map()",
+                "if identity_map is not None and isinstance(d, dict):",
+                f"    key = d.get({identity!r})",
+                "    if key is not None:",
+                f"        identity = ({cls_name}, key)",
+                "        instance = identity_map._instances.get(identity)",
+                "        if instance is not None:",
+                "            return instance",
+            ]
+            lines.append(f"instance = {construct}")
+            lines.append("if identity is not None:")
+            lines.append("    identity_map._instances[identity] = instance")
+            construct = "instance"
+        body = "\n".join(f"    {line}" for line in lines)
+        source = f"def decode(d):\n{body}\n    return {construct}\n"
+        exec(source, self.namespace)
+        decoder = self.namespace.pop("decode")
+        decoder.__qualname__ = f"decode_{cls.__name__}"
+        return decoder
+
+    def _field(self, lines: List[str], var: str, f: Field, tp: Any) -> None:
+        key = repr(f.name)
+        optional = _optional_arg(tp)
+        conversion: List[str] = []
+        if optional is not None:
+            self._value(conversion, var, f.name, optional, tp, indent="    ")
+            if conversion:
+                conversion.insert(0, f"if {var} is not None:")
+        else:
+            self._value(conversion, var, f.name, tp, tp, indent="")
+
+        # missing values are replaced like dacite does: the field's
+        # default, then None for optional fields, otherwise an error
+        if f.default is not MISSING:
+            missing = f"{var} = {self._name(f.default)}"
+        elif f.default_factory is not MISSING:
+            missing = f"{var} = {self._name(f.default_factory)}()"
+        elif optional is not None:
+            if not conversion:
+                lines.append(f"{var} = d.get({key})")
+                return
+            missing = f"{var} = None"
+        else:
+            missing = f"raise MissingValueError({key}) from None"
+
+        lines.append("try:")
+        lines.append(f"    {var} = d[{key}]")
+        lines.append("except KeyError:")
+        lines.append(f"    {missing}")
+        if conversion:
+            lines.append("else:")
+            lines.extend(f"    {line}" for line in conversion)
+
+    def _value(
+        self,
+        lines: List[str],
+        var: str,
+        name: str,
+        tp: Any,
+        field_type: Any,
+        indent: str,
+    ) -> None:
+        """
+        Emits code converting the raw value in var to type tp in place
+        """
+        key = repr(name)
+        trusted = self.config.trusted
+        if tp is Any:
+            return
+        if tp is datetime.datetime:
+            if self.config.lazy_datetimes:
+                self.lazy_datetimes.append(name)
+            else:
+                lines.append(f"{indent}{var} = parse_datetime({var})")
+            return
+        if tp in _PRIMITIVES:
+            if not trusted:
+                lines.append(f"{indent}if not isinstance({var}, {tp.__name__}):")
+                lines.append(
+                    f"{indent}    raise WrongTypeError("
+                    f"{self._name(field_type)}, {var}, {key})"
+                )
+            if tp is str and self.config.intern_strings and name in _INTERNED_FIELDS:
+                if trusted:
+                    lines.append(f"{indent}if type({var}) is str:")
+                    lines.append(f"{indent}    {var} = intern({var})")
+                else:
+                    lines.append(f"{indent}{var} = intern({var})")
+            return
+        if is_dataclass(tp) and isinstance(tp, type):
+            self._nested(lines, var, name, self._decoder_ref(tp), field_type, indent)
+            return
+        origin = get_origin(tp)
+        if origin is tuple:
+            args = get_args(tp)
+            if len(args) != 2 or args[1] is not Ellipsis:
+                raise _Unsupported
+            item = self._item_decoder(args[0])
+            if not trusted:
+                lines.append(f"{indent}if not isinstance({var}, (list, tuple)):")
+                lines.append(
+                    f"{indent}    raise WrongTypeError("
+                    f"{self._name(field_type)}, {var}, {key})"
+                )
+            if item is None:
+                lines.append(f"{indent}{var} = tuple({var})")
+                return
+            lines.append(f"{indent}try:")
+            lines.append(f"{indent}    {var} = tuple(map({item}, {var}))")
+            lines.append(f"{indent}except DaciteFieldError as e:")
+            lines.append(f"{indent}    e.update_path({key})")
+            lines.append(f"{indent}    raise")
+            return
+        if origin is Union:
+            decoder = self._union_decoder(tp)
+            lines.append(f"{indent}try:")
+            lines.append(f"{indent}    {var} = {decoder}({var})")
+            lines.append(f"{indent}except DaciteFieldError as e:")
+            lines.append(f"{indent}    e.update_path({key})")
+            lines.append(f"{indent}    raise")
+            return
+        raise _Unsupported
+
+    def _nested(
+        self,
+        lines: List[str],
+        var: str,
+        name: str,
+        decoder: str,
+        field_type: Any,
+        indent: str,
+    ) -> None:
+        key = repr(name)
+        if not self.config.trusted:
+            lines.append(f"{indent}if not isinstance({var}, Mapping):")
+            lines.append(
+                f"{indent}    raise WrongTypeError("
+                f"{self._name(field_type)}, {var}, {key})"
+            )
+        lines.append(f"{indent}try:")
+        lines.append(f"{indent}    {var} = {decoder}({var})")
+        lines.append(f"{indent}except DaciteFieldError as e:")
+        lines.append(f"{indent}    e.update_path({key})")
+        lines.append(f"{indent}    raise")
+
+    def _item_decoder(self, tp: Any) -> Any:
+        """
+        Returns the name of a function converting collection
+        items to type tp, or None if items are kept as they are
+        """
+        if tp is Any or (tp in _PRIMITIVES and self.config.trusted):
+            return None
+        if is_dataclass(tp) and isinstance(tp, type):
+            return self._decoder_ref(tp)
+        if get_origin(tp) is Union:
+            return self._union_decoder(tp)
+        raise _Unsupported
+
+    def _union_decoder(self, tp: Any) -> str:
+        members = get_args(tp)
+        if not all(is_dataclass(m) and isinstance(m, type) for m in members):
+            raise _Unsupported
+        return self._name(get_union_decoder(tp, self.config))
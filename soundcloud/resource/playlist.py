@@ -4,10 +4,17 @@ from typing import Optional, Tuple, Union
 
 from soundcloud.resource.base import BaseData
 from soundcloud.resource.base_item import BaseItem
+from soundcloud.resource.decoder import by_key, register_discriminator
 from soundcloud.resource.track import BasicTrack, MiniTrack
 from soundcloud.resource.user import BasicUser, User
 
 
+# playlists only include full info for their first few tracks
+register_discriminator(
+    Union[BasicTrack, MiniTrack], by_key({"title": BasicTrack}, default=MiniTrack)
+)
+
+
 @dataclass
 class BaseAlbumPlaylist(BaseItem):
     managed_by_feeds: bool
@@ -0,0 +1,147 @@
+"""
+Projections of resources onto some of their fields.
+
+A projection of a resource class is a dataclass with only the requested
+fields of the class, given as dotted paths such as `"user.id"`. Decoding
+into it skips every other field of the payload, and nested paths project
+nested resources the same way. Requested fields are decoded and checked
+exactly like in the full resource.
+
+    >>> TrackProjection = projection(BasicTrack, ("id", "title", "user.id"))
+    >>> track = TrackProjection.from_dict(payload)
+    >>> track.user.id
+"""
+
+from collections import OrderedDict
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, get_type_hints
+
+from soundcloud.resource.base import BaseData
+from soundcloud.resource.decoder import (
+    _discriminators,
+    get_args,
+    get_origin,
+    register_discriminator,
+)
+
+__all__ = ["projection"]
+
+_projections: Dict[Tuple[Any, Tuple[str, ...]], Any] = {}
+
+
+def projection(tp: Any, paths: Sequence[str]) -> Any:
+    """
+    Returns the projection of a resource class, or union
+    of resource classes, onto the given field paths
+
+    Raises:
+        ValueError: A path doesn't match any field
+    """
+    key = (tp, tuple(paths))
+    projected = _projections.get(key)
+    if projected is None:
+        projected = _project(tp, key[1])
+        _projections[key] = projected
+    return projected
+
+
+def _split(paths: Sequence[str]) -> "OrderedDict[str, List[str]]":
+    """
+    Groups paths by their first field. An empty list of
+    subpaths means the whole field was requested.
+    """
+    heads: "OrderedDict[str, List[str]]" = OrderedDict()
+    whole = set()
+    for path in paths:
+        head, _, rest = path.partition(".")
+        subpaths = heads.setdefault(head, [])
+        if not rest:
+            whole.add(head)
+        elif head not in whole:
+            subpaths.append(rest)
+    for head in whole:
+        heads[head] = []
+    return heads
+
+
+def _project(tp: Any, paths: Tuple[str, ...]) -> Any:
+    if get_origin(tp) is Union:
+        return _project_union(tp, paths)
+    if not (is_dataclass(tp) and isinstance(tp, type) and issubclass(tp, BaseData)):
+        raise ValueError(f"Can't project {tp!r} onto {', '.join(paths)}")
+    hints = get_type_hints(tp)
+    by_name = {f.name: f for f in fields(tp)}
+    required: List[Tuple[str, Any]] = []
+    optional: List[Tuple[str, Any, Any]] = []
+    for head, subpaths in _split(paths).items():
+        f = by_name.get(head)
+        if f is None:
+            raise ValueError(f"{tp.__name__} has no field {head!r}")
+        field_type = hints[head]
+        if subpaths:
+            field_type = _project_nested(field_type, tuple(subpaths))
+        if f.default is not MISSING:
+            optional.append((head, field_type, field(default=f.default)))
+        elif f.default_factory is not MISSING:
+            optional.append(
+                (head, field_type, field(default_factory=f.default_factory))
+            )
+        else:
+            required.append((head, field_type))
+    # fields with defaults must come last in a dataclass
+    namespace: Dict[str, Any] = {
+        "__annotations__": OrderedDict(
+            [*required, *((name, t) for name, t, _ in optional)]
+        ),
+        "__module__": __name__,
+    }
+    for name, _, default in optional:
+        namespace[name] = default
+    cls = type(f"{tp.__name__}Projection", (BaseData,), namespace)
+    return dataclass(cls)
+
+
+def _project_nested(tp: Any, paths: Tuple[str, ...]) -> Any:
+    """
+    Projects the resources in a field type, keeping the
+    Optional and Tuple types around them
+    """
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if origin is Union and type(None) in args:
+        members = [arg for arg in args if arg is not type(None)]
+        inner = members[0] if len(members) == 1 else Union[tuple(members)]
+        return Optional[_project_nested(inner, paths)]
+    if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        return Tuple[_project_nested(args[0], paths), ...]  # type: ignore[misc]
+    if origin is Union:
+        return _project_union(tp, paths)
+    return projection(tp, paths)
+
+
+def _project_union(union: Any, paths: Tuple[str, ...]) -> Any:
+    """
+    Projects each member of a union onto the paths matching its fields
+    """
+    members = get_args(union)
+    names = {member: {f.name for f in fields(member)} for member in members}
+    for path in paths:
+        head = path.partition(".")[0]
+        if not any(head in member_names for member_names in names.values()):
+            raise ValueError(f"No member of {union!r} has field {head!r}")
+    projected_members = {
+        member: projection(
+            member, tuple(p for p in paths if p.partition(".")[0] in names[member])
+        )
+        for member in members
+    }
+    projected: Any = Union[tuple(projected_members.values())]
+    discriminator = _discriminators.get(union)
+    if discriminator is not None:
+
+        def discriminate(d):
+            member = discriminator(d)
+            return None if member is None else projected_members[member]
+
+        register_discriminator(projected, discriminate)
+    return projected
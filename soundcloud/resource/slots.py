@@ -0,0 +1,76 @@
+"""
+Variants of the resource classes storing their fields in `__slots__`.
+
+Instances of the regular resource classes keep their fields in a
+`__dict__`, which takes most of their memory. The slotted variant of a
+class has the same name, fields and methods, and the same hierarchy
+(the variant of `Track` subclasses the variant of `BaseTrack`, and so
+on), but no `__dict__`. Variants are not subclasses of the classes they
+mirror, so compare their instances with `isinstance` against other
+variants, e.g. `isinstance(x, slotted(BasicTrack))`.
+
+Decode responses into slotted variants with `DecoderConfig(slots=True)`.
+"""
+
+from dataclasses import fields
+from typing import Dict, List, Type, TypeVar, cast
+
+from soundcloud.resource.base import BaseData
+
+__all__ = ["slotted"]
+
+T = TypeVar("T", bound=BaseData)
+
+_variants: Dict[type, type] = {}
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """
+    Returns the slotted variant of a resource class
+    """
+    variant = _variants.get(cls)
+    if variant is not None:
+        return cast(Type[T], variant)
+    if not (isinstance(cls, type) and issubclass(cls, BaseData)):
+        raise TypeError(f"{cls!r} is not a resource class")
+    bases = tuple(
+        slotted(base) if issubclass(base, BaseData) else base for base in cls.__bases__
+    )
+    inherited = {
+        name for base in bases for name in getattr(base, "__dataclass_fields__", {})
+    }
+    names = [f.name for f in fields(cls)]
+    namespace = dict(cls.__dict__)
+    # dataclass leaves field defaults as class attributes, which would
+    # shadow the slots. The generated __init__ keeps its own copy of them.
+    for name in names + ["__dict__", "__weakref__"]:
+        namespace.pop(name, None)
+    slots = tuple(name for name in names if name not in inherited)
+    if cls is BaseData:
+        # keep instances usable with weak references, e.g. by IdentityMap
+        slots += ("__weakref__",)
+    namespace["__slots__"] = slots
+    namespace["__module__"] = __name__
+    namespace["__qualname__"] = cls.__qualname__
+    variant = type(cls.__name__, bases, namespace)
+    _variants[cls] = variant
+    return cast(Type[T], variant)
+
+
+def _resource_classes(cls: type = BaseData) -> Dict[str, type]:
+    classes = {cls.__name__: cls}
+    subclasses: List[type] = cls.__subclasses__()
+    for subclass in subclasses:
+        if subclass.__module__ != __name__:
+            classes.update(_resource_classes(subclass))
+    return classes
+
+
+def __getattr__(name: str) -> type:
+    # lets pickle find the variants by name
+    import soundcloud.resource  # noqa: F401
+
+    cls = _resource_classes().get(name)
+    if cls is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return slotted(cls)
@@ -1,8 +1,9 @@
 import datetime
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from soundcloud.resource.base import BaseData
+from soundcloud.resource.decoder import by_key, register_discriminator
 from soundcloud.resource.visuals import Visuals
 
 
@@ -77,6 +78,11 @@ class MissingUser(BaseData):
     kind: str
 
 
+register_discriminator(
+    Union[BasicUser, MissingUser], by_key({"username": BasicUser}, default=MissingUser)
+)
+
+
 @dataclass
 class UserStatus(BaseData):
     status: str
@@ -0,0 +1,208 @@
+"""
+Lazy views over the JSON of resources.
+
+A view wraps the dict parsed from a response and exposes its fields
+through the attribute names of the resource class it stands for.
+Timestamps and nested resources are only decoded when first read, and
+field values are not type checked. Views are read-only and also have
+the methods of their resource class, such as `BaseItem.get_all_tags`.
+
+Decode responses into views with `DecoderConfig(output="view")`.
+"""
+
+import datetime
+from dataclasses import MISSING, Field, fields, is_dataclass
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Mapping,
+    Optional,
+    Type,
+    Union,
+    get_type_hints,
+)
+
+from dacite.exceptions import MissingValueError
+
+from soundcloud.resource.base import BaseData
+from soundcloud.resource.decoder import (
+    _discriminators,
+    _optional_arg,
+    get_args,
+    get_decoder,
+    get_origin,
+    get_union_decoder,
+)
+
+__all__ = ["ResourceView", "union_view", "view_class"]
+
+_PRIMITIVES = (str, int, bool, float)
+
+_view_classes: Dict[type, Type["ResourceView"]] = {}
+_union_views: Dict[Any, Callable[[Mapping[str, Any]], Any]] = {}
+
+
+class ResourceView:
+    """
+    Base class of views
+    """
+
+    __slots__ = ("_data", "_decoded")
+    resource_class: ClassVar[Type[BaseData]]
+    """Resource class the view stands for"""
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self._data = data
+        self._decoded: Dict[str, Any] = {}
+
+    def to_dict(self) -> Mapping[str, Any]:
+        """
+        Returns the JSON the view wraps
+        """
+        return self._data
+
+    def to_resource(self) -> Any:
+        """
+        Decodes the whole resource
+        """
+        return get_decoder(self.resource_class)(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._data == other._data  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+class _Field:
+    """
+    View attribute reading a field from the JSON,
+    converting and caching it on first read if needed
+    """
+
+    def __init__(
+        self, f: Field, convert: Optional[Callable[[Any], Any]], optional: bool
+    ) -> None:
+        self.name = f.name
+        self.convert = convert
+        self.optional = optional
+        if f.default is not MISSING:
+            self.default: Callable[[], Any] = lambda: f.default
+        elif f.default_factory is not MISSING:
+            self.default = f.default_factory
+        else:
+            self.default = self._missing
+
+    def _missing(self) -> Any:
+        if self.optional:
+            return None
+        raise MissingValueError(self.name)
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return instance._decoded[self.name]
+        except KeyError:
+            pass
+        try:
+            value = instance._data[self.name]
+        except KeyError:
+            return self.default()
+        if self.convert is None:
+            return value
+        if value is not None:
+            value = self.convert(value)
+        instance._decoded[self.name] = value
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        raise AttributeError(f"can't set attribute {self.name!r} of a view")
+
+
+def _converter(tp: Any, parse_datetime: Callable[[str], Any]) -> Any:
+    """
+    Returns a function converting raw values to type tp
+    on first read, or None if they are used as they are
+    """
+    optional = _optional_arg(tp)
+    if optional is not None:
+        # None is never converted
+        return _converter(optional, parse_datetime)
+    if tp is Any or tp in _PRIMITIVES:
+        return None
+    if tp is datetime.datetime:
+        return parse_datetime
+    if is_dataclass(tp) and isinstance(tp, type) and issubclass(tp, BaseData):
+        return view_class(tp)
+    origin = get_origin(tp)
+    if origin is tuple:
+        args = get_args(tp)
+        item = _converter(args[0], parse_datetime) if args else None
+        if item is None:
+            return tuple
+        return lambda v: tuple(map(item, v))
+    if origin is Union:
+        return union_view(tp)
+    return None
+
+
+def view_class(cls: type) -> Type[ResourceView]:
+    """
+    Returns the view class standing for a resource class
+    """
+    view = _view_classes.get(cls)
+    if view is not None:
+        return view
+    if not (is_dataclass(cls) and issubclass(cls, BaseData)):
+        raise TypeError(f"{cls!r} is not a resource class")
+    namespace: Dict[str, Any] = {"__slots__": (), "resource_class": cls}
+    # methods of the resource class work on views too
+    for klass in reversed(cls.__mro__):
+        if klass is not BaseData and issubclass(klass, BaseData):
+            for name, value in vars(klass).items():
+                if name.startswith("__"):
+                    continue
+                if callable(value) or isinstance(
+                    value, (property, staticmethod, classmethod)
+                ):
+                    namespace[name] = value
+    view = type(f"{cls.__name__}View", (ResourceView,), namespace)
+    # register before converting fields so recursive types resolve
+    _view_classes[cls] = view
+    hints = get_type_hints(cls)
+    parse_datetime = cls.dacite_config.type_hooks[datetime.datetime]
+    for f in fields(cls):
+        tp = hints[f.name]
+        optional = _optional_arg(tp) is not None
+        setattr(view, f.name, _Field(f, _converter(tp, parse_datetime), optional))
+    return view
+
+
+def union_view(union: Any) -> Callable[[Mapping[str, Any]], Any]:
+    """
+    Returns a function wrapping JSON in a view of the union member it
+    is decoded as. Uses the union's discriminator, and only decodes the
+    JSON to find its member if the discriminator can't tell.
+    """
+    cached = _union_views.get(union)
+    if cached is not None:
+        return cached
+    discriminator = _discriminators.get(union)
+
+    def decode_union(d: Mapping[str, Any]) -> Any:
+        member: Optional[type] = None
+        if discriminator is not None:
+            member = discriminator(d)
+        if member is None:
+            member = type(get_union_decoder(union)(d))
+        return view_class(member)(d)
+
+    _union_views[union] = decode_union
+    return decode_union
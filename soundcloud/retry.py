@@ -0,0 +1,113 @@
+"""
+Retrying requests which failed with transient errors.
+
+Requests answered with a retryable status (429, 502, 503 and 504 by
+default), or which failed to connect, are sent again after an exponential
+backoff with full jitter. A `Retry-After` header sent by the server
+overrides the backoff. Requests which are not idempotent, such as creating a
+playlist, are only retried on 429, which means they were not processed.
+"""
+
+import email.utils
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional
+
+__all__ = ["RetryPolicy", "RetryStats"]
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How requests failing with transient errors are retried.
+    Use `RetryPolicy(max_retries=0)` to never retry.
+    """
+
+    max_retries: int = 3
+    """Number of times a request is sent again before giving up"""
+    backoff: float = 0.5
+    """Delay before the first retry, doubled for each following one"""
+    max_delay: float = 60.0
+    """Longest delay before a retry. Requests the server asks to
+    retry later than this, with Retry-After, are not retried."""
+    jitter: bool = True
+    """Whether delays are drawn at random up to the backoff,
+    so clients which failed together don't retry together"""
+    statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    """Statuses of responses to retry. 500 is left out, as the API also
+    answers it for some missing resources, which are returned as None.
+    Pages of collections are retried on 500 as well."""
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+
+    def should_retry(
+        self, attempt: int, status: Optional[int], idempotent: bool
+    ) -> bool:
+        """
+        Returns whether to retry a request which failed for the attempt-th
+        time with the given status. status is None if it failed to connect.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if status is None:
+            return idempotent
+        return status in self.statuses and (idempotent or status == 429)
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Returns the seconds to wait before retrying a request which failed
+        for the attempt-th time, or None if it should not be retried
+        because the server asks to wait longer than max_delay
+        """
+        if retry_after is not None:
+            seconds = self._parse_retry_after(retry_after)
+            if seconds is not None:
+                return seconds if seconds <= self.max_delay else None
+        backoff = min(self.max_delay, self.backoff * 2**attempt)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        """
+        Parses a Retry-After header, given in seconds or as an HTTP date
+        """
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, date.timestamp() - time.time())
+
+
+@dataclass
+class RetryStats:
+    """
+    Counts of the retries made by a client
+    """
+
+    retries: int = 0
+    """Number of requests sent again"""
+    exhausted: int = 0
+    """Number of requests which still failed after max_retries"""
+    reasons: Dict[str, int] = field(default_factory=Counter)
+    """Number of retries by status, or by exception name
+    for requests which failed to connect"""
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_retry(self, reason: str) -> None:
+        with self._lock:
+            self.retries += 1
+            self.reasons[reason] += 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
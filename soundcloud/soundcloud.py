@@ -1,7 +1,21 @@
 import itertools
 import sys
 import re
-from typing import Dict, Generator, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 if sys.version_info < (3, 8):
     from typing_extensions import Literal
@@ -11,7 +25,21 @@ else:
 import requests
 from requests import HTTPError
 
-from soundcloud.exceptions import ClientIDGenerationError
+from soundcloud.cache import Cache
+from soundcloud.client_id import ClientIDCache, _ClientIDScanner
+from soundcloud.concurrency import AdaptiveConcurrency
+from soundcloud.context import ClientContext
+from soundcloud.download import (
+    DownloadResult,
+    _download,
+    _resolve_transcoding,
+    _stream,
+    _stream_url,
+)
+from soundcloud.exceptions import ClientIDGenerationError, DownloadError
+from soundcloud.json_backend import JSONBackend
+from soundcloud.permalink import Permalink, PermalinkIndex, normalize_url
+from soundcloud.rate_limit import RateLimiter
 from soundcloud.requests import (
     MeHistoryRequest,
     MeRequest,
@@ -47,6 +75,7 @@ from soundcloud.requests import (
     UserFollowersRequest,
     UserFollowingsRequest,
     UserInteractionsQueryParams,
+    UserInteractionsQueryResult,
     UserInteractionsRequest,
     UserLikesRequest,
     UserPlaylistsRequest,
@@ -57,24 +86,41 @@ from soundcloud.requests import (
     UserToptracksRequest,
     UserTracksRequest,
     UserWebProfilesRequest,
+    _check_client_id,
 )
+from soundcloud.retry import RetryPolicy, RetryStats
 from soundcloud.resource.graphql import CommentWithInteractions
 from soundcloud.resource.history import HistoryItem
 
 from .resource.aliases import Like, RepostItem, SearchItem, StreamItem
 from .resource.comment import BasicComment, Comment
 from .resource.conversation import Conversation
+from .resource.decoder import DecoderConfig, IdentityMap
 from .resource.message import Message
 from .resource.playlist import AlbumPlaylist, BasicAlbumPlaylist
-from .resource.track import BasicTrack, Track
+from .resource.track import BaseTrack, BasicTrack, Track, Transcoding
 from .resource.user import User, UserEmail
 from .resource.web_profile import WebProfile
 from .resource.response import NoContentResponse
 
 
-class SoundCloud:
+class TrackList(List[BasicTrack]):
     """
-    SoundCloud v2 API client
+    Tracks returned by `SoundCloud.get_tracks`, in the order they were
+    requested, without duplicates
+    """
+
+    missing_ids: List[int]
+    """IDs of requested tracks which were not returned"""
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.missing_ids = []
+
+
+class _SoundCloudBase:
+    """
+    State and helpers shared by the sync and async clients
     """
 
     _DEFAULT_USER_AGENT = (
@@ -83,28 +129,86 @@ class SoundCloud:
     _ASSETS_SCRIPTS_REGEX = re.compile(
         r"src=\"(https:\/\/a-v2\.sndcdn\.com/assets/.*\.js)\""
     )
-    _CLIENT_ID_REGEX = re.compile(r"client_id:\"([^\"]+)\"")
-    client_id: str
-    """SoundCloud client ID. Needed for all requests."""
+    # bytes of an asset script searched for the client ID at once
+    _SCRIPT_CHUNK_SIZE = 16 * 1024
+    # asset scripts searched at once by the sync client
+    _SCRIPT_WORKERS = 8
+    # seconds the result of `is_client_id_valid` is used for
+    _CLIENT_ID_CHECK_TTL = 300
+    # fields of the resources resolved by `resolve_many`
+    _PERMALINK_FIELDS = ("kind", "id")
+    context: ClientContext
+    """Connection pools, cache, client ID and limits used by
+    this client, possibly shared with other clients."""
+    client_id_cache: Optional[ClientIDCache]
+    """File generated client IDs are stored in, if any."""
+    permalink_index: Optional[PermalinkIndex]
+    """Index of the permalink URLs of decoded resources, if any."""
+    decoder_config: DecoderConfig
+    """Options used to decode responses into resources."""
+    cache: Optional[Cache]
+    """Cache for responses to GET requests, if any."""
+    identity_map: Optional[IdentityMap]
+    """Identity map sharing resources decoded by this client, if any."""
+    json_backend: JSONBackend
+    """Backend parsing the JSON of responses."""
+    retry_policy: RetryPolicy
+    """How requests failing with transient errors are retried."""
+    retry_stats: RetryStats
+    """Counts of the retries made by this client, and
+    by the clients sharing its context."""
+    rate_limiter: Optional[RateLimiter]
+    """Rate limiter every request waits for, if any."""
+    concurrency_limiter: Optional[AdaptiveConcurrency]
+    """Limit on the requests in flight, if any. Its `limit`
+    tells how many requests the server currently handles well."""
     _user_agent: str
     _auth_token: Optional[str]
     _authorization: Optional[str]
+    _owns_context: bool
 
     def __init__(
         self,
-        client_id: Optional[str] = None,
-        auth_token: Optional[str] = None,
-        user_agent: str = _DEFAULT_USER_AGENT,
-    ) -> None:
-        if not client_id:
-            client_id = self.generate_client_id()
-
-        self.client_id = client_id
+        context: Optional[ClientContext],
+        auth_token: Optional[str],
+        user_agent: str,
+        decoder_config: Optional[DecoderConfig],
+        identity_map: Optional[IdentityMap],
+        **context_kwargs,
+    ):
+        """
+        Uses the given context, or creates one
+        from context_kwargs owned by this client
+        """
+        self._owns_context = context is None
+        if context is None:
+            context = ClientContext(**context_kwargs)
+        self.context = context
+        # copied, so that requests don't need to go through the context
+        self.cache = context.cache
+        self.json_backend = context.json_backend
+        self.retry_policy = context.retry_policy
+        self.retry_stats = context.retry_stats
+        self.rate_limiter = context.rate_limiter
+        self.concurrency_limiter = context.concurrency_limiter
+        self.client_id_cache = context.client_id_cache
+        self.permalink_index = context.permalink_index
+        self.decoder_config = decoder_config or DecoderConfig()
+        self.identity_map = identity_map
         self._user_agent = user_agent
         self._auth_token = None
         self._authorization = None
         self.auth_token = auth_token
 
+    @property
+    def client_id(self) -> str:
+        """SoundCloud client ID. Needed for all requests."""
+        return self.context.client_id
+
+    @client_id.setter
+    def client_id(self, client_id: str) -> None:
+        self.context.client_id = client_id
+
     @property
     def auth_token(self) -> Optional[str]:
         """SoundCloud auth token. Only needed for some requests."""
@@ -125,41 +229,376 @@ class SoundCloud:
     def _get_default_headers(self) -> Dict[str, str]:
         return {"User-Agent": self._user_agent}
 
+    def _get_headers(self, use_auth: bool) -> Dict[str, str]:
+        headers = self._get_default_headers()
+        if use_auth and self._authorization is not None:
+            headers["Authorization"] = self._authorization
+        return headers
+
+    def _cached_client_id(self, stale: Optional[str]) -> Optional[str]:
+        """
+        Returns the client ID in the client ID cache, if any,
+        unless it is the stale one being renewed
+        """
+        if self.client_id_cache is None:
+            return None
+        client_id = self.client_id_cache.get()
+        return client_id if client_id != stale else None
+
+    def _store_client_id(self, client_id: str) -> None:
+        if self.client_id_cache is not None:
+            self.client_id_cache.set(client_id)
+
+    def _checked_client_id(self, client_id: str) -> Optional[bool]:
+        """
+        Returns the result of the last check of a client ID,
+        or None if it wasn't checked recently
+        """
+        check = self.context._client_id_check
+        if check is None or check[0] != client_id or time.monotonic() >= check[2]:
+            return None
+        return check[1]
+
+    def _record_client_id_check(self, client_id: str, valid: bool) -> None:
+        self.context._client_id_check = (
+            client_id,
+            valid,
+            time.monotonic() + self._CLIENT_ID_CHECK_TTL,
+        )
+
+    @staticmethod
+    def _field(resource: Any, name: str) -> Any:
+        """
+        Returns a field of a resource, view or raw JSON
+        """
+        if isinstance(resource, dict):
+            return resource.get(name)
+        return getattr(resource, name, None)
+
+    @staticmethod
+    def _comment_interactions_query(
+        track: BasicTrack, comments: List[BasicComment]
+    ) -> UserInteractionsQueryParams:
+        return UserInteractionsQueryParams(
+            track.user.urn,
+            "sc:interactiontype:reaction",
+            track.urn,
+            [comment.self.urn for comment in comments],
+        )
+
+    @staticmethod
+    def _with_interactions(
+        comments: List[BasicComment], result: UserInteractionsQueryResult
+    ) -> List[CommentWithInteractions]:
+        comments_with_interactions = []
+        for comment, user_interactions, creator_interactions in zip(
+            comments, result.user, result.creator
+        ):
+            assert user_interactions.interactionCounts is not None
+            likes = list(
+                filter(
+                    lambda x: x.interactionTypeValueUrn
+                    == "sc:interactiontypevalue:like",
+                    user_interactions.interactionCounts,
+                )
+            )
+            num_likes = likes[0].count if likes else 0
+            comments_with_interactions.append(
+                CommentWithInteractions(
+                    comment=comment,
+                    likes=num_likes or 0,
+                    liked_by_creator=creator_interactions.userInteraction
+                    == "sc:interactiontypevalue:like",
+                    liked_by_user=user_interactions.userInteraction
+                    == "sc:interactiontypevalue:like",
+                )
+            )
+        return comments_with_interactions
+
+    @staticmethod
+    def _tracks_params(
+        playlistId: Optional[int],
+        playlistSecretToken: Optional[str],
+        kwargs: dict,
+    ) -> dict:
+        if playlistId is not None:
+            kwargs["playlistId"] = playlistId
+        if playlistSecretToken is not None:
+            kwargs["playlistSecretToken"] = playlistSecretToken
+        fields = kwargs.get("fields")
+        # tracks are put back in order by their ID
+        if fields and "id" not in fields:
+            kwargs["fields"] = ("id", *fields)
+        return kwargs
+
+    def _max_workers(self, max_workers: Optional[int]) -> int:
+        if max_workers is not None:
+            return max_workers
+        if self.concurrency_limiter is not None:
+            return self.concurrency_limiter.max_limit
+        return 4
+
+    def _known_permalinks(
+        self, urls: Iterable[str]
+    ) -> Tuple[List[str], Dict[str, Optional[Permalink]]]:
+        """
+        Returns the given URLs normalized, and what
+        those in the permalink index lead to
+        """
+        normalized = [normalize_url(url) for url in urls]
+        known: Dict[str, Optional[Permalink]] = {}
+        if self.permalink_index is not None:
+            known.update(self.permalink_index.get_many(normalized))
+        return normalized, known
+
+    def _resolved_permalink(self, url: str, resource: Any) -> Optional[Permalink]:
+        """
+        Returns what a resolved URL leads to, and indexes it
+        """
+        if resource is None:
+            return None
+        kind, id = self._field(resource, "kind"), self._field(resource, "id")
+        # system playlists only have an urn
+        if not isinstance(id, int):
+            return None
+        permalink = Permalink(kind, id)
+        if self.permalink_index is not None:
+            self.permalink_index.add(url, permalink)
+        return permalink
+
+    @staticmethod
+    def _track_id_chunks(track_ids: List[int], chunk_size: int) -> List[List[int]]:
+        unique_ids = list(dict.fromkeys(track_ids))
+        return [
+            unique_ids[i : i + chunk_size]
+            for i in range(0, len(unique_ids), chunk_size)
+        ]
+
+    @staticmethod
+    def _ordered_tracks(
+        chunks: List[List[int]], results: Iterable[List[BasicTrack]]
+    ) -> TrackList:
+        tracks_by_id = {
+            _SoundCloudBase._field(track, "id"): track
+            for tracks in results
+            for track in tracks
+        }
+        ordered = TrackList()
+        for chunk in chunks:
+            for track_id in chunk:
+                track = tracks_by_id.get(track_id)
+                if track is None:
+                    ordered.missing_ids.append(track_id)
+                else:
+                    ordered.append(track)
+        return ordered
+
+
+class SoundCloud(_SoundCloudBase):
+    """
+    SoundCloud v2 API client
+    """
+
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        auth_token: Optional[str] = None,
+        user_agent: str = _SoundCloudBase._DEFAULT_USER_AGENT,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        decoder_config: Optional[DecoderConfig] = None,
+        cache: Optional[Cache] = None,
+        identity_map: Optional[IdentityMap] = None,
+        json_backend: Union[str, JSONBackend, None] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrency] = None,
+        client_id_cache: Optional[ClientIDCache] = None,
+        permalink_index: Optional[PermalinkIndex] = None,
+        context: Optional[ClientContext] = None,
+    ) -> None:
+        """
+        Args:
+            client_id: SoundCloud client ID. Generated if not given,
+                and generated again if SoundCloud revokes it.
+            auth_token: SoundCloud auth token. Only needed for some requests.
+            user_agent: User-Agent header sent with every request.
+            session: Session to send requests with. If given, the pool
+                options below are ignored and the session is not closed
+                by `close`.
+            pool_connections: Number of per-host connection pools to keep.
+            pool_maxsize: Maximum number of connections kept per host.
+            keep_alive: Whether to reuse connections between requests.
+            decoder_config: Options used to decode responses into resources.
+            cache: Cache for responses to GET requests, e.g. `MemoryCache()`.
+            identity_map: Identity map sharing decoded resources with the
+                same urn between responses.
+            json_backend: JSON backend parsing responses: "orjson",
+                "msgspec" or "json". The fastest one installed if not given.
+            retry_policy: How requests failing with transient errors are
+                retried. Use `RetryPolicy(max_retries=0)` to never retry.
+            rate_limiter: Rate limiter every request waits for, e.g.
+                `SQLiteRateLimiter` to share a budget between processes.
+            concurrency_limiter: Limit on the API requests in flight,
+                adjusted to how well the server copes, e.g.
+                `AdaptiveConcurrency()`. Requests to the CDN aren't limited.
+            client_id_cache: File to store generated client IDs in, so
+                that clients in other processes reuse them.
+            permalink_index: Index filled with the permalink URLs of
+                decoded resources, which `resolve_many` looks URLs up in.
+            context: Connection pools, cache, client ID and limits to
+                share with other clients, e.g. one client per auth token.
+                If given, the arguments above other than auth_token,
+                user_agent, decoder_config and identity_map are ignored.
+        """
+        super().__init__(
+            context,
+            auth_token,
+            user_agent,
+            decoder_config,
+            identity_map,
+            client_id=client_id,
+            session=session,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            cache=cache,
+            json_backend=json_backend,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            client_id_cache=client_id_cache,
+            permalink_index=permalink_index,
+        )
+        if not self.client_id:
+            with self.context._client_id_lock:
+                if not self.client_id:
+                    self.client_id = self._new_client_id(None)
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session used for all requests made by this client."""
+        return self.context.session
+
+    def close(self) -> None:
+        """
+        Closes the client's session, unless it was passed in by the
+        caller or belongs to a context shared with other clients
+        """
+        if self._owns_context:
+            self.context.close()
+
+    def __enter__(self) -> "SoundCloud":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
     @classmethod
-    def generate_client_id(cls) -> str:
+    def generate_client_id(cls, session: Optional[requests.Session] = None) -> str:
         """Generates a SoundCloud client ID
 
+        Asset scripts of soundcloud.com are searched concurrently,
+        and the search stops once one of them has the client ID.
+
+        Args:
+            session: Session to send requests with. Defaults to a new session.
+
         Raises:
             ClientIDGenerationError: Client ID could not be generated.
 
         Returns:
             str: Valid client ID
         """
-        r = requests.get("https://soundcloud.com")
+        if session is None:
+            with requests.Session() as session:
+                return cls.generate_client_id(session)
+        r = session.get("https://soundcloud.com")
         r.raise_for_status()
-        matches = cls._ASSETS_SCRIPTS_REGEX.findall(r.text)
-        if not matches:
+        urls = cls._ASSETS_SCRIPTS_REGEX.findall(r.text)
+        if not urls:
             raise ClientIDGenerationError("No asset scripts found")
-        for url in matches:
-            r = requests.get(url)
-            r.raise_for_status()
-            client_id = cls._CLIENT_ID_REGEX.search(r.text)
-            if client_id:
-                return client_id.group(1)
-        raise ClientIDGenerationError(f"Could not find client_id in script '{url}'")
+        return cls._search_scripts(session, urls)
+
+    @classmethod
+    def _search_scripts(cls, session: requests.Session, urls: List[str]) -> str:
+        found = threading.Event()
+
+        def search(url: str) -> Optional[str]:
+            with session.get(url, stream=True) as r:
+                r.raise_for_status()
+                scanner = _ClientIDScanner()
+                for chunk in r.iter_content(cls._SCRIPT_CHUNK_SIZE):
+                    if found.is_set():
+                        return None
+                    client_id = scanner.feed(chunk)
+                    if client_id:
+                        return client_id
+            return None
+
+        error: Optional[BaseException] = None
+        with ThreadPoolExecutor(min(len(urls), cls._SCRIPT_WORKERS)) as executor:
+            futures = [executor.submit(search, url) for url in urls]
+            try:
+                for future in as_completed(futures):
+                    try:
+                        client_id = future.result()
+                    except requests.RequestException as e:
+                        error = e
+                        continue
+                    if client_id:
+                        return client_id
+            finally:
+                # stop searching the other scripts
+                found.set()
+                for future in futures:
+                    future.cancel()
+        raise ClientIDGenerationError(
+            "Could not find client_id in asset scripts"
+        ) from error
+
+    def _new_client_id(self, stale: Optional[str]) -> str:
+        """
+        Returns a client ID from the client ID cache, or generates one
+        """
+        client_id = self._cached_client_id(stale)
+        if client_id is None:
+            client_id = self.generate_client_id(self.session)
+            self._store_client_id(client_id)
+        return client_id
+
+    def _renew_client_id(self, stale: str) -> bool:
+        """
+        Called when a request sent with client ID stale was answered
+        with 401. Renews the client ID if it was generated by this
+        client and was revoked. Returns whether to send the request
+        again with the current client ID.
+        """
+        if not self.context._client_id_generated:
+            return False
+        with self.context._client_id_lock:
+            if self.client_id != stale:
+                # renewed by another thread meanwhile
+                return True
+            if self.is_client_id_valid():
+                # the auth token or the resource is the problem
+                return False
+            self.client_id = self._new_client_id(stale)
+            return self.client_id != stale
 
     def is_client_id_valid(self) -> bool:
         """
-        Checks if current client_id is valid
+        Checks if current client_id is valid.
+        The result is reused for a few minutes.
         """
-        try:
-            TrackRequest(self, track_id=1032303631, use_auth=False)
-            return True
-        except HTTPError as err:
-            if err.response.status_code == 401:
-                return False
-            else:
-                raise
+        client_id = self.client_id
+        valid = self._checked_client_id(client_id)
+        if valid is None:
+            valid = _check_client_id(self, client_id)
+            self._record_client_id_check(client_id, valid)
+        return valid
 
     def is_auth_token_valid(self) -> bool:
         """
@@ -174,11 +613,12 @@ class SoundCloud:
             else:
                 raise
 
-    def get_me(self) -> Optional[User]:
+    def get_me(self, fields: Optional[Sequence[str]] = None) -> Optional[User]:
         """
         Gets the user associated with client's auth token
+        Only the given fields are decoded if fields is given.
         """
-        return MeRequest(self)
+        return MeRequest(self, fields=fields)
 
     def get_my_history(self, **kwargs) -> Generator[HistoryItem, None, None]:
         """
@@ -194,12 +634,43 @@ class SoundCloud:
         """
         return MeStreamRequest(self, **kwargs)
 
-    def resolve(self, url: str) -> Optional[SearchItem]:
+    def resolve(
+        self, url: str, fields: Optional[Sequence[str]] = None
+    ) -> Optional[SearchItem]:
         """
         Returns the resource at the given URL if it
-        exists, otherwise return None
+        exists, otherwise return None.
+        Only the given fields are decoded if fields is given.
         """
-        return ResolveRequest(self, url=url)
+        return ResolveRequest(self, url=url, fields=fields)
+
+    def resolve_many(
+        self, urls: Iterable[str], max_workers: Optional[int] = None
+    ) -> List[Optional[Permalink]]:
+        """
+        Returns the kind and ID of the resources at the given URLs, in
+        the same order, or None for URLs of resources which don't exist.
+
+        URLs are normalized and deduplicated. URLs in the client's
+        permalink index are looked up there, and the others are resolved
+        with up to max_workers requests at once, see `get_tracks`.
+        """
+        normalized, known = self._known_permalinks(urls)
+        missing = [url for url in dict.fromkeys(normalized) if url not in known]
+
+        def resolve(url: str) -> Optional[Permalink]:
+            resource = self.resolve(url, self._PERMALINK_FIELDS)
+            return self._resolved_permalink(url, resource)
+
+        workers = self._max_workers(max_workers)
+        if len(missing) <= 1 or workers <= 1:
+            known.update(zip(missing, map(resolve, missing)))
+        else:
+            with ThreadPoolExecutor(min(workers, len(missing))) as executor:
+                known.update(zip(missing, executor.map(resolve, missing)))
+        if self.permalink_index is not None:
+            self.permalink_index.flush()
+        return [known[url] for url in normalized]
 
     def search(self, query: str, **kwargs) -> Generator[SearchItem, None, None]:
         """
@@ -241,12 +712,15 @@ class SoundCloud:
         """
         return TagRecentTracksRequest(self, tag=tag, **kwargs)
 
-    def get_playlist(self, playlist_id: int) -> Optional[BasicAlbumPlaylist]:
+    def get_playlist(
+        self, playlist_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[BasicAlbumPlaylist]:
         """
         Returns the playlist with the given playlist_id.
-        If the ID is invalid, return None
+        If the ID is invalid, return None.
+        Only the given fields are decoded if fields is given.
         """
-        return PlaylistRequest(self, playlist_id=playlist_id)
+        return PlaylistRequest(self, playlist_id=playlist_id, fields=fields)
 
     def post_playlist(
         self, sharing: Literal["private", "public"], title: str, tracks: List[int]
@@ -279,31 +753,47 @@ class SoundCloud:
         """
         return PlaylistRepostersRequest(self, playlist_id=playlist_id, **kwargs)
 
-    def get_track(self, track_id: int) -> Optional[BasicTrack]:
+    def get_track(
+        self, track_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[BasicTrack]:
         """
         Returns the track with the given track_id.
-        If the ID is invalid, return None
+        If the ID is invalid, return None.
+        Only the given fields are decoded if fields is given.
         """
-        return TrackRequest(self, track_id=track_id)
+        return TrackRequest(self, track_id=track_id, fields=fields)
 
     def get_tracks(
         self,
         track_ids: List[int],
         playlistId: Optional[int] = None,
         playlistSecretToken: Optional[str] = None,
+        chunk_size: int = 50,
+        max_workers: Optional[int] = None,
         **kwargs,
-    ) -> List[BasicTrack]:
+    ) -> TrackList:
         """
-        Returns the tracks with the given track_ids.
+        Returns the tracks with the given track_ids, in the same order.
         Can be used to get track info for hidden tracks in a hidden playlist.
+
+        Duplicate IDs are removed, and the IDs are requested in chunks of
+        chunk_size, with up to max_workers chunks requested concurrently.
+        max_workers defaults to 4, or to the largest limit of the client's
+        concurrency limiter, which then decides how many are in flight.
+        IDs of tracks which were not returned are listed in
+        `TrackList.missing_ids`.
         """
-        if playlistId is not None:
-            kwargs["playlistId"] = playlistId
-        if playlistSecretToken is not None:
-            kwargs["playlistSecretToken"] = playlistSecretToken
-        return TracksRequest(
-            self, ids=",".join([str(id) for id in track_ids]), **kwargs
-        )
+        params = self._tracks_params(playlistId, playlistSecretToken, kwargs)
+        chunks = self._track_id_chunks(track_ids, chunk_size)
+
+        def get_chunk(chunk: List[int]) -> List[BasicTrack]:
+            return TracksRequest(self, ids=",".join(map(str, chunk)), **params)
+
+        workers = self._max_workers(max_workers)
+        if len(chunks) <= 1 or workers <= 1:
+            return self._ordered_tracks(chunks, map(get_chunk, chunks))
+        with ThreadPoolExecutor(min(workers, len(chunks))) as executor:
+            return self._ordered_tracks(chunks, executor.map(get_chunk, chunks))
 
     def get_track_albums(
         self, track_id: int, **kwargs
@@ -340,49 +830,17 @@ class SoundCloud:
         track = self.get_track(track_id)
         if not track:
             return
-        track_urn = track.urn
-        creator_urn = track.user.urn
         comments = self.get_track_comments(track_id, threaded, **kwargs)
         while True:
             chunk = list(itertools.islice(comments, 10))
             if not chunk:
                 return
-            comment_urns = [comment.self.urn for comment in chunk]
             result = UserInteractionsRequest(
-                self,
-                UserInteractionsQueryParams(
-                    creator_urn,
-                    "sc:interactiontype:reaction",
-                    track_urn,
-                    comment_urns,
-                ),
+                self, self._comment_interactions_query(track, chunk)
             )
             if not result:
                 return
-            comments_with_interactions = []
-            for comment, user_interactions, creator_interactions in zip(
-                chunk, result.user, result.creator
-            ):
-                assert user_interactions.interactionCounts is not None
-                likes = list(
-                    filter(
-                        lambda x: x.interactionTypeValueUrn
-                        == "sc:interactiontypevalue:like",
-                        user_interactions.interactionCounts,
-                    )
-                )
-                num_likes = likes[0].count if likes else 0
-                comments_with_interactions.append(
-                    CommentWithInteractions(
-                        comment=comment,
-                        likes=num_likes or 0,
-                        liked_by_creator=creator_interactions.userInteraction
-                        == "sc:interactiontypevalue:like",
-                        liked_by_user=user_interactions.userInteraction
-                        == "sc:interactiontypevalue:like",
-                    )
-                )
-            yield from comments_with_interactions
+            yield from self._with_interactions(chunk, result)
 
     def get_track_likers(self, track_id: int, **kwargs) -> Generator[User, None, None]:
         """
@@ -425,21 +883,126 @@ class SoundCloud:
         else:
             return download.redirectUri
 
-    def get_user(self, user_id: int) -> Optional[User]:
+    def _download_target(self, track: Union[int, BaseTrack]) -> BaseTrack:
+        if not isinstance(track, int):
+            return track
+        resource = self.get_track(track)
+        if resource is None:
+            raise DownloadError(f"Track {track} not found")
+        return resource
+
+    def get_stream_url(
+        self, track: Union[int, BaseTrack], transcoding: Optional[Transcoding] = None
+    ) -> Optional[str]:
+        """
+        Returns the signed URL of the audio of a track in the given
+        transcoding, or in the one `select_transcoding` prefers.
+        Returns None if the track can't be streamed.
+
+        Raises:
+            DownloadError: The track doesn't exist or
+                has no downloadable transcoding
+        """
+        resource = self._download_target(track)
+        return _stream_url(self, resource, _resolve_transcoding(resource, transcoding))
+
+    def download_track(
+        self,
+        track: Union[int, BaseTrack],
+        path: str,
+        transcoding: Optional[Transcoding] = None,
+        workers: int = 8,
+        part_size: int = 1 << 20,
+        resume: bool = True,
+        verify: bool = True,
+    ) -> DownloadResult:
+        """
+        Downloads the audio of a track to a file, in the given
+        transcoding, or in the one `select_transcoding` prefers.
+
+        Args:
+            track: Track, or its ID.
+            path: Path of the file. Parts are written to `path + ".part"`
+                until the download is complete.
+            transcoding: Transcoding of the track to download.
+            workers: Number of parts downloaded at once.
+            part_size: Size of the byte ranges progressive
+                transcodings are downloaded in.
+            resume: Whether to keep the parts of an interrupted download.
+            verify: Whether to check the CRC32 of every part
+                in the complete file before moving it in place.
+
+        Raises:
+            DownloadError: The track can't be downloaded, or a part
+                was still truncated after the client's retry policy
+            requests.HTTPError: A part was answered with an error
+        """
+        return _download(
+            self,
+            self._download_target(track),
+            path,
+            transcoding,
+            workers,
+            part_size,
+            resume,
+            verify,
+        )
+
+    def stream_track_audio(
+        self,
+        track: Union[int, BaseTrack],
+        transcoding: Optional[Transcoding] = None,
+        read_ahead: int = 4,
+        part_size: int = 1 << 20,
+    ) -> Generator[bytes, None, None]:
+        """
+        Yields the audio of a track in order, segment after segment for
+        HLS transcodings, or byte range after byte range for progressive
+        ones, in the given transcoding, or in the one
+        `select_transcoding` prefers.
+
+        Args:
+            track: Track, or its ID.
+            transcoding: Transcoding of the track to stream.
+            read_ahead: Number of parts downloaded ahead of the one
+                consumed. At most read_ahead + 1 parts are held in
+                memory, counting the one last yielded.
+            part_size: Size of the byte ranges progressive transcodings
+                are downloaded in.
+
+        Raises:
+            DownloadError: The track can't be streamed, or a part
+                was still truncated after the client's retry policy
+            requests.HTTPError: A part was answered with an error
+        """
+        return _stream(
+            self, self._download_target(track), transcoding, read_ahead, part_size
+        )
+
+    def get_user(
+        self, user_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[User]:
         """
         Returns the user with the given user_id.
-        If the ID is invalid, return None
+        If the ID is invalid, return None.
+        Only the given fields are decoded if fields is given.
         """
-        return UserRequest(self, user_id=user_id)
+        return UserRequest(self, user_id=user_id, fields=fields)
 
-    def get_user_by_username(self, username: str) -> Optional[User]:
+    def get_user_by_username(
+        self, username: str, fields: Optional[Sequence[str]] = None
+    ) -> Optional[User]:
         """
         Returns the user with the given username.
-        If the username is invalid, return None
-        """
-        resource = self.resolve(f"https://soundcloud.com/{username}")
-        if resource and isinstance(resource, User):
-            return resource
+        If the username is invalid, return None.
+        Only the given fields are decoded if fields is given.
+        """
+        if fields and "kind" not in fields:
+            fields = ("kind", *fields)
+        resource = self.resolve(f"https://soundcloud.com/{username}", fields)
+        # not an isinstance check, as the client may decode into views
+        if resource and self._field(resource, "kind") == "user":
+            return cast(User, resource)
         else:
             return None
 
@@ -575,4 +1138,4 @@ class SoundCloud:
         return UserWebProfilesRequest(self, user_urn=user_urn, **kwargs)
 
 
-__all__ = ["SoundCloud"]
+__all__ = ["SoundCloud", "TrackList"]
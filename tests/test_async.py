@@ -0,0 +1,41 @@
+import asyncio
+import inspect
+import os
+
+from soundcloud import AsyncSoundCloud, BasicTrack, SoundCloud, User
+
+
+def test_same_methods():
+    def public_methods(cls):
+        return {name for name in dir(cls) if not name.startswith("_")}
+
+    assert public_methods(SoundCloud) == public_methods(AsyncSoundCloud)
+    for name in public_methods(SoundCloud):
+        sync_method = getattr(SoundCloud, name)
+        if callable(sync_method):
+            assert list(inspect.signature(sync_method).parameters) == list(
+                inspect.signature(getattr(AsyncSoundCloud, name)).parameters
+            )
+
+
+def test_async_get_track():
+    async def main():
+        async with AsyncSoundCloud(os.environ.get("client_id")) as sc:
+            return await sc.get_track(1032303631)
+
+    track = asyncio.run(main())
+    assert (
+        isinstance(track, BasicTrack)
+        and track.title == "Wan Bushi - Eurodance Vibes (part 1+2+3)"
+    )
+
+
+def test_async_user_followers():
+    async def main():
+        async with AsyncSoundCloud(os.environ.get("client_id")) as sc:
+            async for follower in sc.get_user_followers(992430331):
+                if follower.permalink == "7x11x13":
+                    return follower
+        return None
+
+    assert isinstance(asyncio.run(main()), User)
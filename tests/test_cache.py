@@ -0,0 +1,88 @@
+import sqlite3
+import time
+
+import pytest
+
+from soundcloud import Cache, CachedResponse, MemoryCache, SoundCloud, SQLiteCache
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path) -> Cache:
+    if request.param == "memory":
+        return MemoryCache(max_bytes=350, compress=True)
+    return SQLiteCache(str(tmp_path / "cache.db"), max_bytes=350, compress=True)
+
+
+def test_cache_round_trip(cache: Cache):
+    response = CachedResponse(200, b'{"id": 1}' * 10, time.time() + 60, '"etag"')
+    cache.set("a", response)
+    assert cache.get("a") == response
+    assert cache.get("b") is None
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_cache_evicts_least_recently_used(cache: Cache):
+    for key in "abc":
+        cache.set(key, CachedResponse(200, bytes(range(100)), time.time() + 60))
+    # "b" would be evicted next, unless it is used
+    assert cache.get("b") is not None
+    cache.set("d", CachedResponse(200, bytes(range(100)), time.time() + 60))
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.get("c") is not None
+    assert cache.get("d") is not None
+
+
+def test_sqlite_cache_size(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path, max_bytes=350)
+
+    def sizes():
+        return cache._db.execute(
+            "SELECT size, (SELECT SUM(size) FROM responses) FROM responses_size"
+        ).fetchone()
+
+    cache.set("a", CachedResponse(200, bytes(100), time.time() + 60))
+    cache.set("b", CachedResponse(200, bytes(100), time.time() + 60))
+    cache.set("a", CachedResponse(200, bytes(50), time.time() + 60))
+    assert sizes() == (152, 152)
+    cache.delete("b")
+    assert sizes() == (51, 51)
+    cache.close()
+
+    # the size of a database without the total is summed once
+    db = sqlite3.connect(path)
+    with db:
+        db.execute("DROP TABLE responses_size")
+    db.close()
+    cache = SQLiteCache(path, max_bytes=350)
+    assert sizes() == (51, 51)
+    cache.clear()
+    assert sizes() == (0, None)
+
+
+def test_me_not_cached():
+    # the auth token is always checked with the server
+    assert MemoryCache().ttl_for("/me", 200) == 0
+    assert MemoryCache(ttls={"/me": 60}).ttl_for("/me", 200) == 60
+
+
+def test_incomplete_cache():
+    class GetOnlyCache(Cache):
+        def get(self, key: str) -> None:
+            return None
+
+    # fails when created rather than on the first request
+    with pytest.raises(TypeError):
+        GetOnlyCache()  # type: ignore[abstract]
+
+
+def test_client_cache(client: SoundCloud):
+    cache = MemoryCache()
+    cached_client = SoundCloud(client_id=client.client_id, cache=cache)
+    track = cached_client.get_track(1032303631)
+    assert cached_client.get_track(1032303631) == track
+    assert cached_client.get_track(1) is None
+    not_found = cache.get("|https://api-v2.soundcloud.com/tracks/1?")
+    assert not_found is not None and not_found.status == 404
@@ -0,0 +1,22 @@
+import os
+
+import requests
+
+from soundcloud import SoundCloud
+
+
+def test_injected_session():
+    session = requests.Session()
+    with SoundCloud(os.environ.get("client_id"), session=session) as sc:
+        assert sc.session is session
+        assert sc.get_track(1032303631)
+    # injected sessions are left open for the caller
+    assert session.get_adapter("https://").poolmanager is not None
+    session.close()
+
+
+def test_session_reused(client: SoundCloud):
+    session = client.session
+    assert client.get_track(1032303631)
+    assert client.get_user(790976431)
+    assert client.session is session
@@ -0,0 +1,47 @@
+import json
+
+from soundcloud import ClientIDCache, SoundCloud
+from soundcloud.client_id import _ClientIDScanner
+
+
+def test_client_id_cache(tmp_path):
+    path = str(tmp_path / "cache" / "client_id.json")
+    cache = ClientIDCache(path)
+    assert cache.get() is None
+    cache.set("abc")
+    # shared with caches of other processes using the same file
+    assert ClientIDCache(path).get() == "abc"
+
+
+def test_client_id_cache_expired(tmp_path):
+    cache = ClientIDCache(str(tmp_path / "client_id.json"), ttl=0)
+    cache.set("abc")
+    assert cache.get() is None
+
+
+def test_client_id_cache_corrupt(tmp_path):
+    path = tmp_path / "client_id.json"
+    path.write_text("{")
+    assert ClientIDCache(str(path)).get() is None
+    path.write_text(json.dumps({"client_id": 1, "expires": 1e12}))
+    assert ClientIDCache(str(path)).get() is None
+
+
+def test_client_id_scanner_split_match():
+    script = b'var a=1;client_id:"abcdef0123456789",b=2;'
+    for split in range(1, len(script)):
+        scanner = _ClientIDScanner()
+        found = [scanner.feed(script[:split]), scanner.feed(script[split:])]
+        assert "abcdef0123456789" in found
+
+
+def test_renew_revoked_client_id(tmp_path):
+    cache = ClientIDCache(str(tmp_path / "client_id.json"))
+    sc = SoundCloud(client_id_cache=cache)
+    assert cache.get() == sc.client_id
+    # a revoked client ID is renewed, and the request sent again
+    sc.client_id = "invalid"
+    assert sc.get_track(1032303631) is not None
+    assert sc.client_id != "invalid"
+    assert cache.get() == sc.client_id
+    assert sc.is_client_id_valid()
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from soundcloud import AdaptiveConcurrency
+
+
+def test_limit_increases_while_used():
+    concurrency = AdaptiveConcurrency(initial=1, max_limit=3)
+    concurrency.release(concurrency.acquire(), ok=True)
+    # a limit which is not used is not raised
+    concurrency.release(concurrency.acquire(), ok=True)
+    assert concurrency.limit == 2
+    for _ in range(5):
+        started = [concurrency.acquire() for _ in range(concurrency.limit)]
+        for start in started:
+            concurrency.release(start, ok=True)
+    assert concurrency.limit == 3
+
+
+def test_limit_cut_once_per_round():
+    concurrency = AdaptiveConcurrency(initial=8)
+    started = [concurrency.acquire() for _ in range(8)]
+    for start in started:
+        concurrency.release(start, ok=False)
+    assert concurrency.limit == 4 and concurrency.decreases == 1
+    concurrency.release(concurrency.acquire(), ok=False)
+    assert concurrency.limit == 2
+
+
+def test_acquire_async_waits_for_release():
+    concurrency = AdaptiveConcurrency(initial=1)
+
+    async def main():
+        started = await concurrency.acquire_async()
+        waiting = asyncio.ensure_future(concurrency.acquire_async())
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+        concurrency.release(started, ok=True)
+        concurrency.release(await waiting, ok=True)
+
+    asyncio.run(main())
+    assert concurrency.in_flight == 0
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(initial=8, max_limit=4)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(backoff=1)
@@ -0,0 +1,46 @@
+import asyncio
+
+from soundcloud import ClientContext, MemoryCache, SoundCloud
+
+
+def test_context_shared():
+    context = ClientContext("client_id", cache=MemoryCache())
+    first = SoundCloud(auth_token="first", context=context)
+    second = SoundCloud(auth_token="second", context=context)
+    assert first.session is second.session
+    assert first.cache is second.cache
+    assert first.auth_token != second.auth_token
+    # a renewed client ID is used by all clients
+    context.client_id = "renewed"
+    assert first.client_id == second.client_id == "renewed"
+    # the shared session stays open for the other clients
+    first.close()
+    assert second.session is context.session
+
+
+def test_owned_context_closed():
+    sc = SoundCloud("client_id")
+    assert sc.session is sc.context.session
+    sc.close()
+    assert sc.context._session is None
+
+
+def test_async_session_limits():
+    async def limits():
+        context = ClientContext("client_id", pool_connections=4, pool_maxsize=5)
+        connector = context.async_session.connector
+        await context.close_async()
+        return connector.limit, connector.limit_per_host
+
+    assert asyncio.run(limits()) == (20, 5)
+
+
+def test_context_cache_scoped(client: SoundCloud):
+    cache = MemoryCache()
+    context = ClientContext(client.client_id, cache=cache)
+    anonymous = SoundCloud(context=context)
+    user = SoundCloud(auth_token=client.auth_token, context=context)
+    assert anonymous.get_track(1032303631) is not None
+    assert user.get_track(1032303631) is not None
+    # the response to the authenticated request is cached apart
+    assert len(cache._entries) == 2
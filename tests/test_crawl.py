@@ -0,0 +1,132 @@
+import csv
+import shutil
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from soundcloud import (
+    BloomFilter,
+    Crawler,
+    CSVSink,
+    EdgeSink,
+    Frontier,
+    IntSet,
+    MemoryFrontier,
+    MemorySink,
+    Node,
+    SoundCloud,
+    SQLiteFrontier,
+)
+
+
+class FakeClient:
+    # user i follows users 2i and 2i + 1, up to user 15
+    def get_user_following(self, user_id, **kwargs):
+        return (SimpleNamespace(id=i) for i in (2 * user_id, 2 * user_id + 1) if i < 16)
+
+
+def test_int_set():
+    keys = IntSet(capacity=4)
+    assert all(keys.add(i * 7) for i in range(1000))
+    assert not keys.add(7)
+    assert len(keys) == 1000
+    assert 700 in keys and 701 not in keys
+
+
+def test_bloom_filter():
+    keys = BloomFilter(1000, error_rate=0.01)
+    for i in range(1000):
+        keys.add(i)
+    assert all(i in keys for i in range(1000))
+    assert sum(i in keys for i in range(1000, 11000)) < 300
+
+
+def test_memory_frontier_checkpoint(tmp_path):
+    path = str(tmp_path / "frontier.pkl")
+    frontier = MemoryFrontier(path=path)
+    frontier.push([Node("user", 1, 1), Node("user", 2, 0), Node("user", 3, 1, -1)])
+    assert frontier.push([Node("user", 2, 2)]) == 0
+    assert frontier.pop() == Node("user", 3, 1, -1)
+    frontier.checkpoint()
+    # the claimed node is queued again when resuming
+    resumed = MemoryFrontier(path=path)
+    assert [resumed.pop().id for _ in range(3)] == [3, 2, 1]
+    assert resumed.pop() is None and not resumed.idle()
+
+
+def test_sqlite_frontier_shared(tmp_path):
+    path = str(tmp_path / "frontier.db")
+    first, second = SQLiteFrontier(path), SQLiteFrontier(path, lease=0)
+    assert first.push([Node("user", 1), Node("track", 1)], max_nodes=3) == 2
+    assert second.push([Node("user", 1), Node("user", 2), Node("user", 3)], 3) == 1
+    node = first.pop()
+    assert node == Node("user", 1)
+    # a claim which outlived the lease is claimed again
+    assert second.pop() == node
+    second.done(node)
+    rest = {first.pop(), first.pop()}
+    assert rest == {Node("track", 1), Node("user", 2)}
+    assert first.pop() is None and not second.idle()
+    for node in rest:
+        first.done(node)
+    assert second.idle()
+    first.close()
+    second.close()
+
+
+def test_sqlite_frontier_checkpoint(tmp_path):
+    path = str(tmp_path / "frontier.db")
+    frontier = SQLiteFrontier(path)
+    frontier.push([Node("user", 1), Node("user", 2)])
+    frontier.checkpoint()
+    # the commits were moved from the WAL to the database file
+    shutil.copy(path, str(tmp_path / "copy.db"))
+    copy = sqlite3.connect(str(tmp_path / "copy.db"))
+    assert copy.execute("SELECT COUNT(*) FROM nodes").fetchone() == (2,)
+    copy.close()
+    frontier.close()
+
+
+def test_incomplete_frontier_and_sink():
+    class StackFrontier(Frontier):
+        def push(self, nodes, max_nodes=None):
+            return 0
+
+    class NullSink(EdgeSink):
+        pass
+
+    with pytest.raises(TypeError):
+        StackFrontier()  # type: ignore[abstract]
+    with pytest.raises(TypeError):
+        NullSink()  # type: ignore[abstract]
+
+
+def test_crawler():
+    sink = MemorySink()
+    crawler = Crawler(FakeClient(), relations=("following",), sink=sink, max_depth=2)
+    stats = crawler.run([("user", 1)])
+    assert stats.nodes == 7 and stats.edges == 14
+    assert {edge.target for edge in sink.edges} == set(range(2, 16))
+
+
+def test_csv_sink(tmp_path):
+    path = tmp_path / "edges.csv"
+    crawler = Crawler(
+        FakeClient(), relations=("following",), sink=CSVSink(str(path)), max_depth=1
+    )
+    crawler.run([("user", 1)])
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    # users 1 to 3 follow users 2 to 7
+    assert sorted(rows) == [["following", str(i // 2), str(i)] for i in range(2, 8)]
+
+
+def test_crawler_followers(client: SoundCloud):
+    sink = MemorySink()
+    crawler = Crawler(
+        client, relations=("followers",), sink=sink, max_nodes=4, max_edges=3
+    )
+    stats = crawler.run([("user", 992430331)])
+    assert stats.nodes == 4 and stats.errors == 0
+    assert len(sink.edges) == stats.edges
@@ -0,0 +1,235 @@
+import dataclasses
+import datetime
+import pickle
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, List, Optional, Union
+
+import dateutil.parser
+import pytest
+from dacite import from_dict
+from dacite.exceptions import UnionMatchError
+
+from soundcloud import BasicTrack, DecoderConfig, IdentityMap, SoundCloud, User
+from soundcloud.resource.base import BaseData, parse_datetime
+from soundcloud.resource.decoder import (
+    _decoders,
+    by_key,
+    get_decoder,
+    get_union_decoder,
+    register_discriminator,
+)
+from soundcloud.resource.playlist import BasicAlbumPlaylist
+from soundcloud.resource.slots import slotted
+from soundcloud.resource.view import view_class
+
+
+def _get_json(client: SoundCloud, path: str) -> dict:
+    r = client.session.get(
+        f"https://api-v2.soundcloud.com{path}",
+        params={"client_id": client.client_id},
+        headers=client._get_default_headers(),
+    )
+    r.raise_for_status()
+    return r.json()
+
+
+def test_compiled_decoder_matches_dacite(client: SoundCloud):
+    for cls, path in (
+        (BasicTrack, "/tracks/1032303631"),
+        (User, "/users/790976431"),
+        (BasicAlbumPlaylist, "/playlists/1326192094"),
+    ):
+        data = _get_json(client, path)
+        expected = from_dict(cls, data, BaseData.dacite_config)
+        assert cls.from_dict(data) == expected
+        assert cls.from_dict(data, DecoderConfig(trusted=True)) == expected
+
+
+def test_trusted_client(client: SoundCloud):
+    trusted = SoundCloud(
+        client.client_id, client.auth_token, decoder_config=DecoderConfig(trusted=True)
+    )
+    assert trusted.get_track(1032303631) == client.get_track(1032303631)
+
+
+def test_parse_datetime():
+    for timestamp in (
+        "2021-03-04T05:06:07Z",
+        "2021-03-04T05:06:07.123Z",
+        "2021-03-04T05:06:07+02:00",
+    ):
+        parsed = parse_datetime(timestamp)
+        assert parsed == dateutil.parser.isoparse(timestamp)
+        assert parsed.tzinfo == dateutil.parser.isoparse(timestamp).tzinfo
+
+
+def test_lazy_datetimes(client: SoundCloud):
+    lazy = SoundCloud(
+        client.client_id,
+        client.auth_token,
+        decoder_config=DecoderConfig(lazy_datetimes=True),
+    )
+    track = lazy.get_track(1032303631)
+    assert track
+    assert isinstance(track.__dict__["created_at"], str)
+    assert isinstance(track.created_at, datetime.datetime)
+    assert track == client.get_track(1032303631)
+
+
+@dataclasses.dataclass
+class _Stamped(BaseData):
+    id: int
+    created_at: datetime.datetime
+
+
+def test_lazy_datetimes_leave_classes_untouched():
+    data = {"id": 1, "created_at": "2020-01-01T00:00:00Z"}
+    stamped = get_decoder(_Stamped, DecoderConfig(lazy_datetimes=True))(data)
+    assert isinstance(stamped, _Stamped) and type(stamped) is not _Stamped
+    assert isinstance(stamped.__dict__["created_at"], str)
+    # only the variant parses lazily
+    assert "created_at" not in vars(_Stamped)
+    eager = get_decoder(_Stamped)(data)
+    assert stamped == eager and eager == stamped
+    assert type(pickle.loads(pickle.dumps(stamped))) is _Stamped
+
+
+def test_identity_map(client: SoundCloud):
+    shared = SoundCloud(client.client_id, client.auth_token, identity_map=IdentityMap())
+    assert shared.get_track(1032303631) is shared.get_track(1032303631)
+    assert shared.get_user(790976431) is shared.get_user(790976431)
+    assert client.get_user(790976431) is not client.get_user(790976431)
+
+
+def test_intern_strings(client: SoundCloud):
+    interning = SoundCloud(
+        client.client_id,
+        client.auth_token,
+        decoder_config=DecoderConfig(intern_strings=True),
+    )
+    first = interning.get_track(1032303631)
+    second = interning.get_track(1032303631)
+    assert first and second
+    assert first.kind is second.kind
+    assert first.sharing is second.sharing
+    assert first == client.get_track(1032303631)
+
+
+def test_slots(client: SoundCloud):
+    slots = SoundCloud(
+        client.client_id,
+        client.auth_token,
+        decoder_config=DecoderConfig(slots=True),
+    )
+    track = slots.get_track(1032303631)
+    expected = client.get_track(1032303631)
+    assert expected
+    assert isinstance(track, slotted(BasicTrack))
+    assert not hasattr(track, "__dict__")
+    assert not hasattr(track.user, "__dict__")
+    assert dataclasses.asdict(track) == dataclasses.asdict(expected)
+    assert pickle.loads(pickle.dumps(track)) == track
+
+
+def test_views(client: SoundCloud):
+    views = SoundCloud(
+        client.client_id,
+        client.auth_token,
+        decoder_config=DecoderConfig(output="view"),
+    )
+    track = views.get_track(1032303631)
+    expected = client.get_track(1032303631)
+    assert isinstance(track, view_class(BasicTrack))
+    assert expected
+    assert track.title == expected.title
+    assert track.created_at == expected.created_at
+    assert track.user.username == expected.user.username
+    assert track.to_resource() == expected
+
+
+def test_raw(client: SoundCloud):
+    followers = client.get_user_followers(
+        992430331, decoder_config=DecoderConfig(output="raw")
+    )
+    follower = next(followers)
+    assert isinstance(follower, dict)
+    assert User.from_dict(follower).username == follower["username"]
+
+
+@dataclasses.dataclass
+class _Reply(BaseData):
+    id: int
+    replies: List["_Reply"]
+    parent: Optional["_Reply"]
+
+
+def test_compile_recursive_decoder_from_threads():
+    reply = {"id": 2, "replies": [], "parent": None}
+    data = {"id": 1, "replies": [reply], "parent": None}
+    interval = sys.getswitchinterval()
+    # switch threads often, so that some decode while another compiles
+    sys.setswitchinterval(1e-6)
+    try:
+        _decode_from_threads(data)
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def _decode_from_threads(data: dict) -> None:
+    for _ in range(50):
+        for key in [key for key in _decoders if key[0] is _Reply]:
+            del _decoders[key]
+        barrier = threading.Barrier(8)
+
+        def decode(_) -> _Reply:
+            # threads compile the decoder at the same time, and must not
+            # pick up the placeholder reserved for the recursive field
+            barrier.wait()
+            return get_decoder(_Reply)(data)
+
+        with ThreadPoolExecutor(8) as executor:
+            replies = list(executor.map(decode, range(8)))
+        assert all(reply == replies[0] for reply in replies)
+        assert replies[0].replies[0].id == 2
+
+
+@dataclasses.dataclass
+class _Post(BaseData):
+    id: int
+    post: str
+    decoded: ClassVar[int] = 0
+
+    def __post_init__(self) -> None:
+        _Post.decoded += 1
+        if self.post == "invalid":
+            raise ValueError(self.post)
+
+
+@dataclasses.dataclass
+class _Repost(BaseData):
+    id: int
+    repost: str
+
+
+_Entry = Union[_Post, _Repost]
+register_discriminator(_Entry, by_key({"post": _Post, "repost": _Repost}))
+
+
+def test_union_decoder():
+    decode = get_union_decoder(_Entry)
+    assert decode({"id": 1, "post": "a"}) == _Post(1, "a")
+    assert decode({"id": 1, "repost": "a"}) == _Repost(1, "a")
+    _Post.decoded = 0
+    with pytest.raises(UnionMatchError) as e:
+        decode({"id": 1, "post": 2})
+    # the picked member tells why, and isn't decoded again
+    assert e.value.__cause__ is not None
+    assert _Post.decoded == 0
+    with pytest.raises(UnionMatchError):
+        decode([1])
+    # errors other than decoding ones aren't swallowed
+    with pytest.raises(ValueError):
+        decode({"id": 1, "post": "invalid"})
+    assert _Post.decoded == 1
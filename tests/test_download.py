@@ -0,0 +1,233 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Iterator, cast
+
+import pytest
+import requests
+
+from soundcloud import (
+    AdaptiveConcurrency,
+    AsyncSoundCloud,
+    DownloadError,
+    RetryPolicy,
+    SoundCloud,
+    select_transcoding,
+)
+from soundcloud.download import (
+    _download,
+    _Part,
+    _playlist_parts,
+    _stream,
+    _stream_async,
+)
+from soundcloud.resource.track import BaseTrack, Transcoding
+
+
+def _transcoding(
+    url: str, protocol: str, mime_type: str = "audio/mpeg", quality: str = "sq"
+) -> Transcoding:
+    return Transcoding.from_dict(
+        {
+            "url": url,
+            "preset": "mp3_1_0",
+            "duration": 1000,
+            "snipped": False,
+            "format": {"protocol": protocol, "mime_type": mime_type},
+            "quality": quality,
+        }
+    )
+
+
+def test_select_transcoding():
+    transcodings = [
+        _transcoding("a", "hls", 'audio/ogg; codecs="opus"'),
+        _transcoding("b", "hls"),
+        _transcoding("c", "progressive"),
+        _transcoding("d", "ctr-encrypted-hls", quality="hq"),
+    ]
+    preferred = select_transcoding(transcodings)
+    assert preferred and preferred.url == "c"
+    hls = select_transcoding(transcodings, protocols=("hls",))
+    assert hls and hls.url == "a"
+    mp3 = select_transcoding(transcodings, ("hls",), mime_types=("audio/mpeg",))
+    assert mp3 and mp3.url == "b"
+    assert select_transcoding(transcodings, protocols=("ctr-encrypted-hls",)) is None
+
+
+def test_playlist_parts():
+    playlist = "\n".join(
+        [
+            "#EXTM3U",
+            '#EXT-X-MAP:URI="init.mp4",BYTERANGE="100@0"',
+            "#EXTINF:10.0,",
+            "#EXT-X-BYTERANGE:500@100",
+            "media.mp4",
+            "#EXTINF:10.0,",
+            "#EXT-X-BYTERANGE:300",
+            "media.mp4",
+            "#EXTINF:10.0,",
+            "https://cdn.example.com/last.mp3",
+            "#EXT-X-ENDLIST",
+        ]
+    )
+    assert _playlist_parts(playlist, "https://example.com/a/playlist.m3u8") == [
+        _Part("https://example.com/a/init.mp4", 0, 100),
+        _Part("https://example.com/a/media.mp4", 100, 500),
+        _Part("https://example.com/a/media.mp4", 600, 300),
+        _Part("https://cdn.example.com/last.mp3", None, None),
+    ]
+    with pytest.raises(DownloadError):
+        _playlist_parts(playlist.replace("#EXT-X-ENDLIST", ""), "https://example.com")
+    with pytest.raises(DownloadError):
+        _playlist_parts("#EXTM3U\n#EXT-X-ENDLIST", "https://example.com")
+    with pytest.raises(DownloadError):
+        _playlist_parts(
+            playlist.replace("#EXTM3U", '#EXTM3U\n#EXT-X-KEY:METHOD=AES-128,URI="k"'),
+            "https://example.com",
+        )
+
+
+@pytest.fixture
+def media_server() -> Iterator[SimpleNamespace]:
+    """
+    Stand-in for the stream URL exchange and the CDN of an HLS transcoding
+    """
+    segments = [bytes([i]) * (1000 + i) for i in range(20)]
+    state = SimpleNamespace(segments=segments, failing=set(), requests=[], url="")
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_HEAD(self) -> None:
+            self.do_GET()
+
+        def do_GET(self) -> None:
+            path = self.path.split("?")[0]
+            state.requests.append((self.command, path))
+            status, body = 404, b""
+            if path == "/stream/hls":
+                status = 200
+                body = json.dumps({"url": f"{state.url}/cdn/playlist.m3u8"}).encode()
+            elif path == "/cdn/playlist.m3u8":
+                status = 200
+                body = "\n".join(
+                    ["#EXTM3U"]
+                    + [f"#EXTINF:1.0,\nsegment/{i}" for i in range(len(state.segments))]
+                    + ["#EXT-X-ENDLIST"]
+                ).encode()
+            elif path.startswith("/cdn/segment/"):
+                i = int(path.rsplit("/", 1)[1])
+                if i not in state.failing:
+                    status, body = 200, state.segments[i]
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command == "GET":
+                self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_resume(media_server: SimpleNamespace, tmp_path):
+    client = SoundCloud("client_id", retry_policy=RetryPolicy(max_retries=0))
+    transcoding = _transcoding(f"{media_server.url}/stream/hls", "hls")
+    track = cast(BaseTrack, SimpleNamespace(id=1, track_authorization="auth"))
+    path = str(tmp_path / "track.mp3")
+    expected = b"".join(media_server.segments)
+
+    media_server.failing.add(15)
+    with pytest.raises(requests.HTTPError):
+        _download(client, track, path, transcoding, 4, 1 << 20, True, True)
+    assert (tmp_path / "track.mp3.part").exists()
+
+    media_server.failing.clear()
+    media_server.requests.clear()
+    result = _download(client, track, path, transcoding, 4, 1 << 20, True, True)
+    assert result.size == len(expected) and result.parts == 20
+    # the segments written before the failure are kept
+    fetched = [
+        request_path
+        for method, request_path in media_server.requests
+        if method == "GET" and request_path.startswith("/cdn/segment/")
+    ]
+    assert result.resumed_parts >= 15 and len(fetched) == 20 - result.resumed_parts
+    with open(path, "rb") as f:
+        assert f.read() == expected
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["track.mp3"]
+
+
+def test_stream_read_ahead(media_server: SimpleNamespace):
+    client = SoundCloud("client_id")
+    transcoding = _transcoding(f"{media_server.url}/stream/hls", "hls")
+    track = cast(BaseTrack, SimpleNamespace(id=1, track_authorization="auth"))
+    chunks = []
+    for chunk in _stream(client, track, transcoding, 3, 1 << 20):
+        chunks.append(chunk)
+        # segments are requested at most 3 ahead of the ones consumed
+        requested = [
+            request_path
+            for _, request_path in media_server.requests
+            if request_path.startswith("/cdn/segment/")
+        ]
+        assert len(requested) <= len(chunks) + 2
+    assert chunks == media_server.segments
+
+
+def test_stream_single_segment(media_server: SimpleNamespace):
+    media_server.segments = media_server.segments[:1]
+    transcoding = _transcoding(f"{media_server.url}/stream/hls", "hls")
+    track = cast(BaseTrack, SimpleNamespace(id=1, track_authorization="auth"))
+    client = SoundCloud("client_id")
+    # the segment is read as it arrives, not the playlist
+    assert (
+        b"".join(_stream(client, track, transcoding, 3, 1 << 20))
+        == (media_server.segments[0])
+    )
+
+    async def stream_async() -> bytes:
+        async with AsyncSoundCloud("client_id") as async_client:
+            chunks = _stream_async(async_client, track, transcoding, 3, 1 << 20)
+            return b"".join([chunk async for chunk in chunks])
+
+    assert asyncio.run(stream_async()) == media_server.segments[0]
+
+
+def test_stream_not_concurrency_limited(media_server: SimpleNamespace):
+    class Counting(AdaptiveConcurrency):
+        acquired = 0
+
+        def acquire(self) -> float:
+            self.acquired += 1
+            return super().acquire()
+
+    limiter = Counting(initial=1, max_limit=1)
+    client = SoundCloud("client_id", concurrency_limiter=limiter)
+    transcoding = _transcoding(f"{media_server.url}/stream/hls", "hls")
+    track = cast(BaseTrack, SimpleNamespace(id=1, track_authorization="auth"))
+    chunks = list(_stream(client, track, transcoding, 3, 1 << 20))
+    assert chunks == media_server.segments
+    # only the stream URL is requested from the API, the playlist and
+    # segments are read from the CDN past the limiter
+    assert limiter.acquired == 1 and limiter.in_flight == 0
+
+
+def test_get_stream_url(client: SoundCloud):
+    url = client.get_stream_url(1032303631)
+    assert url and url.startswith("https://")
+
+
+def test_stream_track_audio(client: SoundCloud):
+    chunks = client.stream_track_audio(1032303631, read_ahead=2)
+    assert next(chunks)
+    chunks.close()
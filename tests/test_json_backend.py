@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from soundcloud import JSONBackend, SoundCloud, get_json_backend
+from soundcloud.json_backend import CollectionParser
+
+
+def test_get_json_backend():
+    assert get_json_backend("json").loads(b'{"id": 1}') == {"id": 1}
+    backend = JSONBackend("custom", lambda body: {})
+    assert get_json_backend(backend) is backend
+    with pytest.raises(ValueError):
+        get_json_backend("yaml")
+
+
+def test_client_json_backend(client: SoundCloud):
+    stdlib_client = SoundCloud(client_id=client.client_id, json_backend="json")
+    assert stdlib_client.json_backend.name == "json"
+    assert stdlib_client.get_track(1032303631) == client.get_track(1032303631)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_collection_parser(chunk_size: int):
+    collection = [{"id": 1, "title": 'a \\" ]}'}, 2.5e-3, None, [], "é"]
+    page = {"total": 10, "collection": collection, "next_href": None}
+    body = json.dumps(page, ensure_ascii=False).encode()
+    parser = CollectionParser()
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items += parser.feed(body[i : i + chunk_size])
+    assert items == collection
+    assert parser.close() == {"total": 10, "next_href": None}
+
+
+def test_collection_parser_incomplete():
+    parser = CollectionParser()
+    assert parser.feed(b'{"collection": [{"id": 1}, {"id"') == [{"id": 1}]
+    with pytest.raises(ValueError):
+        parser.close()
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator
+from urllib.parse import parse_qs, urlparse
+
+import aiohttp
+import pytest
+import requests
+
+from soundcloud import (
+    AsyncSoundCloud,
+    BasicTrack,
+    Cursor,
+    CursorJournal,
+    DecoderConfig,
+    Paginator,
+    RetryPolicy,
+    SoundCloud,
+)
+from soundcloud.pagination import _Page
+from soundcloud.requests import CollectionRequest
+
+
+def _pages(url, params):
+    # three pages of two resources, offsets in the query parameters
+    offset = int(params.get("offset", ["0"])[0])
+    for start in range(offset, 6, 2):
+        yield _Page(url, {"offset": start}, [start, start + 1], {"next": start + 2})
+
+
+def _paginator(start, journal=None):
+    def next_page(data):
+        if data["next"] >= 6:
+            return None, {}
+        return "url", {"offset": data["next"]}
+
+    return Paginator(_pages(start.url, start.params), str, next_page, start, journal)
+
+
+def test_cursor_dict():
+    cursor = Cursor("url", {"offset": ["10"], "limit": ["5"]}, 3)
+    assert Cursor.from_dict(cursor.to_dict()) == cursor
+    assert not cursor.done
+    assert Cursor(None).done
+
+
+def test_cursor_journal(tmp_path):
+    path = tmp_path / "cursor.json"
+    journal = CursorJournal(str(path))
+    assert journal.load() is None
+    journal.save(Cursor("url", {"offset": ["10"]}))
+    assert journal.load() == Cursor("url", {"offset": ["10"]})
+    path.write_text("[]")
+    with pytest.raises(ValueError):
+        journal.load()
+
+
+def test_paginator_resume(tmp_path):
+    journal = CursorJournal(str(tmp_path / "cursor.json"))
+    pager = _paginator(Cursor("url"), journal)
+    assert [next(pager) for _ in range(3)] == ["0", "1", "2"]
+    # checkpointed when the first page was finished
+    assert journal.load() == Cursor("url", {"offset": ["2"]})
+    assert pager.cursor == Cursor("url", {"offset": ["2"]}, 1)
+    pager.close()
+    # resuming from the cursor skips what was already yielded
+    assert list(_paginator(pager.cursor)) == ["3", "4", "5"]
+    # resuming from the journal fetches the unfinished page again
+    pager = _paginator(journal.load(), journal)
+    assert list(pager) == ["2", "3", "4", "5"]
+    assert pager.cursor.done and journal.load().done
+
+
+@pytest.fixture
+def collection_server() -> Iterator[SimpleNamespace]:
+    """
+    Serves a collection of ten integers in pages of two, paginated by offset.
+    Pages at the offsets in failing are answered with 500, and those in
+    flaky once.
+    """
+    state = SimpleNamespace(failing=set(), flaky=set(), url="")
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            offset = int(parse_qs(urlparse(self.path).query).get("offset", ["0"])[0])
+            status, body = 500, b""
+            if offset in state.flaky:
+                state.flaky.discard(offset)
+            elif offset not in state.failing:
+                status = 200
+                page: Dict[str, Any] = {
+                    "collection": list(range(offset, min(offset + 2, 10))),
+                    "next_href": None,
+                    "total_results": 10,
+                }
+                if offset + 2 < 10:
+                    page["next_href"] = f"{state.url}/items?offset={offset + 2}&limit=2"
+                body = json.dumps(page).encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_fan_out_error(collection_server: SimpleNamespace):
+    # pages are fetched raw, the resources are never decoded
+    request = CollectionRequest[BasicTrack]("/items", BasicTrack)
+    url = f"{collection_server.url}/items"
+    client = SoundCloud("client_id", retry_policy=RetryPolicy(max_retries=0))
+    pages = request._fan_out(client, url, {"limit": ["2"]}, {}, None, None, 4)
+    assert [item for page in pages for item in page.collection] == list(range(10))
+
+    # a page failing in the middle isn't taken for the end of the collection
+    collection_server.failing.add(4)
+    pages = request._fan_out(client, url, {"limit": ["2"]}, {}, None, None, 4)
+    assert next(pages).collection == [0, 1]
+    assert next(pages).collection == [2, 3]
+    with pytest.raises(requests.HTTPError):
+        next(pages)
+
+    async def fan_out_async() -> list:
+        async with AsyncSoundCloud(
+            "client_id", retry_policy=RetryPolicy(max_retries=0)
+        ) as async_client:
+            pages = request._fan_out_async(
+                async_client, url, {"limit": ["2"]}, {}, None, None, 4
+            )
+            return [page.collection async for page in pages]
+
+    with pytest.raises(aiohttp.ClientResponseError) as e:
+        asyncio.run(fan_out_async())
+    assert e.value.status == 500
+
+
+def test_page_retried(collection_server: SimpleNamespace):
+    request = CollectionRequest[BasicTrack]("/items", BasicTrack)
+    request.base = collection_server.url
+    client = SoundCloud("client_id", retry_policy=RetryPolicy(backoff=0))
+    raw = DecoderConfig(output="raw")
+    for options in ({}, {"concurrency": 3}, {"stream": True}):
+        # the first page and one after it fail once
+        collection_server.flaky.update({0, 4})
+        items = request(client, decoder_config=raw, limit=2, **options)
+        assert list(items) == list(range(10))
+    assert client.retry_stats.reasons == {"500": 6}
+
+    async def items_async() -> list:
+        async with AsyncSoundCloud(
+            "client_id", retry_policy=RetryPolicy(backoff=0)
+        ) as async_client:
+            items = request.iter_async(async_client, decoder_config=raw, limit=2)
+            return [item async for item in items]
+
+    collection_server.flaky.update({0, 4})
+    assert asyncio.run(items_async()) == list(range(10))
+    # a first page failing for good isn't taken for a missing collection
+    collection_server.failing.add(0)
+    with pytest.raises(requests.HTTPError):
+        list(request(client, decoder_config=raw, limit=2))
+
+
+def test_get_user_followers_journal(client: SoundCloud, tmp_path):
+    journal = CursorJournal(str(tmp_path / "followers.json"))
+    pager = client.get_user_followers(992430331, limit=5, journal=journal)
+    first = [next(pager).id for _ in range(7)]
+    pager.close()
+    assert journal.load() is not None
+    resumed = client.get_user_followers(992430331, limit=5, journal=journal)
+    assert [next(resumed).id for _ in range(2)] == first[5:]
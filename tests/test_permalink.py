@@ -0,0 +1,44 @@
+from soundcloud import Permalink, PermalinkIndex, normalize_url
+from soundcloud.permalink import _permalinks
+
+
+def test_normalize_url():
+    expected = "https://soundcloud.com/forss/flickermood"
+    for url in (
+        "https://soundcloud.com/forss/flickermood",
+        " m.soundcloud.com/Forss/flickermood/ ",
+        "https://www.soundcloud.com/forss/flickermood?utm_source=x#t=1",
+    ):
+        assert normalize_url(url) == expected
+    # secret tokens are case-sensitive
+    assert (
+        normalize_url("soundcloud.com/a/b/s-AbC") == "https://soundcloud.com/a/b/s-AbC"
+    )
+
+
+def test_permalinks_nested():
+    user = {"kind": "user", "id": 1, "permalink_url": "https://soundcloud.com/a"}
+    track = {
+        "kind": "track",
+        "id": 2,
+        "permalink_url": "https://soundcloud.com/a/b",
+        "user": user,
+    }
+    found = dict(_permalinks({"collection": [{"type": "track", "track": track}]}))
+    assert found == {
+        "https://soundcloud.com/a": Permalink("user", 1),
+        "https://soundcloud.com/a/b": Permalink("track", 2),
+    }
+
+
+def test_permalink_index(tmp_path):
+    path = str(tmp_path / "permalinks.db")
+    index = PermalinkIndex(path, batch_size=2)
+    index.add("https://soundcloud.com/a", Permalink("user", 1))
+    assert index.get("soundcloud.com/A/") == Permalink("user", 1)
+    index.add("https://soundcloud.com/a/b", Permalink("track", 2))
+    # written once the batch is full, so other processes see it
+    assert PermalinkIndex(path).get_many(
+        ["https://soundcloud.com/a", "https://soundcloud.com/c"]
+    ) == {"https://soundcloud.com/a": Permalink("user", 1)}
+    index.close()
@@ -0,0 +1,32 @@
+import dataclasses
+
+import pytest
+
+from soundcloud import BasicTrack, SoundCloud
+from soundcloud.resource.projection import projection
+
+
+def test_projection_fields():
+    projected = projection(BasicTrack, ("id", "title", "user.id"))
+    assert [f.name for f in dataclasses.fields(projected)] == ["id", "title", "user"]
+    assert projection(BasicTrack, ("id", "title", "user.id")) is projected
+    with pytest.raises(ValueError):
+        projection(BasicTrack, ("user.nope",))
+
+
+def test_get_track_fields(client: SoundCloud):
+    track = client.get_track(1032303631, fields=("id", "title", "user.id"))
+    assert track is not None
+    assert track.title == "Wan Bushi - Eurodance Vibes (part 1+2+3)"
+    assert not hasattr(track, "playback_count")
+    assert not hasattr(track.user, "username")
+
+
+def test_get_tracks_fields(client: SoundCloud):
+    tracks = client.get_tracks([919105681, 1032303631], fields=("title",))
+    assert [track.id for track in tracks] == [919105681, 1032303631]
+
+
+def test_search_tracks_fields(client: SoundCloud):
+    track = next(client.search_tracks("wan bushi", fields=("id", "user.username")))
+    assert track.user.username and not hasattr(track, "title")
@@ -0,0 +1,57 @@
+import pytest
+
+from soundcloud import (
+    API_V2,
+    GRAPHQL,
+    MemoryRateLimiter,
+    Rate,
+    RateLimiter,
+    SoundCloud,
+    SQLiteRateLimiter,
+)
+
+LIMITS = {API_V2: Rate(10, burst=2)}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def limiter(request, tmp_path) -> RateLimiter:
+    if request.param == "memory":
+        return MemoryRateLimiter(LIMITS)
+    return SQLiteRateLimiter(str(tmp_path / "limits.db"), LIMITS)
+
+
+def test_rate_limiter_reserve(limiter: RateLimiter):
+    delays = [limiter.reserve(API_V2) for _ in range(4)]
+    assert delays[:2] == [0, 0]
+    # waiting requests reserve their token, so each one waits longer
+    assert 0.05 < delays[2] <= 0.1 < delays[3] <= 0.2
+    assert limiter.reserve(GRAPHQL) == 0
+
+
+def test_sqlite_rate_limiter_shared(tmp_path):
+    path = str(tmp_path / "limits.db")
+    first = SQLiteRateLimiter(path, {API_V2: Rate(10)})
+    second = SQLiteRateLimiter(path, {API_V2: Rate(10)})
+    assert first.reserve(API_V2) == 0
+    assert second.reserve(API_V2) > 0.05
+
+
+def test_rate_validation():
+    with pytest.raises(ValueError):
+        Rate(0)
+    with pytest.raises(ValueError):
+        Rate(1, burst=0.5)
+
+
+def test_incomplete_rate_limiter():
+    class NoRateLimiter(RateLimiter):
+        pass
+
+    with pytest.raises(TypeError):
+        NoRateLimiter(LIMITS)  # type: ignore[abstract]
+
+
+def test_client_rate_limiter(client: SoundCloud):
+    limiter = MemoryRateLimiter({API_V2: Rate(5)})
+    limited_client = SoundCloud(client_id=client.client_id, rate_limiter=limiter)
+    assert limited_client.get_track(1032303631) is not None
@@ -1,4 +1,11 @@
-from soundcloud import AlbumPlaylist, SoundCloud, Track, User
+from soundcloud import (
+    AlbumPlaylist,
+    Permalink,
+    PermalinkIndex,
+    SoundCloud,
+    Track,
+    User,
+)
 
 
 def test_resolve_track(client: SoundCloud):
@@ -26,3 +33,20 @@ def test_resolve_invalid_resource(client: SoundCloud):
 
 def test_resolve_invalid_url(client: SoundCloud):
     assert client.resolve("https://google.com/") is None
+
+
+def test_resolve_many(client: SoundCloud, tmp_path):
+    index = PermalinkIndex(str(tmp_path / "permalinks.db"))
+    sc = SoundCloud(client.client_id, permalink_index=index)
+    urls = [
+        "https://soundcloud.com/7x11x13/wan-bushi-eurodance-vibes-part-123",
+        "https://m.soundcloud.com/7x11x13/",
+        "https://soundcloud.com/7x11x13/invalid",
+        "https://soundcloud.com/7x11x13",
+    ]
+    track, user, missing, same_user = sc.resolve_many(urls)
+    assert track == Permalink("track", 1032303631)
+    assert user == same_user == Permalink("user", 790976431)
+    assert missing is None
+    # the user of the resolved track was indexed too
+    assert index.get(urls[3]) == user
@@ -0,0 +1,69 @@
+import email.utils
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from soundcloud import BasicTrack, RetryPolicy, RetryStats, SoundCloud
+from soundcloud.requests import Request
+
+
+def test_retry_policy_should_retry():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry(0, 503, idempotent=True)
+    assert not policy.should_retry(2, 503, idempotent=True)
+    assert not policy.should_retry(0, 404, idempotent=True)
+    assert not policy.should_retry(0, 502, idempotent=False)
+    # 500 also means not found, and is returned as None without retrying
+    assert not policy.should_retry(0, 500, idempotent=True)
+    assert policy.should_retry(0, 429, idempotent=False)
+    assert policy.should_retry(0, None, idempotent=True)
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(backoff=1, max_delay=5, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+    assert 0 <= RetryPolicy(backoff=1).delay(1) <= 2
+    assert policy.delay(0, "3") == 3
+    assert policy.delay(0, "10") is None
+    in_two_seconds = email.utils.formatdate(time.time() + 2, usegmt=True)
+    assert 0 < policy.delay(0, in_two_seconds) <= 2  # type: ignore[operator]
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+
+
+def test_internal_server_error_not_retried():
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            received.append(self.path)
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        request = Request[BasicTrack]("/tracks/{track_id}", BasicTrack)
+        request.base = f"http://127.0.0.1:{server.server_address[1]}"
+        client = SoundCloud("client_id", retry_policy=RetryPolicy(backoff=0))
+        # the API answers 500 for some missing resources
+        assert request(client, track_id=1) is None
+        assert len(received) == 1 and client.retry_stats == RetryStats()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_retry_policy(client: SoundCloud):
+    policy = RetryPolicy(max_retries=0)
+    no_retry_client = SoundCloud(client_id=client.client_id, retry_policy=policy)
+    assert no_retry_client.get_track(1032303631) is not None
+    assert no_retry_client.retry_stats == RetryStats()
@@ -1,3 +1,5 @@
+import itertools
+
 from soundcloud import AlbumPlaylist, SoundCloud, Track, User
 
 
@@ -27,3 +29,11 @@ def test_search_tracks(client: SoundCloud):
 def test_search_users(client: SoundCloud):
     user = next(client.search_users("namasenda"))
     assert isinstance(user, User) and user.permalink == "namasenda"
+
+
+def test_search_tracks_concurrent(client: SoundCloud):
+    expected = list(itertools.islice(client.search_tracks("34+35", limit=20), 100))
+    tracks = client.search_tracks("34+35", limit=20, concurrency=4)
+    actual = list(itertools.islice(tracks, 100))
+    tracks.close()
+    assert [t.id for t in actual] == [t.id for t in expected]
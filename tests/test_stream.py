@@ -1,6 +1,12 @@
 import itertools
 
-from soundcloud import SoundCloud, TrackStreamItem
+from soundcloud import (
+    PlaylistStreamItem,
+    PlaylistStreamRepostItem,
+    SoundCloud,
+    TrackStreamItem,
+    TrackStreamRepostItem,
+)
 
 
 def test_my_history(client: SoundCloud):
@@ -34,3 +40,14 @@ def test_tag_stream(client: SoundCloud):
     stream = client.get_tag_tracks_recent("Electronic")
     for track in itertools.islice(stream, 3):
         assert track is not None
+
+
+def test_my_stream_item_types(client: SoundCloud):
+    types = {
+        "track": TrackStreamItem,
+        "track-repost": TrackStreamRepostItem,
+        "playlist": PlaylistStreamItem,
+        "playlist-repost": PlaylistStreamRepostItem,
+    }
+    for item in itertools.islice(client.get_my_stream(), 20):
+        assert type(item) is types[item.type]
@@ -17,6 +17,13 @@ def test_get_tracks(client: SoundCloud):
     assert 1032303631 in ids and 919105681 in ids
 
 
+def test_get_tracks_chunked(client: SoundCloud):
+    track_ids = [1032303631, 919105681, 0, 1032303631]
+    tracks = client.get_tracks(track_ids, chunk_size=1)
+    assert [track.id for track in tracks] == [1032303631, 919105681]
+    assert tracks.missing_ids == [0]
+
+
 def test_track_albums(client: SoundCloud):
     album = next(client.get_track_albums(919105681))
     assert album.user.username == "Ariana Grande"
@@ -52,6 +52,14 @@ def test_user_followers(client: SoundCloud):
     assert found
 
 
+def test_user_followers_prefetch(client: SoundCloud):
+    expected = list(itertools.islice(client.get_user_followers(992430331), 50))
+    followers = client.get_user_followers(992430331, limit=10, prefetch=2)
+    actual = list(itertools.islice(followers, 50))
+    followers.close()
+    assert [u.id for u in actual] == [u.id for u in expected]
+
+
 def test_user_followings(client: SoundCloud):
     following = next(client.get_user_following(992430331))
     assert following.permalink == "7x11x13"
@@ -68,6 +76,14 @@ def test_user_likes_2(client: SoundCloud):
         assert like is not None
 
 
+def test_user_likes_stream(client: SoundCloud):
+    expected = list(itertools.islice(client.get_user_likes(790976431, limit=5), 12))
+    likes = client.get_user_likes(790976431, limit=5, stream=True)
+    actual = list(itertools.islice(likes, 12))
+    likes.close()
+    assert actual == expected
+
+
 def test_user_reposts(client: SoundCloud):
     repost = next(client.get_user_reposts(992430331))
     assert isinstance(repost, TrackStreamRepostItem)